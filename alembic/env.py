@@ -23,9 +23,13 @@ from app.core.config import settings
 from app.models.user import User
 from app.models.client import Client
 from app.models.template import WorkoutPlanTemplate, DietPlanTemplate
-from app.models.plan import AssignedWorkoutPlan, AssignedDietPlan
+from app.models.plan import AssignedWorkoutPlan, AssignedDietPlan, PlanSnapshot
 from app.models.log import WorkoutLog, DietLog, Checkin
 from app.models.activity import ActivityFeed
+from app.models.streak import ClientStreak
+from app.models.trainer_stats import TrainerStats
+from app.models.checkin_rollup import CheckinRollup
+from app.models.refresh_token import RefreshToken
 
 
 # This is the Alembic Config object, which provides
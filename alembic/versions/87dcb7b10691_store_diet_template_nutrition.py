@@ -0,0 +1,108 @@
+"""store diet template nutrition
+
+Revision ID: 87dcb7b10691
+Revises: fdcdb1765cbd
+Create Date: 2026-10-17 13:41:05.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '87dcb7b10691'
+down_revision: Union[str, Sequence[str], None] = 'fdcdb1765cbd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Copy of app.core.units.UNIT_DICTIONARY as of this revision: (unit, type, factor to g / ml).
+UNITS = [
+    ('grams', 'MASS', 1.0), ('g', 'MASS', 1.0), ('kg', 'MASS', 1000.0),
+    ('oz', 'MASS', 28.35), ('lb', 'MASS', 453.592),
+    ('ml', 'VOLUME', 1.0), ('liter', 'VOLUME', 1000.0), ('fl oz', 'VOLUME', 29.5735),
+    ('cup', 'VOLUME', 236.588), ('tbsp', 'VOLUME', 14.787), ('tsp', 'VOLUME', 4.929),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('diet_template_items', sa.Column('calories', sa.Float(), nullable=True))
+    op.add_column('diet_template_items', sa.Column('protein_g', sa.Float(), nullable=True))
+    op.add_column('diet_template_items', sa.Column('carbs_g', sa.Float(), nullable=True))
+    op.add_column('diet_template_items', sa.Column('fat_g', sa.Float(), nullable=True))
+    op.add_column('diet_plan_templates', sa.Column('nutrition_totals', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+
+    # Backfill items with the same arithmetic as calculate_nutrition (unknown units
+    # and volume servings of mass-only foods count as zero).
+    units = ", ".join(f"('{unit}', '{unit_type}', {factor})" for unit, unit_type, factor in UNITS)
+    op.execute(f"""
+        WITH units(unit, unit_type, factor) AS (VALUES {units}),
+        computed AS (
+            SELECT i.id,
+                   CASE
+                       WHEN u.unit_type = 'MASS' THEN COALESCE(i.serving_size, 0) * u.factor
+                       WHEN u.unit_type = 'VOLUME' AND f.base_unit_type = 'VOLUME' AND COALESCE(f.grams_per_ml, 0) <> 0
+                           THEN COALESCE(i.serving_size, 0) * u.factor * f.grams_per_ml
+                       ELSE 0
+                   END / 100.0 AS multiplier,
+                   f.calories_per_100g, f.protein_per_100g, f.carbs_per_100g, f.fat_per_100g
+            FROM diet_template_items i
+            JOIN food_item_library f ON f.id = i.food_item_id
+            LEFT JOIN units u ON u.unit = lower(COALESCE(i.serving_unit, 'g'))
+        )
+        UPDATE diet_template_items t
+        SET calories = COALESCE(c.calories_per_100g, 0) * c.multiplier,
+            protein_g = COALESCE(c.protein_per_100g, 0) * c.multiplier,
+            carbs_g = COALESCE(c.carbs_per_100g, 0) * c.multiplier,
+            fat_g = COALESCE(c.fat_per_100g, 0) * c.multiplier
+        FROM computed c
+        WHERE c.id = t.id
+    """)
+
+    # Per-meal and per-template totals, meals in first-seen (item id) order.
+    op.execute("""
+        WITH meals AS (
+            SELECT template_id, meal_name, MIN(id) AS first_id,
+                   SUM(calories) AS calories, SUM(protein_g) AS protein_g,
+                   SUM(carbs_g) AS carbs_g, SUM(fat_g) AS fat_g
+            FROM diet_template_items
+            GROUP BY template_id, meal_name
+        ),
+        totals AS (
+            SELECT template_id,
+                   jsonb_build_object(
+                       'meals', jsonb_agg(jsonb_build_object(
+                           'meal_name', meal_name, 'calories', calories, 'protein_g', protein_g,
+                           'carbs_g', carbs_g, 'fat_g', fat_g
+                       ) ORDER BY first_id),
+                       'total', jsonb_build_object(
+                           'calories', SUM(calories), 'protein_g', SUM(protein_g),
+                           'carbs_g', SUM(carbs_g), 'fat_g', SUM(fat_g)
+                       )
+                   ) AS nutrition_totals
+            FROM meals
+            GROUP BY template_id
+        )
+        UPDATE diet_plan_templates t
+        SET nutrition_totals = totals.nutrition_totals
+        FROM totals
+        WHERE totals.template_id = t.id
+    """)
+    op.execute("""
+        UPDATE diet_plan_templates
+        SET nutrition_totals = '{"meals": [], "total": {"calories": 0, "protein_g": 0, "carbs_g": 0, "fat_g": 0}}'
+        WHERE nutrition_totals IS NULL
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('diet_plan_templates', 'nutrition_totals')
+    op.drop_column('diet_template_items', 'fat_g')
+    op.drop_column('diet_template_items', 'carbs_g')
+    op.drop_column('diet_template_items', 'protein_g')
+    op.drop_column('diet_template_items', 'calories')
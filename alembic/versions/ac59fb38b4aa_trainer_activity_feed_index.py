@@ -0,0 +1,35 @@
+"""trainer activity feed index
+
+Revision ID: ac59fb38b4aa
+Revises: ee4ea93fbf74
+Create Date: 2026-10-17 21:14:36.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ac59fb38b4aa'
+down_revision: Union[str, Sequence[str], None] = 'ee4ea93fbf74'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # GET /trainers/me/activity-feed?event_type=... runs one LATERAL keyset scan per
+    # (client, event type); unfiltered it uses activity_feed_client_id_event_timestamp_id_desc_idx.
+    op.create_index(
+        'activity_feed_client_id_event_type_event_timestamp_id_desc_idx',
+        'activity_feed',
+        ['client_id', 'event_type', sa.literal_column('event_timestamp DESC'), sa.literal_column('id DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('activity_feed_client_id_event_type_event_timestamp_id_desc_idx', table_name='activity_feed')
@@ -0,0 +1,64 @@
+"""add client_streaks table
+
+Revision ID: b250170f8f2c
+Revises: a6d5d05072a3
+Create Date: 2026-10-17 09:12:41.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b250170f8f2c'
+down_revision: Union[str, Sequence[str], None] = 'a6d5d05072a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('client_streaks',
+    sa.Column('client_id', sa.UUID(), nullable=False),
+    sa.Column('current_streak_days', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('longest_streak_days', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('last_active_date', sa.Date(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['client_id'], ['clients.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('client_id')
+    )
+
+    # Backfill from existing log history (gaps-and-islands over distinct active days).
+    op.execute("""
+        -- A log's day is its UTC calendar date, as in app.domain.streaks.activity_day.
+        WITH days AS (
+            SELECT client_id, timezone('UTC', logged_at)::date AS day FROM workout_logs
+            UNION
+            SELECT client_id, timezone('UTC', logged_at)::date AS day FROM diet_logs
+        ),
+        islands AS (
+            SELECT client_id, day,
+                   day - (ROW_NUMBER() OVER (PARTITION BY client_id ORDER BY day))::int AS grp
+            FROM days
+        ),
+        runs AS (
+            SELECT client_id, COUNT(*) AS run_length, MAX(day) AS run_end
+            FROM islands
+            GROUP BY client_id, grp
+        )
+        INSERT INTO client_streaks (client_id, current_streak_days, longest_streak_days, last_active_date)
+        SELECT DISTINCT ON (client_id)
+               client_id,
+               run_length,
+               MAX(run_length) OVER (PARTITION BY client_id),
+               run_end
+        FROM runs
+        ORDER BY client_id, run_end DESC
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('client_streaks')
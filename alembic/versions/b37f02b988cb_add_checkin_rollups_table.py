@@ -0,0 +1,67 @@
+"""add checkin_rollups table
+
+Revision ID: b37f02b988cb
+Revises: ac59fb38b4aa
+Create Date: 2026-10-17 16:40:12.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b37f02b988cb'
+down_revision: Union[str, Sequence[str], None] = 'ac59fb38b4aa'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('checkin_rollups',
+    sa.Column('client_id', sa.UUID(), nullable=False),
+    sa.Column('granularity', sa.String(), nullable=False),
+    sa.Column('metric', sa.String(), nullable=False),
+    sa.Column('bucket_start', sa.Date(), nullable=False),
+    sa.Column('sample_count', sa.Integer(), nullable=False),
+    sa.Column('value_sum', sa.Numeric(), nullable=False),
+    sa.Column('value_min', sa.Numeric(), nullable=False),
+    sa.Column('value_max', sa.Numeric(), nullable=False),
+    sa.Column('last_value', sa.Numeric(), nullable=False),
+    sa.Column('last_checked_in_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['client_id'], ['clients.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('client_id', 'granularity', 'metric', 'bucket_start')
+    )
+
+    # Backfill from existing check-ins, bucketed the same way as app/domain/checkin_series.py.
+    # Later rebuilds use CheckinService.rebuild_rollups (app.scripts.rebuild_checkin_rollups).
+    op.execute("""
+        WITH samples AS (
+            SELECT client_id, checked_in_at, 'weight_kg' AS metric, weight_kg AS value
+            FROM checkins
+            WHERE weight_kg IS NOT NULL
+            UNION ALL
+            SELECT c.client_id, c.checked_in_at, 'measurements.' || m.key, (m.value #>> '{}')::numeric
+            FROM checkins c
+            CROSS JOIN LATERAL jsonb_each(c.measurements) AS m
+            WHERE jsonb_typeof(c.measurements) = 'object' AND jsonb_typeof(m.value) = 'number'
+        )
+        INSERT INTO checkin_rollups (
+            client_id, granularity, metric, bucket_start,
+            sample_count, value_sum, value_min, value_max, last_value, last_checked_in_at
+        )
+        SELECT s.client_id, g.granularity, s.metric,
+               date_trunc(g.granularity, s.checked_in_at AT TIME ZONE 'UTC')::date,
+               COUNT(*), SUM(s.value), MIN(s.value), MAX(s.value),
+               (array_agg(s.value ORDER BY s.checked_in_at DESC))[1], MAX(s.checked_in_at)
+        FROM samples s
+        CROSS JOIN (VALUES ('day'), ('week'), ('month')) AS g(granularity)
+        GROUP BY 1, 2, 3, 4
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('checkin_rollups')
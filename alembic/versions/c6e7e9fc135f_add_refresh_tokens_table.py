@@ -0,0 +1,43 @@
+"""add refresh_tokens table
+
+Revision ID: c6e7e9fc135f
+Revises: b37f02b988cb
+Create Date: 2026-10-17 18:05:44.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6e7e9fc135f'
+down_revision: Union[str, Sequence[str], None] = 'b37f02b988cb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('refresh_tokens',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('family_id', sa.UUID(), nullable=False),
+    sa.Column('token_hash', sa.String(length=64), nullable=False),
+    sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('revoked_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('token_hash')
+    )
+    op.create_index('refresh_tokens_user_id_idx', 'refresh_tokens', ['user_id'], unique=False)
+    op.create_index('refresh_tokens_family_id_idx', 'refresh_tokens', ['family_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('refresh_tokens_family_id_idx', table_name='refresh_tokens')
+    op.drop_index('refresh_tokens_user_id_idx', table_name='refresh_tokens')
+    op.drop_table('refresh_tokens')
@@ -0,0 +1,52 @@
+"""keyset pagination indexes
+
+Revision ID: daae5f182d61
+Revises: b250170f8f2c
+Create Date: 2026-10-17 11:02:19.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'daae5f182d61'
+down_revision: Union[str, Sequence[str], None] = 'b250170f8f2c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, sort column, new composite index, superseded single-key index)
+KEYSET_INDEXES = [
+    ('workout_logs', 'logged_at', 'workout_logs_client_id_logged_at_id_desc_idx', 'workout_logs_client_id_logged_at_desc_idx'),
+    ('diet_logs', 'logged_at', 'diet_logs_client_id_logged_at_id_desc_idx', 'diet_logs_client_id_logged_at_desc_idx'),
+    ('checkins', 'checked_in_at', 'checkins_client_id_checked_in_at_id_desc_idx', 'checkins_client_id_checked_in_at_desc_idx'),
+    ('activity_feed', 'event_timestamp', 'activity_feed_client_id_event_timestamp_id_desc_idx', 'activity_feed_client_id_event_timestamp_desc_idx'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, sort_column, index_name, superseded in KEYSET_INDEXES:
+        op.create_index(
+            index_name,
+            table,
+            ['client_id', sa.literal_column(f'{sort_column} DESC'), sa.literal_column('id DESC')],
+            unique=False,
+        )
+        # The (client_id, <sort> DESC) index is a strict prefix of the new one.
+        op.drop_index(superseded, table_name=table, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, sort_column, index_name, superseded in KEYSET_INDEXES:
+        op.create_index(
+            superseded,
+            table,
+            ['client_id', sa.literal_column(f'{sort_column} DESC')],
+            unique=False,
+        )
+        op.drop_index(index_name, table_name=table)
@@ -0,0 +1,50 @@
+"""add trainer_stats table
+
+Revision ID: ea31a26a1a74
+Revises: daae5f182d61
+Create Date: 2026-10-17 11:02:19.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ea31a26a1a74'
+down_revision: Union[str, Sequence[str], None] = 'daae5f182d61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('trainer_stats',
+    sa.Column('trainer_user_id', sa.UUID(), nullable=False),
+    sa.Column('active_clients', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('active_at_month_start', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('snapshot_month', sa.Date(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['trainer_user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('trainer_user_id')
+    )
+
+    # Backfill; the month-start snapshot is estimated from client creation dates.
+    op.execute("""
+        INSERT INTO trainer_stats (trainer_user_id, active_clients, active_at_month_start, snapshot_month)
+        SELECT u.id,
+               COUNT(c.id) FILTER (WHERE c.client_status = 'active'),
+               COUNT(c.id) FILTER (WHERE c.client_status = 'active'
+                                     AND c.created_at < date_trunc('month', now())),
+               date_trunc('month', now())::date
+        FROM users u
+        LEFT JOIN clients c ON c.trainer_user_id = u.id AND c.deleted_at IS NULL
+        WHERE u.user_role = 'trainer'
+        GROUP BY u.id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('trainer_stats')
@@ -0,0 +1,92 @@
+"""content addressed plan snapshots
+
+Revision ID: ee4ea93fbf74
+Revises: 87dcb7b10691
+Create Date: 2026-10-17 20:05:12.000000+00:00
+
+"""
+import hashlib
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ee4ea93fbf74'
+down_revision: Union[str, Sequence[str], None] = '87dcb7b10691'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PLAN_TABLES = ('assigned_workout_plans', 'assigned_diet_plans')
+BATCH_SIZE = 1000
+
+
+def snapshot_hash(details) -> str:
+    # Copy of app.models.plan.snapshot_hash as of this revision; hashes must match the app's.
+    canonical = json.dumps(details, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'plan_snapshots',
+        sa.Column('content_hash', sa.String(length=64), nullable=False),
+        sa.Column('plan_details', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('content_hash'),
+    )
+    for table in PLAN_TABLES:
+        op.add_column(table, sa.Column('snapshot_hash', sa.String(length=64), nullable=True))
+        op.add_column(table, sa.Column('template_version', sa.Integer(), nullable=True))
+
+    # Hash in Python (not SQL) so existing rows get the same address the app computes.
+    bind = op.get_bind()
+    snapshots = sa.table(
+        'plan_snapshots',
+        sa.column('content_hash', sa.String),
+        sa.column('plan_details', postgresql.JSONB),
+    )
+    insert_snapshots = postgresql.insert(snapshots).on_conflict_do_nothing(index_elements=['content_hash'])
+    for table in PLAN_TABLES:
+        plans = sa.table(table, sa.column('id'), sa.column('plan_details', postgresql.JSONB), sa.column('snapshot_hash'))
+        set_hash = sa.update(plans).where(plans.c.id == sa.bindparam('plan_id')).values(snapshot_hash=sa.bindparam('hash'))
+        while True:
+            rows = bind.execute(
+                sa.select(plans.c.id, plans.c.plan_details).where(plans.c.snapshot_hash.is_(None)).limit(BATCH_SIZE)
+            ).all()
+            if not rows:
+                break
+            hashed = [(row.id, snapshot_hash(row.plan_details), row.plan_details) for row in rows]
+            unique = {content_hash: details for _, content_hash, details in hashed}
+            bind.execute(insert_snapshots, [{'content_hash': h, 'plan_details': d} for h, d in unique.items()])
+            bind.execute(set_hash, [{'plan_id': plan_id, 'hash': content_hash} for plan_id, content_hash, _ in hashed])
+
+        op.alter_column(table, 'snapshot_hash', nullable=False)
+        op.create_foreign_key(
+            f'{table}_snapshot_hash_fkey', table, 'plan_snapshots',
+            ['snapshot_hash'], ['content_hash'], ondelete='RESTRICT',
+        )
+        op.create_index(f'ix_{table}_template_version', table, ['source_template_id', 'template_version'], unique=False)
+        op.drop_column(table, 'plan_details')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in PLAN_TABLES:
+        op.add_column(table, sa.Column('plan_details', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+        op.execute(f"""
+            UPDATE {table} p
+            SET plan_details = s.plan_details
+            FROM plan_snapshots s
+            WHERE s.content_hash = p.snapshot_hash
+        """)
+        op.alter_column(table, 'plan_details', nullable=False)
+        op.drop_index(f'ix_{table}_template_version', table_name=table)
+        op.drop_constraint(f'{table}_snapshot_hash_fkey', table, type_='foreignkey')
+        op.drop_column(table, 'template_version')
+        op.drop_column(table, 'snapshot_hash')
+    op.drop_table('plan_snapshots')
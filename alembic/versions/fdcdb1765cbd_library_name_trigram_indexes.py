@@ -0,0 +1,47 @@
+"""library name trigram indexes
+
+Revision ID: fdcdb1765cbd
+Revises: ea31a26a1a74
+Create Date: 2026-10-17 12:20:47.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fdcdb1765cbd'
+down_revision: Union[str, Sequence[str], None] = 'ea31a26a1a74'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm;')
+    op.create_index(
+        'exercise_library_name_trgm_idx',
+        'exercise_library',
+        ['name'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'},
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+    op.create_index(
+        'food_item_library_name_trgm_idx',
+        'food_item_library',
+        ['name'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'},
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('food_item_library_name_trgm_idx', table_name='food_item_library', postgresql_where=sa.text('deleted_at IS NULL'))
+    op.drop_index('exercise_library_name_trgm_idx', table_name='exercise_library', postgresql_where=sa.text('deleted_at IS NULL'))
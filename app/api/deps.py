@@ -2,27 +2,93 @@
 # Contains FastAPI dependencies used across the application.
 
 import uuid
-from typing import Annotated
-from fastapi import Depends, HTTPException, status
+from datetime import datetime
+from typing import Annotated, Any, Awaitable, Callable, Optional, TypeVar, Union
+from fastapi import Depends, HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import ValidationError
 
 from app.core import security
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db
 from app.core.auth_context import ClientContext, TrainerContext
+from app.core.etag import compute_etag, etag_matches
 from app.models.user import User
 from app.models.client import Client
 from app.schemas.token import TokenData
 from app.services.user_service import user_service
-from app.cache.auth_cache import get_cached_user, set_cached_user
+from app.cache.auth_cache import cache_verified_claims, get_cached_user, get_verified_claims, set_cached_user, tokens_revoked
 
 
 # This defines the security scheme for getting a bearer token.
 # tokenUrl points to the endpoint where the client can fetch a token.
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/token")
 
+def _user_to_cache(user: User) -> dict:
+    """
+    Snapshot of what request handling needs from a user: enough to answer
+    /users/me and to build a ClientContext without touching the database.
+    """
+    client = user.client_profile
+    return {
+        "id": str(user.id),
+        "email": user.email,
+        "role": user.user_role,
+        "full_name": user.full_name,
+        "profile_photo_url": user.profile_photo_url,
+        "created_at": user.created_at.isoformat() if user.created_at else None,
+        "client_profile": {
+            "id": str(client.id),
+            "status": client.client_status,
+            "trainer_user_id": str(client.trainer_user_id),
+        } if client else None,
+    }
+
+
+def _user_from_cache(cached: dict) -> User:
+    """
+    Rebuilds a transient (not session-bound) User from a cache entry.
+    Services that write to the user or client must load the persistent row.
+    """
+    user = User(
+        id=uuid.UUID(cached["id"]),
+        email=cached["email"],
+        user_role=cached["role"],
+        full_name=cached.get("full_name"),
+        profile_photo_url=cached.get("profile_photo_url"),
+        created_at=datetime.fromisoformat(cached["created_at"]) if cached.get("created_at") else None,
+    )
+    profile = cached.get("client_profile")
+    user.client_profile = Client(
+        id=uuid.UUID(profile["id"]),
+        client_user_id=user.id,
+        client_status=profile["status"],
+        trainer_user_id=uuid.UUID(profile["trainer_user_id"]),
+    ) if profile else None
+    return user
+
+
+def verify_access_token(token: str) -> dict:
+    """
+    Claims of a valid, unrevoked access token. A token this worker verified before
+    is served from the verified-token cache instead of re-checking its signature.
+
+    Raises:
+        JWTError: if the token is invalid, expired or revoked.
+    """
+    claims = get_verified_claims(token)
+    if claims is not None:
+        return claims
+    claims = security.decode_access_token(token)
+    if tokens_revoked(claims, consult_redis=True):
+        raise JWTError("Token has been revoked")
+    cache_verified_claims(token, claims)
+    return claims
+
+
 def get_current_user(
     db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
 ) -> User:
@@ -39,9 +105,7 @@ def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = security.jwt.decode(
-            token, security.settings.SECRET_KEY, algorithms=[security.ALGORITHM]
-        )
+        payload = verify_access_token(token)
         email: str = payload.get("sub")
         if email is None:
             raise credentials_exception
@@ -51,18 +115,13 @@ def get_current_user(
 
     cached_user = get_cached_user(token_data.email)
     if cached_user:
-        user = User(
-            id=uuid.UUID(cached_user["id"]),
-            email=cached_user["email"],
-            user_role=cached_user["role"],
-        )
+        user = _user_from_cache(cached_user)
     else:
-        user = user_service.get_user_by_email(db, email=token_data.email)
+        # The result is cached for every worker, so it must not come from a lagging
+        # replica; the request's other reads still may.
+        user = user_service.get_user_by_email(db, email=token_data.email, read_primary=True)
         if user:
-            set_cached_user(
-                token_data.email,
-                {"id": str(user.id), "email": user.email, "role": user.user_role},
-            )
+            set_cached_user(token_data.email, _user_to_cache(user))
     if user is None or user.deleted_at is not None:
         raise credentials_exception
         
@@ -91,13 +150,8 @@ def get_current_active_client(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="The user doesn't have enough privileges",
         )
-    client_profile = (
-        db.query(Client)
-        .filter(
-            Client.client_user_id == current_user.id,
-        )
-        .first()
-    )
+    # Loaded with the user (joinedload on a cache miss, cache entry otherwise).
+    client_profile = current_user.client_profile
 
     if not client_profile:
         raise HTTPException(
@@ -115,3 +169,58 @@ CurrentUser = Annotated[User, Depends(get_current_user)]
 CurrentTrainer = Annotated[TrainerContext, Depends(get_current_active_trainer)]
 CurrentClient = Annotated[ClientContext, Depends(get_current_active_client)]
 DBSession = Annotated[Session, Depends(get_db)]
+
+
+async def get_read_db(
+    db: DBSession, async_db: Optional[AsyncSession] = Depends(get_async_db)
+) -> Union[Session, AsyncSession]:
+    """
+    Session for the read-heavy endpoints: the AsyncSession when DB_ASYNC_ENABLED
+    is set, otherwise the request's Session. Query it through read_with().
+    """
+    return db if async_db is None else async_db
+
+
+ReadDBSession = Annotated[Union[Session, AsyncSession], Depends(get_read_db)]
+
+T = TypeVar("T")
+
+
+async def read_with(
+    db: Union[Session, AsyncSession],
+    sync_method: Callable[..., T],
+    async_method: Callable[..., Awaitable[T]],
+    **kwargs: Any,
+) -> T:
+    """
+    Runs the service read matching a ReadDBSession: `async_method` on the event loop
+    for an AsyncSession, `sync_method` in the threadpool for a Session.
+
+        logs = await read_with(db, log_service.get_workout_logs, log_service.get_workout_logs_async, client_id=client_id)
+    """
+    if isinstance(db, AsyncSession):
+        return await async_method(db, **kwargs)
+    return await run_in_threadpool(sync_method, db, **kwargs)
+
+
+def conditional_get(fingerprint: Callable[..., Any]):
+    """
+    Builds a route dependency for ETag / If-None-Match handling.
+
+    `fingerprint` is itself a dependency (it can ask for the db session, current
+    user and query params) returning a small value that changes whenever the
+    response would, e.g. counts and max(updated_at). When it matches the
+    client's If-None-Match the request ends with 304 before the endpoint runs,
+    so nothing is loaded or serialized.
+
+        @router.get("/things", dependencies=[conditional_get(things_version)])
+    """
+    def check(request: Request, response: Response, version: Any = Depends(fingerprint)) -> str:
+        etag = compute_etag(request.url.path, str(request.query_params), version)
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        response.headers.update(headers)
+        return etag
+
+    return Depends(check)
@@ -8,7 +8,8 @@ from fastapi import APIRouter, Query, status
 from app.api.deps import CurrentTrainer, CurrentUser, DBSession
 from app.schemas.assigned_plan import (
     WorkoutPlanAssign, AssignedWorkoutPlan,
-    DietPlanAssign, AssignedDietPlan
+    DietPlanAssign, AssignedDietPlan,
+    PlanBulkAssign, BulkAssignResult,
 )
 from app.services.assigned_plan_service import assigned_plan_service
 
@@ -80,3 +81,34 @@ def assign_diet_plan_to_client(
         db=db, assignment_in=assignment_in, trainer_id=current_trainer.id
     )
     return assigned_plan
+
+
+@router.post("/workout/bulk", response_model=BulkAssignResult)
+def assign_workout_plan_to_clients(
+    *,
+    db: DBSession,
+    assignment_in: PlanBulkAssign,
+    current_trainer: CurrentTrainer,
+):
+    """
+    Assign a workout plan template to many clients at once.
+    Each client is assigned or rejected on its own; see `results` for the outcome per client.
+    """
+    return assigned_plan_service.assign_plan_bulk(
+        db=db, kind="workout", assignment_in=assignment_in, trainer_id=current_trainer.id
+    )
+
+@router.post("/diet/bulk", response_model=BulkAssignResult)
+def assign_diet_plan_to_clients(
+    *,
+    db: DBSession,
+    assignment_in: PlanBulkAssign,
+    current_trainer: CurrentTrainer,
+):
+    """
+    Assign a diet plan template to many clients at once.
+    Each client is assigned or rejected on its own; see `results` for the outcome per client.
+    """
+    return assigned_plan_service.assign_plan_bulk(
+        db=db, kind="diet", assignment_in=assignment_in, trainer_id=current_trainer.id
+    )
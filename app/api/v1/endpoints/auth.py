@@ -11,7 +11,7 @@ from app.core.config import settings
 from app.services.auth_service import auth_service
 from app.services.user_service import user_service
 from app.services.client_service import client_service
-from app.schemas.token import Token
+from app.schemas.token import Token, TokenRefresh
 from app.schemas.user import User, UserCreate
 from app.schemas.auth import ClientRegister
 from app.models.client import Client
@@ -30,6 +30,14 @@ def login_for_access_token(
         db, email=form_data.username, password=form_data.password
     )
 
+@router.post("/refresh", response_model=Token)
+def refresh_access_token(db: DBSession, refresh_in: TokenRefresh) -> Any:
+    """
+    Exchange a refresh token for a new access token and a new refresh token.
+    Each refresh token works once; reusing one revokes all tokens derived from it.
+    """
+    return auth_service.refresh_access_token(db, refresh_token=refresh_in.refresh_token)
+
 @router.post("/register/client", response_model=User)
 def register_client(
     *,
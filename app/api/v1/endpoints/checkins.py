@@ -2,16 +2,21 @@
 # API endpoints for clients to submit weekly check-ins.
 
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
-from app.api.deps import CurrentUser, CurrentClient, DBSession
-from app.schemas.checkin import Checkin, CheckinCreate
+from app.api.deps import CurrentUser, CurrentClient, DBSession, ReadDBSession, read_with
+from app.core.responses import FastSerializer
+from app.domain.checkin_series import Granularity
+from app.schemas.checkin import Checkin, CheckinCreate, CheckinSeries
+from app.schemas.core import CursorPage
 from app.services.checkin_service import checkin_service
 
 router = APIRouter()
 
+checkin_json = FastSerializer(Checkin)
+
 @router.post("/", response_model=Checkin, status_code=status.HTTP_201_CREATED)
 def submit_checkin(
     *,
@@ -29,9 +34,9 @@ def submit_checkin(
     return checkin
 
 @router.get("/", response_model=List[Checkin])
-def list_checkins(
+async def list_checkins(
     client_id: uuid.UUID,
-    db: DBSession,
+    db: ReadDBSession,
     current_user: CurrentUser,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
@@ -42,16 +47,68 @@ def list_checkins(
     Retrieve check-ins for a specific client.
     (Accessible by the client themselves or their trainer)
     """
-    # This helper function correctly checks if the current user is the client
-    # or the client's assigned trainer.
-    
-    checkins = checkin_service.get_checkins_by_client(
-        db, 
-        client_id=client_id, 
+    checkins = await read_with(
+        db,
+        checkin_service.get_checkins_by_client,
+        checkin_service.get_checkins_by_client_async,
+        client_id=client_id,
+        current_user=current_user,
+        start_date=start_date,
+        end_date=end_date,
+        skip=skip,
+        limit=limit
+    )
+    return checkin_json.response(checkins)
+
+@router.get("/page", response_model=CursorPage[Checkin])
+async def list_checkins_page(
+    client_id: uuid.UUID,
+    db: ReadDBSession,
+    current_user: CurrentUser,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+):
+    """
+    Retrieve check-ins for a specific client, newest first, one cursor page at a time.
+    Pass the returned nextCursor back as `cursor` to fetch the following page.
+    """
+    return await read_with(
+        db,
+        checkin_service.get_checkins_page,
+        checkin_service.get_checkins_page_async,
+        client_id=client_id,
         current_user=current_user,
-        start_date=start_date, 
-        end_date=end_date, 
-        skip=skip, 
+        start_date=start_date,
+        end_date=end_date,
+        cursor=cursor,
         limit=limit
     )
-    return checkins
+
+@router.get("/series", response_model=CheckinSeries)
+async def get_checkin_series(
+    client_id: uuid.UUID,
+    db: ReadDBSession,
+    current_user: CurrentUser,
+    granularity: Granularity = "week",
+    metric: Optional[List[str]] = Query(None),
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+):
+    """
+    Weight and measurement series for progress charts, downsampled to day, week or month
+    buckets with min/max/avg/last per bucket. Repeat `metric` (e.g. `weight_kg`,
+    `measurements.waist_cm`) to only include those series.
+    """
+    return await read_with(
+        db,
+        checkin_service.get_checkin_series,
+        checkin_service.get_checkin_series_async,
+        client_id=client_id,
+        current_user=current_user,
+        granularity=granularity,
+        metrics=metric,
+        start_date=start_date,
+        end_date=end_date
+    )
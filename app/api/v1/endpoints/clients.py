@@ -6,8 +6,10 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from app.schemas.client import ClientOverview, ClientPrivateNotesUpdate
 from app.schemas.activity import ActivityFeedItem
+from app.schemas.core import CursorPage
 from app.services.activity_feed_service import activity_feed_service
-from app.api.deps import CurrentTrainer, DBSession
+from app.api.deps import CurrentTrainer, DBSession, ReadDBSession, read_with
+from app.core.responses import FastSerializer
 from app.schemas.client import Client, ClientInvite
 from app.services.client_service import client_service
 from app.schemas.client import ClientUpdate,PaymentConfirmation
@@ -15,6 +17,8 @@ from app.schemas.assigned_plan import ClientAssignedPlans
 
 router = APIRouter()
 
+client_json = FastSerializer(Client)
+
 @router.get("/", response_model=List[Client])
 def read_clients(
     db: DBSession,
@@ -30,7 +34,7 @@ def read_clients(
     clients = client_service.get_clients_by_trainer(
         db, trainer_id=current_trainer.id, status=status, skip=skip, limit=limit
     )
-    return clients
+    return client_json.response(clients)
 
 @router.post("/", response_model=Client, status_code=status.HTTP_201_CREATED)
 def invite_client(
@@ -83,9 +87,9 @@ def get_client_overview(
     return overview
 
 @router.get("/{client_id}/activity-feed", response_model=List[ActivityFeedItem])
-def get_client_activity_feed(
+async def get_client_activity_feed(
     client_id: uuid.UUID,
-    db: DBSession,
+    db: ReadDBSession,
     current_trainer: CurrentTrainer,
     skip: int = 0,
     limit: int = 50,
@@ -93,13 +97,35 @@ def get_client_activity_feed(
     """
     Get the activity feed for a specific client.
     """
-    # Authorization check
-    client = client_service.get_client_by_id(db, client_id=client_id, trainer_id=current_trainer.id)
-    if not client:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Client not found")
-    
-    feed = activity_feed_service.get_activity_feed_for_client(db=db, client_id=client_id, skip=skip, limit=limit)
-    return feed
+    # Authorization check: 404 unless the client belongs to this trainer
+    await read_with(
+        db, client_service.get_client_by_id, client_service.get_client_by_id_async,
+        client_id=client_id, trainer_id=current_trainer.id,
+    )
+    return await read_with(
+        db, activity_feed_service.get_activity_feed_for_client, activity_feed_service.get_activity_feed_for_client_async,
+        client_id=client_id, skip=skip, limit=limit,
+    )
+
+@router.get("/{client_id}/activity-feed/page", response_model=CursorPage[ActivityFeedItem])
+async def get_client_activity_feed_page(
+    client_id: uuid.UUID,
+    db: ReadDBSession,
+    current_trainer: CurrentTrainer,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+):
+    """
+    Get the activity feed for a specific client, one cursor page at a time.
+    """
+    await read_with(
+        db, client_service.get_client_by_id, client_service.get_client_by_id_async,
+        client_id=client_id, trainer_id=current_trainer.id,
+    )
+    return await read_with(
+        db, activity_feed_service.get_activity_feed_page_for_client, activity_feed_service.get_activity_feed_page_for_client_async,
+        client_id=client_id, cursor=cursor, limit=limit,
+    )
 
 @router.patch("/{client_id}/notes", response_model=Client)
 def update_client_private_notes(
@@ -2,9 +2,10 @@
 # API endpoints for managing the exercise and food item libraries.
 
 import uuid
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, Response
-from app.api.deps import CurrentTrainer, DBSession
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status, Response
+from app.api.deps import CurrentTrainer, DBSession, conditional_get
+from app.schemas.core import CursorPage
 from app.models.template import ExerciseLibrary, FoodItemLibrary
 from app.schemas.library import (
     LibraryExercise, LibraryExerciseCreate, LibraryExerciseUpdate,
@@ -14,12 +15,35 @@ from app.services.library_service import library_service
 
 router = APIRouter()
 
+
+def exercises_version(db: DBSession, current_trainer: CurrentTrainer):
+    return library_service.get_exercises_version(db, trainer_id=current_trainer.id)
+
+
+def food_items_version(db: DBSession, current_trainer: CurrentTrainer):
+    return library_service.get_food_items_version(db, trainer_id=current_trainer.id)
+
+
 # --- Exercise Library Endpoints ---
 
-@router.get("/exercises", response_model=List[LibraryExercise])
+@router.get("/exercises", response_model=List[LibraryExercise], dependencies=[conditional_get(exercises_version)])
 def get_exercise_library(db: DBSession, current_trainer: CurrentTrainer):
     return library_service.get_exercises(db, trainer_id=current_trainer.id)
 
+@router.get("/exercises/search", response_model=CursorPage[LibraryExercise])
+def search_exercise_library(
+    db: DBSession,
+    current_trainer: CurrentTrainer,
+    q: str = Query(..., min_length=2, max_length=100),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+):
+    """
+    Search verified and own exercises by name, best matches first.
+    Pass `nextCursor` back as `cursor` to fetch the next page.
+    """
+    return library_service.search_exercises(db, trainer_id=current_trainer.id, q=q, cursor=cursor, limit=limit)
+
 @router.post("/exercises", response_model=LibraryExercise, status_code=status.HTTP_201_CREATED)
 def create_exercise(exercise_in: LibraryExerciseCreate, db: DBSession, current_trainer: CurrentTrainer):
     return library_service.create_exercise(db, obj_in=exercise_in, trainer_id=current_trainer.id)
@@ -45,10 +69,24 @@ def delete_exercise(exercise_id: uuid.UUID, db: DBSession, current_trainer: Curr
 
 # --- Food Item Library Endpoints ---
 
-@router.get("/food-items", response_model=List[LibraryFoodItem])
+@router.get("/food-items", response_model=List[LibraryFoodItem], dependencies=[conditional_get(food_items_version)])
 def get_food_item_library(db: DBSession, current_trainer: CurrentTrainer):
     return library_service.get_food_items(db, trainer_id=current_trainer.id)
 
+@router.get("/food-items/search", response_model=CursorPage[LibraryFoodItem])
+def search_food_item_library(
+    db: DBSession,
+    current_trainer: CurrentTrainer,
+    q: str = Query(..., min_length=2, max_length=100),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+):
+    """
+    Search verified and own food items by name, best matches first.
+    Pass `nextCursor` back as `cursor` to fetch the next page.
+    """
+    return library_service.search_food_items(db, trainer_id=current_trainer.id, q=q, cursor=cursor, limit=limit)
+
 @router.post("/food-items", response_model=LibraryFoodItem, status_code=status.HTTP_201_CREATED)
 def create_food_item(food_item_in: LibraryFoodItemCreate, db: DBSession, current_trainer: CurrentTrainer):
     return library_service.create_food_item(db, obj_in=food_item_in, trainer_id=current_trainer.id)
@@ -6,14 +6,19 @@ from datetime import datetime
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
-from app.api.deps import CurrentUser, CurrentClient, DBSession
+from app.api.deps import CurrentUser, CurrentClient, DBSession, ReadDBSession, read_with
+from app.core.responses import FastSerializer
 from app.models.user import User
 from app.models.client import Client
-from app.schemas.log import WorkoutLog, WorkoutLogCreate, DietLog, DietLogCreate
+from app.schemas.core import CursorPage
+from app.schemas.log import WorkoutLog, WorkoutLogCreate, DietLog, DietLogCreate, LogBatchCreate, LogBatchResult
 from app.services.log_service import log_service
 
 router = APIRouter()
 
+workout_log_json = FastSerializer(WorkoutLog)
+diet_log_json = FastSerializer(DietLog)
+
 # --- Helper function for authorization ---
 
 # def authorize_log_access(db: DBSession, current_user: User, client_id: uuid.UUID):
@@ -49,9 +54,9 @@ def create_workout_log(
     return log
 
 @router.get("/workout", response_model=List[WorkoutLog])
-def list_workout_logs(
+async def list_workout_logs(
     client_id: uuid.UUID,
-    db: DBSession,
+    db: ReadDBSession,
     current_user: CurrentUser,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
@@ -62,8 +67,30 @@ def list_workout_logs(
     Retrieve workout logs for a specific client.
     (Accessible by the client themselves or their trainer)
     """
-    logs = log_service.get_workout_logs(db, client_id=client_id, current_user=current_user,start_date=start_date, end_date=end_date, skip=skip, limit=limit)
-    return logs
+    logs = await read_with(
+        db, log_service.get_workout_logs, log_service.get_workout_logs_async,
+        client_id=client_id, current_user=current_user, start_date=start_date, end_date=end_date, skip=skip, limit=limit,
+    )
+    return workout_log_json.response(logs)
+
+@router.get("/workout/page", response_model=CursorPage[WorkoutLog])
+async def list_workout_logs_page(
+    client_id: uuid.UUID,
+    db: ReadDBSession,
+    current_user: CurrentUser,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+):
+    """
+    Retrieve workout logs for a specific client, newest first, one cursor page at a time.
+    Pass the returned nextCursor back as `cursor` to fetch the following page.
+    """
+    return await read_with(
+        db, log_service.get_workout_logs_page, log_service.get_workout_logs_page_async,
+        client_id=client_id, current_user=current_user, start_date=start_date, end_date=end_date, cursor=cursor, limit=limit,
+    )
 
 # --- Diet Log Routes ---
 
@@ -82,9 +109,9 @@ def create_diet_log(
     return log
 
 @router.get("/diet", response_model=List[DietLog])
-def list_diet_logs(
+async def list_diet_logs(
     client_id: uuid.UUID,
-    db: DBSession,
+    db: ReadDBSession,
     current_user: CurrentUser,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
@@ -95,5 +122,43 @@ def list_diet_logs(
     Retrieve diet logs for a specific client.
     (Accessible by the client themselves or their trainer)
     """
-    logs = log_service.get_diet_logs(db, client_id=client_id, current_user=current_user, start_date=start_date, end_date=end_date, skip=skip, limit=limit)
-    return logs
+    logs = await read_with(
+        db, log_service.get_diet_logs, log_service.get_diet_logs_async,
+        client_id=client_id, current_user=current_user, start_date=start_date, end_date=end_date, skip=skip, limit=limit,
+    )
+    return diet_log_json.response(logs)
+
+@router.get("/diet/page", response_model=CursorPage[DietLog])
+async def list_diet_logs_page(
+    client_id: uuid.UUID,
+    db: ReadDBSession,
+    current_user: CurrentUser,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+):
+    """
+    Retrieve diet logs for a specific client, newest first, one cursor page at a time.
+    Pass the returned nextCursor back as `cursor` to fetch the following page.
+    """
+    return await read_with(
+        db, log_service.get_diet_logs_page, log_service.get_diet_logs_page_async,
+        client_id=client_id, current_user=current_user, start_date=start_date, end_date=end_date, cursor=cursor, limit=limit,
+    )
+
+
+# --- Batch Ingestion ---
+
+@router.post("/batch", response_model=LogBatchResult)
+def create_logs_batch(
+    *,
+    db: DBSession,
+    batch_in: LogBatchCreate,
+    current_client: CurrentClient,
+):
+    """
+    Upload a batch of workout and diet logs, e.g. recorded while offline. (Client only)
+    Each item is accepted or rejected on its own; see `results` for the outcome per item.
+    """
+    return log_service.create_logs_batch(db=db, obj_in=batch_in, current_client=current_client)
@@ -5,15 +5,38 @@ import uuid
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status, Response, Query
 
-from app.api.deps import CurrentTrainer, DBSession
+from app.api.deps import CurrentTrainer, DBSession, conditional_get
+from app.core.responses import FastSerializer
 from app.schemas.template import (
-    WorkoutPlanTemplate, WorkoutPlanTemplateCreate, WorkoutPlanTemplateUpdate,
-    DietPlanTemplate, DietPlanTemplateCreate, DietPlanTemplateUpdate
+    WorkoutPlanTemplate, WorkoutPlanTemplateCreate, WorkoutPlanTemplateUpdate, WorkoutPlanTemplatePatch,
+    DietPlanTemplate, DietPlanTemplateCreate, DietPlanTemplateUpdate, DietPlanTemplatePatch,
 )
 from app.services.template_service import template_service
 
 router = APIRouter()
 
+workout_template_json = FastSerializer(WorkoutPlanTemplate)
+diet_template_json = FastSerializer(DietPlanTemplate)
+
+
+def workout_templates_version(
+    db: DBSession,
+    current_trainer: CurrentTrainer,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=200),
+):
+    return template_service.get_workout_templates_version(db, trainer_id=current_trainer.id, skip=skip, limit=limit)
+
+
+def diet_templates_version(
+    db: DBSession,
+    current_trainer: CurrentTrainer,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=200),
+):
+    return template_service.get_diet_templates_version(db, trainer_id=current_trainer.id, skip=skip, limit=limit)
+
+
 # --- Workout Plan Template Routes ---
 
 @router.post("/workout", response_model=WorkoutPlanTemplate, status_code=status.HTTP_201_CREATED)
@@ -31,8 +54,9 @@ def create_workout_template(
     )
     return template
 
-@router.get("/workout", response_model=List[WorkoutPlanTemplate])
+@router.get("/workout", response_model=List[WorkoutPlanTemplate], dependencies=[conditional_get(workout_templates_version)])
 def list_workout_templates(
+    response: Response,
     db: DBSession,
     current_trainer: CurrentTrainer,
     skip: int = Query(0, ge=0),
@@ -44,7 +68,8 @@ def list_workout_templates(
     templates = template_service.get_workout_templates(
         db=db, trainer_id=current_trainer.id, skip=skip, limit=limit
     )
-    return templates
+    # Keep the ETag headers set by conditional_get on the fast path too.
+    return workout_template_json.response(templates, headers=response.headers)
 
 @router.get("/workout/{template_id}", response_model=WorkoutPlanTemplate)
 def get_workout_template(
@@ -58,7 +83,7 @@ def get_workout_template(
     template = template_service.get_workout_template(db=db, template_id=template_id, trainer_id=current_trainer.id)
     if not template:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workout template not found")
-    return template
+    return workout_template_json.response(template)
 
 @router.put("/workout/{template_id}", response_model=WorkoutPlanTemplate)
 def update_workout_template(
@@ -77,6 +102,23 @@ def update_workout_template(
     updated_template = template_service.update_workout_template(db=db, template=template, obj_in=template_in)
     return updated_template
 
+@router.patch("/workout/{template_id}", response_model=WorkoutPlanTemplate)
+def patch_workout_template(
+    template_id: uuid.UUID,
+    template_in: WorkoutPlanTemplatePatch,
+    db: DBSession,
+    current_trainer: CurrentTrainer,
+):
+    """
+    Partially update a workout template: send only the changed items (with their
+    itemId), new items (without one) and the ids of removed items.
+    """
+    template = template_service.get_workout_template(db=db, template_id=template_id, trainer_id=current_trainer.id)
+    if not template:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workout template not found")
+
+    return template_service.patch_workout_template(db=db, template=template, obj_in=template_in)
+
 @router.delete("/workout/{template_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_workout_template(
     template_id: uuid.UUID,
@@ -110,8 +152,9 @@ def create_diet_template(
     )
     return template
 
-@router.get("/diet", response_model=List[DietPlanTemplate])
+@router.get("/diet", response_model=List[DietPlanTemplate], dependencies=[conditional_get(diet_templates_version)])
 def list_diet_templates(
+    response: Response,
     db: DBSession,
     current_trainer: CurrentTrainer,
     skip: int = Query(0, ge=0),
@@ -123,7 +166,7 @@ def list_diet_templates(
     templates = template_service.get_diet_templates(
         db=db, trainer_id=current_trainer.id, skip=skip, limit=limit
     )
-    return templates
+    return diet_template_json.response(templates, headers=response.headers)
 
 @router.get("/diet/{template_id}", response_model=DietPlanTemplate)
 def get_diet_template(
@@ -137,7 +180,7 @@ def get_diet_template(
     template = template_service.get_diet_template(db=db, template_id=template_id, trainer_id=current_trainer.id)
     if not template:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Diet template not found")
-    return template
+    return diet_template_json.response(template)
 
 @router.put("/diet/{template_id}", response_model=DietPlanTemplate)
 def update_diet_template(
@@ -156,6 +199,23 @@ def update_diet_template(
     updated_template = template_service.update_diet_template(db=db, template=template, obj_in=template_in)
     return updated_template
 
+@router.patch("/diet/{template_id}", response_model=DietPlanTemplate)
+def patch_diet_template(
+    template_id: uuid.UUID,
+    template_in: DietPlanTemplatePatch,
+    db: DBSession,
+    current_trainer: CurrentTrainer,
+):
+    """
+    Partially update a diet template: send only the changed items (with their
+    itemId), new items (without one) and the ids of removed items.
+    """
+    template = template_service.get_diet_template(db=db, template_id=template_id, trainer_id=current_trainer.id)
+    if not template:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Diet template not found")
+
+    return template_service.patch_diet_template(db=db, template=template, obj_in=template_in)
+
 @router.delete("/diet/{template_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_diet_template(
     template_id: uuid.UUID,
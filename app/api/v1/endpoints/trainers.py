@@ -1,8 +1,17 @@
 # app/api/v1/endpoints/trainers.py
+import asyncio
 import uuid
-from fastapi import APIRouter, Depends
-from app.api.deps import CurrentTrainer, DBSession
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from app.api.deps import CurrentTrainer, DBSession, ReadDBSession, read_with
+from app.core.database import pin_primary
+from app.schemas.activity import TrainerActivityFeedItem
+from app.schemas.core import CursorPage
 from app.schemas.trainer import TrainerStats
+from app.services.activity_feed_service import activity_feed_service
+from app.services.activity_stream_service import RESYNC, activity_stream_service, format_sse
 from app.services.trainer_service import trainer_service
 
 router = APIRouter()
@@ -16,4 +25,92 @@ def get_my_stats(
     Get statistics for the currently authenticated trainer.
     """
     stats = trainer_service.get_trainer_stats(db=db, trainer_id=current_trainer.id)
-    return stats
\ No newline at end of file
+    return stats
+
+@router.get("/me/activity-feed", response_model=CursorPage[TrainerActivityFeedItem])
+async def get_my_activity_feed(
+    db: ReadDBSession,
+    current_trainer: CurrentTrainer,
+    event_type: Optional[List[str]] = Query(None),
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+):
+    """
+    Activity of all of the trainer's clients in one stream, newest first, one cursor page at a time.
+    Repeat `event_type` to only include those event types.
+    """
+    return await read_with(
+        db,
+        activity_feed_service.get_trainer_activity_feed_page,
+        activity_feed_service.get_trainer_activity_feed_page_async,
+        trainer_id=current_trainer.id, event_types=event_type, cursor=cursor, limit=limit,
+    )
+
+
+STREAM_BACKLOG_LIMIT = 500
+STREAM_HEARTBEAT_SECONDS = 15
+
+
+@router.get("/me/activity-stream", response_class=StreamingResponse)
+async def stream_my_activity(
+    db: DBSession,
+    current_trainer: CurrentTrainer,
+    last_event_id: Optional[int] = Query(None, ge=0),
+    last_event_id_header: Optional[int] = Header(None, alias="Last-Event-ID", ge=0),
+):
+    """
+    Server-sent events for new activity of the trainer's clients (`event: activity`,
+    `id` = activity id). On reconnect, pass the last seen id as the Last-Event-ID
+    header (EventSource does this itself) or `last_event_id` to first replay what
+    was missed. The server may end the stream; clients simply reconnect.
+    """
+    trainer_id = current_trainer.id
+    after_id = last_event_id_header if last_event_id_header is not None else last_event_id
+    # Subscribe before reading the backlog so nothing committed in between is lost;
+    # a replica might not have those rows yet, so the backlog comes from the primary.
+    pin_primary(db)
+    queue = activity_stream_service.subscribe(trainer_id)
+    try:
+        backlog = []
+        if after_id is not None:
+            backlog = await run_in_threadpool(
+                activity_feed_service.get_trainer_activity_since,
+                db, trainer_id=trainer_id, after_id=after_id, limit=STREAM_BACKLOG_LIMIT,
+            )
+            backlog = [TrainerActivityFeedItem.model_validate(row) for row in backlog]
+    except Exception:
+        activity_stream_service.unsubscribe(trainer_id, queue)
+        raise
+    finally:
+        # The stream can stay open for hours; do not hold a pooled connection meanwhile.
+        db.close()
+
+    async def events():
+        try:
+            yield "retry: 1000\n\n"
+            for item in backlog:
+                yield format_sse(item)
+            if len(backlog) == STREAM_BACKLOG_LIMIT:
+                # More was missed than one replay holds; the reconnect continues from the last id.
+                return
+            # Live events can repeat replayed ones, but can also arrive out of id order
+            # (transactions commit in any order), so only the replayed ids are skipped.
+            replayed = {item.id for item in backlog}
+            while True:
+                try:
+                    item = await asyncio.wait_for(queue.get(), STREAM_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if item is RESYNC:
+                    return
+                if item.id not in replayed:
+                    yield format_sse(item)
+        finally:
+            activity_stream_service.unsubscribe(trainer_id, queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,9 +1,14 @@
+import hashlib
 import json
 import os
+import threading
+import time
 import uuid
+from collections import OrderedDict
 from redis import Redis
 
 from app.core.config import settings
+from app.core.metrics import AUTH_CACHE_LOOKUPS, TOKEN_CACHE_LOOKUPS
 
 
 def _make_redis() -> Redis | None:
@@ -19,6 +24,12 @@ def _make_redis() -> Redis | None:
 redis_client = _make_redis()
 
 USER_TTL = 120
+# The in-process tier is kept shorter than Redis: it is only corrected by
+# pub/sub invalidations, which a worker can miss while reconnecting.
+LOCAL_USER_TTL = 30
+LOCAL_MAX_ENTRIES = 10_000
+INVALIDATION_CHANNEL = "auth:user-invalidated"
+REVOCATION_CHANNEL = "auth:tokens-revoked"
 
 
 class UUIDSafeEncoder(json.JSONEncoder):
@@ -30,16 +41,228 @@ class UUIDSafeEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+class LocalTTLCache:
+    """Thread-safe, size-bounded LRU whose entries also expire after `ttl` seconds."""
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: dict):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def pop(self, key: str):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class VerifiedTokenCache:
+    """
+    Thread-safe, size-bounded LRU of decoded JWT claims, keyed by the SHA-256 of
+    the token (the token itself is not kept). Entries live until the token's exp.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._data: OrderedDict[bytes, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str):
+        key = self._key(token)
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, claims = entry
+            if expires_at <= time.time():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return claims
+
+    def set(self, token: str, claims: dict):
+        expires_at = claims.get("exp")
+        if self.max_entries <= 0 or not isinstance(expires_at, (int, float)):
+            return
+        key = self._key(token)
+        with self._lock:
+            self._data[key] = (float(expires_at), claims)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+# Both tiers are disabled together, so DISABLE_AUTH_CACHE=1 always means "read the DB".
+local_cache = LocalTTLCache(LOCAL_MAX_ENTRIES, LOCAL_USER_TTL) if redis_client is not None else None
+
+# Needs no Redis: it only saves signature checks, never a database read.
+token_cache = VerifiedTokenCache(settings.TOKEN_CACHE_MAX_ENTRIES)
+
+# email -> unix second; that user's access tokens issued ("iat") before it are revoked.
+# Kept current in every worker over pub/sub and mirrored in Redis for workers that
+# missed a message; without Redis, revocations only reach this process.
+_revoked_before: dict[str, int] = {}
+_revoked_lock = threading.Lock()
+
+
 def get_cached_user(email: str):
     if redis_client is None:
         return None
+    cached = local_cache.get(email)
+    if cached is not None:
+        AUTH_CACHE_LOOKUPS.labels("local_hit").inc()
+        return cached
     data = redis_client.get(f"user:{email}")
-    return json.loads(data) if data else None
+    if not data:
+        AUTH_CACHE_LOOKUPS.labels("miss").inc()
+        return None
+    AUTH_CACHE_LOOKUPS.labels("redis_hit").inc()
+    user_dict = json.loads(data)
+    local_cache.set(email, user_dict)
+    return user_dict
 
 
 def set_cached_user(email: str, user_dict: dict):
     if redis_client is None:
         return None
-    return redis_client.setex(
-        f"user:{email}", USER_TTL, json.dumps(user_dict, cls=UUIDSafeEncoder)
-    )
+    payload = json.dumps(user_dict, cls=UUIDSafeEncoder)
+    # Store the JSON round-tripped form so both tiers hand out identical dicts.
+    local_cache.set(email, json.loads(payload))
+    return redis_client.setex(f"user:{email}", USER_TTL, payload)
+
+
+def invalidate_cached_user(*emails: str):
+    """
+    Drops the cached entries for these emails from Redis and from the local tier
+    of every worker (via pub/sub). Call after the change has been committed.
+    """
+    if redis_client is None:
+        return None
+    emails = [e for e in emails if e]
+    if not emails:
+        return None
+    for email in emails:
+        local_cache.pop(email)
+    redis_client.delete(*(f"user:{email}" for email in emails))
+    for email in emails:
+        redis_client.publish(INVALIDATION_CHANNEL, email)
+
+
+def get_verified_claims(token: str) -> dict | None:
+    """Claims of a token this process has already verified, unless it expired or was revoked since."""
+    claims = token_cache.get(token)
+    if claims is None:
+        TOKEN_CACHE_LOOKUPS.labels("miss").inc()
+        return None
+    if tokens_revoked(claims):
+        TOKEN_CACHE_LOOKUPS.labels("revoked").inc()
+        return None
+    TOKEN_CACHE_LOOKUPS.labels("hit").inc()
+    return claims
+
+
+def cache_verified_claims(token: str, claims: dict):
+    """Remembers the claims of a token whose signature and exp were just checked."""
+    token_cache.set(token, claims)
+
+
+def _token_lifetime_seconds() -> int:
+    return settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+
+def _record_revocation(email: str, cutoff: int):
+    with _revoked_lock:
+        if cutoff > _revoked_before.get(email, 0):
+            _revoked_before[email] = cutoff
+        # Cutoffs older than the token lifetime cannot match a live token any more.
+        horizon = int(time.time()) - _token_lifetime_seconds()
+        for stale in [e for e, c in _revoked_before.items() if c < horizon]:
+            del _revoked_before[stale]
+
+
+def revoke_tokens(email: str):
+    """
+    Revokes every access token issued to this user up to now, in all workers.
+    Tokens issued in the same second stay valid, so a login right after still works.
+    """
+    cutoff = int(time.time())
+    _record_revocation(email, cutoff)
+    if redis_client is None:
+        return None
+    redis_client.setex(f"auth:revoked-before:{email}", _token_lifetime_seconds(), cutoff)
+    redis_client.publish(REVOCATION_CHANNEL, json.dumps({"email": email, "cutoff": cutoff}))
+
+
+def tokens_revoked(claims: dict, *, consult_redis: bool = False) -> bool:
+    """
+    Whether the token behind these claims was revoked. The per-request check reads
+    only the in-process map; the first verification of a token in this process also
+    consults Redis, which covers revocations published while this worker was not listening.
+    """
+    email = claims.get("sub")
+    with _revoked_lock:
+        cutoff = _revoked_before.get(email)
+    if cutoff is None and consult_redis and redis_client is not None and email:
+        stored = redis_client.get(f"auth:revoked-before:{email}")
+        if stored:
+            cutoff = int(stored)
+            _record_revocation(email, cutoff)
+    if cutoff is None:
+        return False
+    issued_at = claims.get("iat")
+    return not isinstance(issued_at, (int, float)) or issued_at < cutoff
+
+
+def _handle_invalidation(message):
+    local_cache.pop(message["data"])
+
+
+def _handle_revocation(message):
+    revocation = json.loads(message["data"])
+    _record_revocation(revocation["email"], int(revocation["cutoff"]))
+
+
+def start_invalidation_listener():
+    """
+    Subscribes this process to invalidation messages in a daemon thread.
+    Returns the worker thread (call .stop() on shutdown), or None when caching is disabled.
+    """
+    if redis_client is None:
+        return None
+    pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+    pubsub.subscribe(**{INVALIDATION_CHANNEL: _handle_invalidation, REVOCATION_CHANNEL: _handle_revocation})
+    # Anything cached before the subscription was live may have missed an invalidation
+    # or revocation; dropped tokens are re-verified against Redis on their next use.
+    local_cache.clear()
+    token_cache.clear()
+    return pubsub.run_in_thread(sleep_time=1.0, daemon=True)
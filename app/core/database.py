@@ -1,37 +1,335 @@
 # app/core/database.py
 # Handles database connection and session management.
 
-from sqlalchemy import create_engine
+import time
+import uuid
+from typing import Optional, Union
+from fastapi import Request
+from sqlalchemy import CompoundSelect, Select, create_engine, event, exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool, QueuePool
 from .config import settings
+from . import metrics
+from .replicas import Replica, ReplicaHealthChecker, ReplicaSet
+
+
+class TimedPoolMixin:
+    """
+    Reports how long each checkout waited for a connection, to the current request
+    and to the pool's own metrics (labelled metrics_label). With NullPool that is
+    the time to connect.
+    """
+    metrics_label = "primary"
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            metrics.DB_POOL_TIMEOUTS.labels(self.metrics_label).inc()
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            metrics.record_pool_wait(waited)
+            metrics.DB_POOL_WAIT_SECONDS.labels(self.metrics_label).observe(waited)
+
+
+class TimedQueuePool(TimedPoolMixin, QueuePool):
+    """QueuePool that reports checkout waits."""
+
+
+class TimedAsyncQueuePool(TimedPoolMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool counterpart of TimedQueuePool."""
+
+
+class TimedNullPool(TimedPoolMixin, NullPool):
+    """NullPool (PgBouncer mode) that reports connect times."""
+
+
+def labelled_pool(pool_class: type[Pool], label: str) -> type[Pool]:
+    # A subclass rather than an instance attribute: pools rebuilt by dispose()
+    # are created from the class and keep the label.
+    return type(pool_class.__name__, (pool_class,), {"metrics_label": label})
+
+
+def engine_options(*, is_async: bool, label: str) -> dict:
+    """Pool keyword arguments for create_engine / create_async_engine, from Settings."""
+    if settings.DB_PGBOUNCER_MODE:
+        options = {"poolclass": labelled_pool(TimedNullPool, label)}
+        if is_async:
+            # Transaction pooling may run each statement on another server
+            # connection, where a prepared statement would not exist. psycopg2
+            # never prepares server-side, so only asyncpg needs this.
+            options["connect_args"] = {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+            }
+        return options
+    return {
+        "poolclass": labelled_pool(TimedAsyncQueuePool if is_async else TimedQueuePool, label),
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING == "always",
+    }
+
+
+def install_idle_pre_ping(sync_engine: Engine, idle_seconds: float) -> None:
+    """
+    Pings connections that sat in the pool for idle_seconds or more before handing
+    them out, instead of pinging on every checkout. A failed ping makes the pool
+    discard the connection and retry with a fresh one.
+    """
+
+    @event.listens_for(sync_engine, "checkin")
+    def _mark_idle(dbapi_connection, connection_record):
+        connection_record.info["checked_in_at"] = time.monotonic()
+
+    @event.listens_for(sync_engine, "checkout")
+    def _ping_if_idle(dbapi_connection, connection_record, connection_proxy):
+        checked_in_at = connection_record.info.get("checked_in_at")
+        if checked_in_at is None or time.monotonic() - checked_in_at < idle_seconds:
+            return
+        try:
+            sync_engine.dialect.do_ping(dbapi_connection)
+        except Exception as e:
+            raise exc.DisconnectionError() from e
+
+
+def instrument_pool(sync_engine: Engine, label: str) -> None:
+    """Keeps the pool's checked-out and overflow gauges current on every checkout and checkin."""
+    checked_out = metrics.DB_POOL_CHECKED_OUT.labels(label)
+    overflow = metrics.DB_POOL_OVERFLOW.labels(label)
+
+    def _set_overflow():
+        pool = sync_engine.pool
+        # Read before a checkin returns its connection, so at most one behind until the next event.
+        overflow.set(max(pool.overflow(), 0) if isinstance(pool, QueuePool) else 0)
+
+    # The pool also fires checkin for checkouts that failed half-way (e.g. a failed
+    # ping), so only connections marked here on a completed checkout are counted back.
+    # Registered after the idle ping, so a checkout it rejects is not counted.
+    @event.listens_for(sync_engine, "checkout")
+    def _checked_out(dbapi_connection, connection_record, connection_proxy):
+        connection_record.record_info["counted"] = True
+        checked_out.inc()
+        _set_overflow()
+
+    @event.listens_for(sync_engine, "checkin")
+    def _checked_in(dbapi_connection, connection_record):
+        if connection_record.record_info.pop("counted", False):
+            checked_out.dec()
+        _set_overflow()
+
+    @event.listens_for(sync_engine, "detach")
+    def _detached(dbapi_connection, connection_record):
+        # Detached connections (e.g. the LISTEN connection) never come back to the pool.
+        if connection_record.record_info.pop("counted", False):
+            checked_out.dec()
+
+
+def instrument_engine(sync_engine: Engine) -> None:
+    """Feeds every statement's execution time into the current request's metrics."""
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _start_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _stop_timer(conn, cursor, statement, parameters, context, executemany):
+        metrics.record_query(time.perf_counter() - conn.info["query_started"].pop())
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _drop_timer(exception_context):
+        # after_cursor_execute doesn't run for failed statements.
+        started = exception_context.connection.info.get("query_started") if exception_context.connection else None
+        if started:
+            metrics.record_query(time.perf_counter() - started.pop())
+
+
+def configure_engine(sync_engine: Engine, label: str) -> None:
+    """Attaches the pre-ping strategy and the statement and pool instrumentation."""
+    if settings.DB_POOL_PRE_PING == "idle" and not settings.DB_PGBOUNCER_MODE:
+        install_idle_pre_ping(sync_engine, settings.DB_POOL_PRE_PING_IDLE_SECONDS)
+    instrument_pool(sync_engine, label)
+    instrument_engine(sync_engine)
+
 
 # Create the SQLAlchemy engine
-# The pool_pre_ping argument ensures that the connection is alive before being used.
 engine = create_engine(
-    settings.DATABASE_URL, 
-    pool_pre_ping=True,
-    pool_size=5,  # Adjust based on your expected load
-    max_overflow=10,  # Allow temporary connections above the pool_size
-    use_insertmanyvalues=False,
+    settings.DATABASE_URL,
+    **engine_options(is_async=False, label="primary"),
+    # Left at SQLAlchemy's default (enabled): multi-row INSERT .. RETURNING is
+    # batched into a few statements instead of one round-trip per row, both for
+    # ORM flushes and for the bulk log ingestion path.
+    use_insertmanyvalues=True,
+)
+configure_engine(engine, "primary")
+
+# Dedicated LISTEN connections (activity stream) need a real session, which a
+# transaction-pooling PgBouncer cannot provide; DATABASE_LISTEN_URL bypasses it.
+listen_engine = (
+    create_engine(settings.DATABASE_LISTEN_URL, poolclass=NullPool)
+    if settings.DATABASE_LISTEN_URL else engine
 )
 
 
 
+class RoutingSession(Session):
+    """
+    Session that can read from a replica. Given a replica_bind, plain SELECTs go
+    there; the first statement that is anything else (a flush, INSERT/UPDATE/DELETE,
+    SELECT .. FOR UPDATE, text(), or an explicit connection()) pins the session to
+    the primary for the rest of its life, so reads after a write (e.g. db.refresh
+    after commit) see it. A SELECT with execution_options(read_primary=True) reads
+    from the primary without pinning. Without a replica_bind it is a plain Session.
+    """
+
+    def __init__(self, *args, replica_bind: Optional[Engine] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replica_bind = replica_bind
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self.replica_bind is not None:
+            if (
+                isinstance(clause, (Select, CompoundSelect))
+                and getattr(clause, "_for_update_arg", None) is None
+                and not self._flushing
+            ):
+                if clause.get_execution_options().get("read_primary"):
+                    return super().get_bind(mapper, clause=clause, **kw)
+                return self.replica_bind
+            self.replica_bind = None
+        return super().get_bind(mapper, clause=clause, **kw)
+
+
+def pin_primary(db: Union[Session, AsyncSession]) -> None:
+    """
+    Sends every further statement of this session to the primary, for reads that
+    must not lag behind (e.g. right after another request's write).
+    """
+    session = db.sync_session if isinstance(db, AsyncSession) else db
+    if isinstance(session, RoutingSession):
+        session.replica_bind = None
+
+
 # Create a session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False, bind=engine)
+
+
+def to_async_url(url: str) -> str:
+    """Swaps the driver of a Postgres URL for asyncpg."""
+    return make_url(url).set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+
+
+def get_async_database_url() -> str:
+    """
+    Returns the URL for the async engine: ASYNC_DATABASE_URL if set, otherwise
+    DATABASE_URL with its driver swapped for asyncpg.
+    """
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+    return to_async_url(settings.DATABASE_URL)
+
+
+# The async engine is only created when DB_ASYNC_ENABLED is set, so asyncpg
+# is not needed by deployments that stay on the sync stack.
+async_engine = None
+AsyncSessionLocal = None
+if settings.DB_ASYNC_ENABLED:
+    async_engine = create_async_engine(
+        get_async_database_url(),
+        **engine_options(is_async=True, label="primary-async"),
+    )
+    configure_engine(async_engine.sync_engine, "primary-async")
+    # expire_on_commit=False: attributes must stay readable after commit, since
+    # lazy refreshes are not possible outside of an awaitable context.
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine, sync_session_class=RoutingSession, autoflush=False, expire_on_commit=False
+    )
+
+
+def create_replica(index: int, url: str) -> Replica:
+    """Builds the engines of one read replica, pooled and instrumented like the primary's."""
+    name = f"replica-{index}"
+    replica_engine = create_engine(url, **engine_options(is_async=False, label=name))
+    configure_engine(replica_engine, name)
+    replica_async_engine = None
+    if settings.DB_ASYNC_ENABLED:
+        replica_async_engine = create_async_engine(
+            to_async_url(url), **engine_options(is_async=True, label=f"{name}-async")
+        )
+        configure_engine(replica_async_engine.sync_engine, f"{name}-async")
+    return Replica(name, replica_engine, replica_async_engine)
+
+
+replica_set = ReplicaSet(
+    [
+        create_replica(index, url.strip())
+        for index, url in enumerate((settings.DATABASE_REPLICA_URLS or "").split(","))
+        if url.strip()
+    ],
+    max_lag_seconds=settings.DB_REPLICA_MAX_LAG_SECONDS,
+)
+
+
+def start_replica_health_checks() -> Optional[ReplicaHealthChecker]:
+    """
+    Starts this worker's replica health checks. Returns the thread (call .stop()
+    on shutdown), or None when no DATABASE_REPLICA_URLS are configured.
+    """
+    if not replica_set:
+        return None
+    checker = ReplicaHealthChecker(replica_set, settings.DB_REPLICA_CHECK_SECONDS)
+    checker.start()
+    return checker
+
+
+# Methods whose handlers only read; they may start on a replica.
+READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def pick_read_replica(request: Request) -> Optional[Replica]:
+    """The replica to serve this request's reads from, or None for the primary."""
+    if not replica_set or request.method not in READ_ONLY_METHODS:
+        return None
+    replica = replica_set.pick()
+    metrics.DB_READ_SESSIONS.labels(replica.name if replica else "primary").inc()
+    return replica
 
 # Base class for our ORM models
 Base = declarative_base()
 
 # Dependency for getting a DB session in path operations
-def get_db():
+def get_db(request: Request):
     """
     FastAPI dependency that provides a SQLAlchemy database session per request.
     It ensures the session is always closed after the request is finished.
+    Read-only requests read from a replica when one is configured and healthy.
     """
-    db = SessionLocal()
+    replica = pick_read_replica(request)
+    db = SessionLocal(replica_bind=replica.engine if replica else None)
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db(request: Request):
+    """
+    FastAPI dependency that provides an AsyncSession per request, or None while
+    DB_ASYNC_ENABLED is off. Routed to replicas like get_db.
+    """
+    if not settings.DB_ASYNC_ENABLED:
+        yield None
+        return
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Async database access is disabled. Set DB_ASYNC_ENABLED=1 to enable it.")
+    replica = pick_read_replica(request)
+    async with AsyncSessionLocal(replica_bind=replica.async_engine.sync_engine if replica else None) as db:
+        yield db
@@ -0,0 +1,28 @@
+# app/core/etag.py
+# Strong ETags computed from cheap "version" aggregates instead of response bodies.
+
+import hashlib
+from typing import Any, Optional
+
+# Bump when the serialized shape of an ETag-protected response changes, so
+# clients holding an old representation don't get a 304 for it.
+REPRESENTATION_VERSION = "3"
+
+
+def compute_etag(*parts: Any) -> str:
+    """
+    Hashes the request identity (path, query) and a fingerprint of the data into a
+    quoted strong ETag. The fingerprint must change whenever the response would.
+    """
+    raw = "|".join([REPRESENTATION_VERSION, *(repr(part) for part in parts)])
+    return '"' + hashlib.sha256(raw.encode()).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match uses the weak comparison (RFC 9110 13.1.2): W/ prefixes are ignored."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
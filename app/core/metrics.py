@@ -0,0 +1,198 @@
+# app/core/metrics.py
+# Prometheus metrics: request latency and per-request SQL cost, by route template.
+
+import os
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram, generate_latest
+from prometheus_client import multiprocess
+
+registry = CollectorRegistry()
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Request latency.",
+    ["method", "route", "status"],
+    registry=registry,
+)
+REQUEST_DB_QUERIES = Histogram(
+    "http_request_db_queries",
+    "SQL statements executed per request.",
+    ["route"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, float("inf")),
+    registry=registry,
+)
+REQUEST_DB_SECONDS = Histogram(
+    "http_request_db_seconds",
+    "Time spent executing SQL per request.",
+    ["route"],
+    registry=registry,
+)
+REQUEST_POOL_WAIT_SECONDS = Histogram(
+    "http_request_db_pool_wait_seconds",
+    "Time spent waiting for a pooled DB connection per request.",
+    ["route"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, float("inf")),
+    registry=registry,
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Connections currently checked out of the pool.",
+    ["pool"],
+    registry=registry,
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "Connections open beyond pool_size.",
+    ["pool"],
+    registry=registry,
+    multiprocess_mode="livesum",
+)
+DB_POOL_WAIT_SECONDS = Histogram(
+    "db_pool_wait_seconds",
+    "Time each checkout waited for a connection (with NullPool: time to connect).",
+    ["pool"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, float("inf")),
+    registry=registry,
+)
+DB_POOL_TIMEOUTS = Counter(
+    "db_pool_timeouts_total",
+    "Checkouts that gave up after DB_POOL_TIMEOUT seconds.",
+    ["pool"],
+    registry=registry,
+)
+DB_REPLICA_HEALTHY = Gauge(
+    "db_replica_healthy",
+    "1 while the read replica passes its health and lag check (0 if any worker disagrees).",
+    ["replica"],
+    registry=registry,
+    multiprocess_mode="livemin",
+)
+DB_READ_SESSIONS = Counter(
+    "db_read_sessions_total",
+    "Sessions of read-only requests, by the database they were routed to.",
+    ["target"],
+    registry=registry,
+)
+AUTH_CACHE_LOOKUPS = Counter(
+    "auth_cache_lookups_total",
+    "Auth cache lookups by outcome (local_hit, redis_hit, miss).",
+    ["result"],
+    registry=registry,
+)
+TOKEN_CACHE_LOOKUPS = Counter(
+    "auth_token_cache_lookups_total",
+    "Verified-token cache lookups by outcome (hit, miss, revoked).",
+    ["result"],
+    registry=registry,
+)
+PASSWORD_POOL_IN_FLIGHT = Gauge(
+    "password_pool_in_flight",
+    "Password hash/verify calls running or queued in the bcrypt process pool.",
+    registry=registry,
+    multiprocess_mode="livesum",
+)
+PASSWORD_POOL_SECONDS = Histogram(
+    "password_pool_seconds",
+    "Time from submitting a password hash/verify call to its result, queueing included.",
+    ["operation"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, float("inf")),
+    registry=registry,
+)
+PASSWORD_POOL_REJECTED = Counter(
+    "password_pool_rejected_total",
+    "Password hash/verify calls turned away with a 503 because the pool queue was full.",
+    ["operation"],
+    registry=registry,
+)
+
+
+class RequestDBStats:
+    """SQL cost of the current request. Shared (not copied) with the threadpool running sync handlers."""
+    __slots__ = ("queries", "db_seconds", "pool_wait_seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.pool_wait_seconds = 0.0
+
+
+_request_stats: ContextVar[Optional[RequestDBStats]] = ContextVar("request_db_stats", default=None)
+
+
+def record_query(seconds: float) -> None:
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_seconds += seconds
+
+
+def record_pool_wait(seconds: float) -> None:
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.pool_wait_seconds += seconds
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """
+    The exposition payload and its content type. With PROMETHEUS_MULTIPROC_DIR set
+    (several workers), the samples of every worker process are aggregated.
+    """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        aggregated = CollectorRegistry()
+        multiprocess.MultiProcessCollector(aggregated)
+        return generate_latest(aggregated), CONTENT_TYPE_LATEST
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def route_template(scope) -> str:
+    """The matched route's path template, e.g. /api/v1/clients/{client_id}; "unmatched" for 404s."""
+    path = getattr(scope.get("route"), "path", None)
+    if path is None:
+        return "unmatched"
+    # Newer FastAPI resolves included routers lazily: the matched route keeps its own
+    # path and the accumulated prefix lives on the include context.
+    fastapi_scope = scope.get("fastapi")
+    included = fastapi_scope.get("included_router") if isinstance(fastapi_scope, dict) else None
+    prefix = getattr(getattr(included, "include_context", None), "prefix", "")
+    return prefix + path
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware timing each HTTP request and collecting the SQL statements
+    it runs (see the engine hooks in app.core.database), labelled by route template.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestDBStats()
+        token = _request_stats.set(stats)
+        status = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _request_stats.reset(token)
+            # Templates, not raw paths, keep the label cardinality bounded.
+            template = route_template(scope)
+            REQUEST_LATENCY.labels(scope["method"], template, str(status)).observe(time.perf_counter() - started)
+            REQUEST_DB_QUERIES.labels(template).observe(stats.queries)
+            REQUEST_DB_SECONDS.labels(template).observe(stats.db_seconds)
+            REQUEST_POOL_WAIT_SECONDS.labels(template).observe(stats.pool_wait_seconds)
@@ -0,0 +1,74 @@
+# app/core/pagination.py
+# Opaque keyset (cursor) pagination over (timestamp, id) sort keys, and over
+# (rank, name, id) keys for ranked search results.
+
+import base64
+import json
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import tuple_
+
+from app.domain.errors import InvalidCursor
+
+
+def _encode(values: list) -> str:
+    raw = json.dumps(values, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode(cursor: str) -> list:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded.encode()))
+
+
+def encode_cursor(timestamp: datetime, row_id: int) -> str:
+    """Encodes the sort key of the last row on a page into an opaque, URL-safe token."""
+    return _encode([timestamp.isoformat(), row_id])
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decodes a token produced by encode_cursor. Raises InvalidCursor on garbage input."""
+    try:
+        timestamp, row_id = _decode(cursor)
+        return datetime.fromisoformat(timestamp), int(row_id)
+    except (ValueError, TypeError):
+        raise InvalidCursor("Invalid pagination cursor")
+
+
+def encode_rank_cursor(rank: Decimal, name: str, row_id: uuid.UUID) -> str:
+    """Cursor for ranked search results. The rank is kept as an exact decimal string."""
+    return _encode([str(rank), name, str(row_id)])
+
+
+def decode_rank_cursor(cursor: str) -> Tuple[Decimal, str, uuid.UUID]:
+    """Decodes a token produced by encode_rank_cursor. Raises InvalidCursor on garbage input."""
+    try:
+        rank, name, row_id = _decode(cursor)
+        return Decimal(rank), str(name), uuid.UUID(row_id)
+    except (ValueError, TypeError, ArithmeticError):
+        raise InvalidCursor("Invalid pagination cursor")
+
+
+def keyset_page(stmt, *, sort_column, id_column, cursor: Optional[str], limit: int):
+    """
+    Orders `stmt` newest-first by (sort_column, id_column) and, when a cursor is given,
+    seeks past it with a row-value comparison the composite (.., sort, id) index can serve.
+    Fetches one extra row so the caller can tell whether another page exists.
+    """
+    if cursor:
+        timestamp, row_id = decode_cursor(cursor)
+        stmt = stmt.where(tuple_(sort_column, id_column) < tuple_(timestamp, row_id))
+    return stmt.order_by(sort_column.desc(), id_column.desc()).limit(limit + 1)
+
+
+def build_page(rows: List[Any], *, sort_attr: str, limit: int) -> dict:
+    """Trims the look-ahead row from a keyset_page result and computes next_cursor."""
+    items = list(rows[:limit])
+    next_cursor = None
+    if len(rows) > limit and items:
+        last = items[-1]
+        next_cursor = encode_cursor(getattr(last, sort_attr), last.id)
+    return {"items": items, "next_cursor": next_cursor}
@@ -0,0 +1,91 @@
+# app/core/password_pool.py
+# Runs bcrypt in a small, bounded process pool so login bursts cannot tie up the request threadpool.
+
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+from app.core import security
+from app.core.config import settings
+from app.core.metrics import PASSWORD_POOL_IN_FLIGHT, PASSWORD_POOL_REJECTED, PASSWORD_POOL_SECONDS
+
+
+class PasswordPoolFull(Exception):
+    """Too many password hash/verify calls are already running or queued; answered with a 503."""
+
+
+class PasswordPool:
+    """
+    bcrypt hashing and verification on `workers` separate processes, so the work
+    neither holds the GIL nor piles up unboundedly. Callers (sync services on the
+    request threadpool) block until their result, but at most workers + max_queue
+    calls are admitted at a time; the rest fail fast with PasswordPoolFull, so a
+    login storm can only occupy that many request threads.
+    """
+
+    def __init__(self, workers: int, max_queue: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+
+    def hash(self, password: str) -> str:
+        return self._run("hash", security.get_password_hash, password)
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return self._run("verify", security.verify_password, plain_password, hashed_password)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, operation: str, fn: Callable[..., Any], *args: Any) -> Any:
+        if self.workers <= 0:
+            return fn(*args)
+
+        with self._lock:
+            if self._in_flight >= self.workers + self.max_queue:
+                PASSWORD_POOL_REJECTED.labels(operation).inc()
+                raise PasswordPoolFull("Too many concurrent password operations; retry shortly.")
+            self._in_flight += 1
+        PASSWORD_POOL_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            executor = self._get_executor()
+            try:
+                return executor.submit(fn, *args).result()
+            except BrokenProcessPool:
+                # A worker process died (e.g. OOM-killed); start a fresh pool and retry once.
+                self._discard(executor)
+                return self._get_executor().submit(fn, *args).result()
+        finally:
+            PASSWORD_POOL_SECONDS.labels(operation).observe(time.perf_counter() - started)
+            PASSWORD_POOL_IN_FLIGHT.dec()
+            with self._lock:
+                self._in_flight -= 1
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                # Started lazily, and with spawn: the app process already runs threads
+                # (cache and activity listeners) that forking would copy half-way.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _discard(self, executor: Executor) -> None:
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False)
+
+
+password_pool = PasswordPool(workers=settings.PASSWORD_HASH_WORKERS, max_queue=settings.PASSWORD_HASH_MAX_QUEUE)
@@ -0,0 +1,121 @@
+# app/core/replicas.py
+# Read replicas: round-robin selection among the replicas that pass their health
+# check, and the per-worker thread that runs those checks.
+
+import itertools
+import logging
+import threading
+from typing import Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+# Seconds the replica is behind the primary. 0 when it has replayed everything it
+# received (an idle primary sends nothing, so the replay timestamp alone would
+# grow forever) or when it is not a standby at all; NULL if it never replayed.
+LAG_SQL = text(
+    "SELECT CASE"
+    " WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+    " ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())"
+    " END"
+)
+
+
+class Replica:
+    """One replica: its sync engine, its async engine (when DB_ASYNC_ENABLED) and its health."""
+
+    def __init__(self, name: str, engine: Engine, async_engine: Optional[AsyncEngine] = None):
+        self.name = name
+        self.engine = engine
+        self.async_engine = async_engine
+        # Unproven until the first health check passes; reads go to the primary meanwhile.
+        self.healthy = False
+        self.lag_seconds: Optional[float] = None
+
+
+class ReplicaSet:
+    def __init__(self, replicas: list[Replica], max_lag_seconds: float):
+        self.replicas = replicas
+        self.max_lag_seconds = max_lag_seconds
+        self._turn = itertools.count()
+        for replica in replicas:
+            self._watch_errors(replica)
+
+    def __bool__(self) -> bool:
+        return bool(self.replicas)
+
+    def pick(self) -> Optional[Replica]:
+        """The next healthy replica in round-robin order, or None to read from the primary."""
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return None
+        return healthy[next(self._turn) % len(healthy)]
+
+    def mark_down(self, replica: Replica) -> None:
+        """Takes the replica out of rotation until its next passing health check."""
+        if replica.healthy:
+            logger.warning("Read replica %s is unavailable; reading from the primary instead", replica.name)
+        replica.healthy = False
+        metrics.DB_REPLICA_HEALTHY.labels(replica.name).set(0)
+
+    def check(self) -> None:
+        """Runs the health check of every replica once."""
+        for replica in self.replicas:
+            try:
+                lag = self.measure_lag(replica)
+            except Exception:
+                self.mark_down(replica)
+                continue
+            replica.lag_seconds = lag
+            if lag is None or lag > self.max_lag_seconds:
+                if replica.healthy:
+                    logger.warning("Read replica %s is lagging (%s s); reading from the primary instead", replica.name, lag)
+                replica.healthy = False
+            else:
+                if not replica.healthy:
+                    logger.info("Read replica %s is back in rotation", replica.name)
+                replica.healthy = True
+            metrics.DB_REPLICA_HEALTHY.labels(replica.name).set(int(replica.healthy))
+
+    @staticmethod
+    def measure_lag(replica: Replica) -> Optional[float]:
+        with replica.engine.connect() as conn:
+            lag = conn.execute(LAG_SQL).scalar()
+        return None if lag is None else float(lag)
+
+    def _watch_errors(self, replica: Replica) -> None:
+        # Requests that hit a dead replica fail, but the ones after them skip it
+        # without waiting for the next health check.
+        def _on_error(exception_context):
+            if exception_context.is_disconnect or exception_context.connection is None:
+                self.mark_down(replica)
+
+        engines = [replica.engine] + ([replica.async_engine.sync_engine] if replica.async_engine else [])
+        for engine in engines:
+            event.listen(engine, "handle_error", _on_error)
+
+
+class ReplicaHealthChecker(threading.Thread):
+    """Re-checks every replica each `interval` seconds, starting right away."""
+
+    def __init__(self, replica_set: ReplicaSet, interval: float):
+        super().__init__(name="replica-health", daemon=True)
+        self.replica_set = replica_set
+        self.interval = interval
+        self._stopped = threading.Event()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                self.replica_set.check()
+            except Exception:
+                logger.exception("Read replica health check failed")
+            self._stopped.wait(self.interval)
@@ -0,0 +1,210 @@
+# app/core/responses.py
+# Opt-in orjson responses for hot list endpoints that skip per-row response validation.
+
+import operator
+import types
+import typing
+from decimal import Decimal
+from typing import Any, Callable, Mapping, NamedTuple, Optional
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+
+from app.core.config import settings
+
+
+def _default(value: Any) -> Any:
+    # Pydantic writes Decimals as JSON strings using str().
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """orjson encoding matching pydantic's JSON mode (UTC as "Z", Decimal as string)."""
+    return orjson.dumps(content, default=_default, option=orjson.OPT_UTC_Z)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class _Converter(NamedTuple):
+    """Per-annotation conversions; None means the value passes through unchanged."""
+    view: Optional[Callable[[Any], Any]]  # source value -> the value pydantic holds after validation
+    dump: Optional[Callable[[Any], Any]]  # validated value -> JSON-ready value
+    direct: Optional[Callable[[Any], Any]]  # source value -> JSON-ready value
+
+
+_PASSTHROUGH = _Converter(None, None, None)
+_MISSING = object()
+
+
+def _optional(fn: Optional[Callable[[Any], Any]]) -> Optional[Callable[[Any], Any]]:
+    return None if fn is None else (lambda value: None if value is None else fn(value))
+
+
+def _each(fn: Optional[Callable[[Any], Any]]) -> Optional[Callable[[Any], Any]]:
+    return None if fn is None else (lambda values: [fn(value) for value in values])
+
+
+def _converter(annotation: Any) -> _Converter:
+    origin = typing.get_origin(annotation)
+    if origin in (typing.Union, types.UnionType):
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            raise TypeError(f"FastSerializer does not support union {annotation!r}")
+        return _Converter(*(_optional(fn) for fn in _converter(args[0])))
+    if origin in (list, typing.List):
+        (arg,) = typing.get_args(annotation) or (Any,)
+        return _Converter(*(_each(fn) for fn in _converter(arg)))
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        plan = _plan(annotation)
+        return _Converter(plan.view, plan.dump, plan.serialize)
+    if annotation is float:
+        to_float = lambda value: value if type(value) is float else float(value)
+        return _Converter(to_float, None, to_float)
+    if annotation is int:
+        to_int = lambda value: value if type(value) is int else int(value)
+        return _Converter(to_int, None, to_int)
+    return _PASSTHROUGH
+
+
+class _ModelPlan:
+    """How to read one model's fields from a trusted object and write them out as pydantic would."""
+
+    def __init__(self, model: type[BaseModel]):
+        decorators = model.__pydantic_decorators__
+        if decorators.validators or decorators.field_validators or decorators.model_validators \
+                or decorators.field_serializers or decorators.model_serializers:
+            raise TypeError(f"FastSerializer does not support validators or serializers ({model.__name__})")
+
+        self.model = model
+        self.fields = []
+        for name, field in model.model_fields.items():
+            alias = field.validation_alias
+            if alias is not None and not isinstance(alias, str):
+                raise TypeError(f"FastSerializer does not support alias choices ({model.__name__}.{name})")
+            # Trusted sources carry attribute names, so the generated camelCase alias
+            # only comes second; an explicit validation alias (e.g. "id") comes first.
+            sources = (alias, name) if alias and alias != field.alias else (name, alias or name)
+            default = field.get_default(call_default_factory=True) if not field.is_required() else PydanticUndefined
+            output = None if field.exclude else (field.serialization_alias or field.alias or name)
+            self.fields.append((name, sources, default, _converter(field.annotation), output))
+
+        self.computed = []
+        for name, info in model.model_computed_fields.items():
+            # The property returns validated values (models included), so they only need dumping.
+            self.computed.append((name, info.alias or name, _converter(info.return_type).dump))
+
+        # Computed properties run against a plain object holding the validated field
+        # values, like they would on the model, so they cannot see other ORM attributes.
+        self.view_cls = type(
+            f"{model.__name__}View",
+            (types.SimpleNamespace,),
+            {name: info.wrapped_property for name, info in model.model_computed_fields.items()},
+        )
+
+        # Without computed fields no view is needed: output fields are read in one
+        # C-level attrgetter call and only the ones needing conversion are touched.
+        outputs = [(sources[0], output, conv.direct) for _, sources, _, conv, output in self.fields if output]
+        self._direct = not self.computed and bool(outputs)
+        if self._direct:
+            self._keys = [output for _, output, _ in outputs]
+            self._getter = operator.attrgetter(*(source for source, _, _ in outputs))
+            self._single = len(outputs) == 1
+            self._conversions = [(output, direct) for _, output, direct in outputs if direct]
+
+    def _read(self, obj: Any, is_mapping: bool, sources: tuple[str, str], default: Any) -> Any:
+        first, second = sources
+        if is_mapping:
+            value = obj.get(first, _MISSING)
+            if value is _MISSING:
+                value = obj.get(second, default)
+        else:
+            value = getattr(obj, first, _MISSING)
+            if value is _MISSING:
+                value = getattr(obj, second, default)
+        if value is PydanticUndefined:
+            raise AttributeError(f"{type(obj).__name__} has no attribute {first!r}")
+        return value
+
+    def view(self, obj: Any) -> Any:
+        if isinstance(obj, (self.view_cls, self.model)):
+            return obj
+        is_mapping = isinstance(obj, Mapping)
+        values = {}
+        for name, sources, default, conv, _ in self.fields:
+            value = self._read(obj, is_mapping, sources, default)
+            values[name] = conv.view(value) if conv.view else value
+        return self.view_cls(**values)
+
+    def dump(self, view: Any) -> dict:
+        out = {}
+        for name, _, _, conv, output in self.fields:
+            if output is not None:
+                value = getattr(view, name)
+                out[output] = conv.dump(value) if conv.dump else value
+        for name, output, dump in self.computed:
+            value = getattr(view, name)
+            out[output] = dump(value) if dump else value
+        return out
+
+    def serialize(self, obj: Any) -> dict:
+        if self._direct and not isinstance(obj, Mapping):
+            try:
+                values = self._getter(obj)
+            except AttributeError:
+                # Defaults or second-choice names are needed; take the general path.
+                return self.dump(self.view(obj))
+            out = dict(zip(self._keys, (values,) if self._single else values))
+            for output, direct in self._conversions:
+                out[output] = direct(out[output])
+            return out
+        return self.dump(self.view(obj))
+
+
+_plans: dict[type, _ModelPlan] = {}
+
+
+def _plan(model: type[BaseModel]) -> _ModelPlan:
+    plan = _plans.get(model)
+    if plan is None:
+        plan = _plans[model] = _ModelPlan(model)
+    return plan
+
+
+class FastSerializer:
+    """
+    Serializes already-trusted data (ORM objects, SQLAlchemy rows, service dicts) in
+    the shape of a response model without validating it first. The output is the
+    same camelCase JSON FastAPI produces through the model, byte for byte, except
+    that floats of 1e16 and above are written as 1e16 rather than 1e+16.
+
+    Built once per model at import; unsupported models (validators, custom
+    serializers, multi-type unions) are rejected there rather than per request.
+    """
+
+    def __init__(self, model: type[BaseModel]):
+        self.model = model
+        self._plan = _plan(model)
+
+    def dump(self, data: Any) -> Any:
+        """JSON-ready dict for one object, or a list of them for a list or tuple."""
+        if isinstance(data, (list, tuple)):
+            return [self._plan.serialize(obj) for obj in data]
+        return self._plan.serialize(data)
+
+    def response(self, data: Any, headers: Optional[Mapping[str, str]] = None) -> Any:
+        """
+        A FastJSONResponse for `data` when FAST_JSON_RESPONSES is on. Otherwise `data`
+        is returned unchanged and goes through the route's response_model as usual.
+        """
+        if not settings.FAST_JSON_RESPONSES:
+            return data
+        return FastJSONResponse(self.dump(data), headers=dict(headers) if headers else None)
@@ -23,10 +23,18 @@ def create_access_token(subject: Union[str, Any], expires_delta: timedelta = Non
     else:
         expire = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     
-    to_encode = {"exp": expire, "sub": str(subject)}
+    # iat lets revocations (see app.cache.auth_cache.revoke_tokens) cut off older tokens.
+    to_encode = {"exp": expire, "iat": datetime.now(timezone.utc), "sub": str(subject)}
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+def decode_access_token(token: str) -> dict:
+    """
+    Verifies the token's signature and exp and returns its claims.
+    Raises JWTError when the token is invalid.
+    """
+    return jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verifies a plain password against its hashed version.
@@ -1,3 +1,6 @@
+import numpy as np
+from typing import Iterable, List, NamedTuple, Sequence
+
 # The "source of truth" for all unit conversions, kept in the backend.
 UNIT_DICTIONARY = {
     # Mass Units
@@ -43,4 +46,110 @@ def calculate_nutrition(food_item, serving_size: float, serving_unit: str) -> di
         "protein_g": float(getattr(food_item, "protein_per_100g", None) or 0) * multiplier,
         "carbs_g": float(getattr(food_item, "carbs_per_100g", None) or 0) * multiplier,
         "fat_g": float(getattr(food_item, "fat_per_100g", None) or 0) * multiplier,
-    }
\ No newline at end of file
+    }
+
+NUTRIENT_KEYS = ("calories", "protein_g", "carbs_g", "fat_g")
+
+
+def summarize_nutrition(items) -> dict:
+    """
+    Per-meal and whole-plan macro totals from (meal_name, nutrition) pairs.
+    Meals are listed in the order they first appear.
+    """
+    meals = {}
+    total = dict.fromkeys(NUTRIENT_KEYS, 0.0)
+    for meal_name, nutrition in items:
+        meal = meals.setdefault(meal_name, {"meal_name": meal_name, **dict.fromkeys(NUTRIENT_KEYS, 0.0)})
+        for key in NUTRIENT_KEYS:
+            value = float(nutrition.get(key) or 0)
+            meal[key] += value
+            total[key] += value
+    return {"meals": list(meals.values()), "total": total}
+
+
+# --- Batch (vectorized) calculation ---
+# UNIT_DICTIONARY precompiled to dense indices; index 0 is "unknown unit".
+UNKNOWN_UNIT, MASS_UNIT, VOLUME_UNIT = 0, 1, 2
+UNIT_INDEX = {unit: index for index, unit in enumerate(UNIT_DICTIONARY, start=1)}
+_UNIT_KIND = np.array(
+    [UNKNOWN_UNIT] + [MASS_UNIT if info["type"] == "MASS" else VOLUME_UNIT for info in UNIT_DICTIONARY.values()],
+    dtype=np.int8,
+)
+_UNIT_FACTOR = np.array(
+    [0.0] + [info.get("to_base_grams", info.get("to_base_ml")) for info in UNIT_DICTIONARY.values()],
+    dtype=np.float64,
+)
+
+
+def unit_indices(serving_units: Iterable[str]) -> np.ndarray:
+    """Maps unit names (case-insensitive, None meaning grams) to UNIT_INDEX entries."""
+    lookup = UNIT_INDEX.get
+    return np.array(
+        [lookup(unit) or lookup((unit or "g").lower(), UNKNOWN_UNIT) for unit in serving_units],
+        dtype=np.intp,
+    )
+
+
+class FoodMacros(NamedTuple):
+    """Column arrays of per-100g food data, one entry per item being calculated."""
+    calories_per_100g: np.ndarray
+    protein_per_100g: np.ndarray
+    carbs_per_100g: np.ndarray
+    fat_per_100g: np.ndarray
+    grams_per_ml: np.ndarray
+    is_volume: np.ndarray
+
+    @classmethod
+    def from_items(cls, food_items: Sequence) -> "FoodMacros":
+        def column(attr):
+            return np.fromiter((float(getattr(f, attr, None) or 0) for f in food_items), dtype=np.float64, count=len(food_items))
+
+        return cls(
+            calories_per_100g=column("calories_per_100g"),
+            protein_per_100g=column("protein_per_100g"),
+            carbs_per_100g=column("carbs_per_100g"),
+            fat_per_100g=column("fat_per_100g"),
+            grams_per_ml=column("grams_per_ml"),
+            is_volume=np.fromiter((getattr(f, "base_unit_type", None) == "VOLUME" for f in food_items), dtype=bool, count=len(food_items)),
+        )
+
+
+def calculate_nutrition_batch(foods: FoodMacros, serving_sizes: np.ndarray, units: np.ndarray) -> dict:
+    """
+    Vectorized calculate_nutrition: one pass over aligned arrays of foods, serving
+    sizes and unit indices (see unit_indices). Returns an array per NUTRIENT_KEYS entry.
+    Same rules as the scalar version: unknown units, and volume servings of foods
+    without a density, give zero.
+    """
+    kind = _UNIT_KIND[units]
+    total = serving_sizes * _UNIT_FACTOR[units]
+    volume_ok = (kind == VOLUME_UNIT) & foods.is_volume & (foods.grams_per_ml != 0)
+    total_grams = np.where(kind == MASS_UNIT, total, np.where(volume_ok, total * foods.grams_per_ml, 0.0))
+    multiplier = total_grams / 100.0
+    return {
+        "calories": foods.calories_per_100g * multiplier,
+        "protein_g": foods.protein_per_100g * multiplier,
+        "carbs_g": foods.carbs_per_100g * multiplier,
+        "fat_g": foods.fat_per_100g * multiplier,
+    }
+
+
+def calculate_nutrition_many(food_items: Sequence, serving_sizes: Sequence[float], serving_units: Sequence[str]) -> List[dict]:
+    """calculate_nutrition over aligned sequences, returning one plain-float dict per item."""
+    if not food_items:
+        return []
+    # Plans repeat the same food objects a lot; build their columns once and gather.
+    identities = np.fromiter(map(id, food_items), dtype=np.uintp, count=len(food_items))
+    _, first_seen, food_index = np.unique(identities, return_index=True, return_inverse=True)
+    unique_foods = FoodMacros.from_items([food_items[i] for i in first_seen.tolist()])
+    foods = FoodMacros(*(column[food_index] for column in unique_foods))
+
+    columns = calculate_nutrition_batch(
+        foods,
+        np.asarray(serving_sizes, dtype=np.float64),
+        unit_indices(serving_units),
+    )
+    return [
+        {"calories": calories, "protein_g": protein_g, "carbs_g": carbs_g, "fat_g": fat_g}
+        for calories, protein_g, carbs_g, fat_g in zip(*(columns[key].tolist() for key in NUTRIENT_KEYS))
+    ]
@@ -1,7 +1,9 @@
 # app/domain/authorization/client_access.py
 
 import uuid
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.client import Client
 from app.models.user import User
 from app.domain.errors import OwnershipViolation, ResourceNotFound
@@ -12,6 +14,19 @@ def assert_trainer_owns_client(client: Client, trainer_id: uuid.UUID) -> None:
         raise OwnershipViolation("Trainer does not own this client")
 
 
+def _live_client_stmt(client_id: uuid.UUID):
+    return select(Client).where(
+        Client.id == client_id,
+        Client.deleted_at.is_(None),
+    )
+
+
+def _assert_client_viewer(client_id: uuid.UUID, current_user: User) -> None:
+    """Checks a client-role user is viewing their own profile."""
+    if not current_user.client_profile or current_user.client_profile.id != client_id:
+        raise OwnershipViolation("Not authorized to view this client's data.")
+
+
 def get_client_for_trainer(
     db: Session,
     *,
@@ -45,8 +60,7 @@ def get_client_for_viewer(
     if current_user.user_role == "trainer":
         return get_client_for_trainer(db, client_id=client_id, trainer_id=current_user.id)
     elif current_user.user_role == "client":
-        if not current_user.client_profile or current_user.client_profile.id != client_id:
-            raise OwnershipViolation("Not authorized to view this client's data.")
+        _assert_client_viewer(client_id, current_user)
         client = db.query(Client).filter(
             Client.id == client_id,
             Client.deleted_at.is_(None),
@@ -57,3 +71,37 @@ def get_client_for_viewer(
     else:
         raise OwnershipViolation("User role not authorized.")
 
+
+async def get_client_for_trainer_async(
+    db: AsyncSession,
+    *,
+    client_id: uuid.UUID,
+    trainer_id: uuid.UUID,
+) -> Client:
+    """AsyncSession counterpart of get_client_for_trainer."""
+    client = (await db.scalars(_live_client_stmt(client_id))).first()
+
+    if not client:
+        raise ResourceNotFound("Client not found")
+
+    assert_trainer_owns_client(client, trainer_id)
+    return client
+
+
+async def get_client_for_viewer_async(
+    db: AsyncSession,
+    *,
+    client_id: uuid.UUID,
+    current_user: User,
+) -> Client:
+    """AsyncSession counterpart of get_client_for_viewer, with the same rules."""
+    if current_user.user_role == "trainer":
+        return await get_client_for_trainer_async(db, client_id=client_id, trainer_id=current_user.id)
+    elif current_user.user_role == "client":
+        _assert_client_viewer(client_id, current_user)
+        client = (await db.scalars(_live_client_stmt(client_id))).first()
+        if not client:
+            raise ResourceNotFound("Client not found")
+        return client
+    else:
+        raise OwnershipViolation("User role not authorized.")
@@ -0,0 +1,48 @@
+# app/domain/checkin_series.py
+# Pure bucketing rules for the check-in rollups, shared by the write path and the series reads.
+
+from datetime import date, datetime, timedelta, timezone
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Literal, Optional, get_args
+
+Granularity = Literal["day", "week", "month"]
+GRANULARITIES: tuple[str, ...] = get_args(Granularity)
+
+WEIGHT_METRIC = "weight_kg"
+MEASUREMENT_PREFIX = "measurements."
+# checkins.weight_kg is numeric(6,2), which Postgres rounds half away from zero.
+WEIGHT_QUANTUM = Decimal("0.01")
+
+
+def bucket_start(day: date, granularity: str) -> date:
+    """First day of the bucket holding `day`: the day itself, its ISO week's Monday, or the 1st of its month."""
+    if granularity == "day":
+        return day
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    raise ValueError(f"Unknown granularity {granularity!r}")
+
+
+def bucket_day(checked_in_at: datetime) -> date:
+    """Buckets are UTC calendar days, like date_trunc on the stored timestamps."""
+    return checked_in_at.astimezone(timezone.utc).date()
+
+
+def checkin_metrics(weight_kg: Optional[Decimal], measurements: Any) -> dict[str, Decimal]:
+    """
+    The numeric series a check-in contributes to: weight_kg, plus one
+    "measurements.<key>" metric per numeric value of the measurements object.
+    Anything else in measurements (strings, booleans, nested objects) is not charted.
+    The weight is rounded as the checkins row stores it, so the rollups agree with
+    /checkins and with a rebuild from the stored rows.
+    """
+    metrics = {}
+    if weight_kg is not None:
+        metrics[WEIGHT_METRIC] = Decimal(weight_kg).quantize(WEIGHT_QUANTUM, rounding=ROUND_HALF_UP)
+    if isinstance(measurements, dict):
+        for key, value in measurements.items():
+            if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+                metrics[f"{MEASUREMENT_PREFIX}{key}"] = Decimal(str(value))
+    return metrics
@@ -15,3 +15,7 @@ class OwnershipViolation(DomainError):
 
 class ResourceNotFound(DomainError):
     code = "NOT_FOUND"
+
+
+class InvalidCursor(DomainError):
+    code = "INVALID_CURSOR"
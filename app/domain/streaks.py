@@ -0,0 +1,61 @@
+# app/domain/streaks.py
+# Pure streak arithmetic shared by the incremental update path and the rebuild job.
+
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterable, NamedTuple, Optional
+
+
+class StreakState(NamedTuple):
+    current_streak_days: int
+    longest_streak_days: int
+    last_active_date: Optional[date]
+
+
+EMPTY_STREAK = StreakState(0, 0, None)
+
+
+def activity_day(moment: datetime) -> date:
+    """
+    The day a log counts towards: its UTC calendar date. The live update path, the
+    rebuild job and the dashboard all use this rule, so they never disagree.
+    """
+    return moment.astimezone(timezone.utc).date()
+
+
+def today() -> date:
+    """The current activity day (UTC)."""
+    return activity_day(datetime.now(timezone.utc))
+
+
+def advance_streak(state: StreakState, activity_date: date) -> StreakState:
+    """
+    Folds one day of activity into a streak state.
+    Activity on the same day (or older than the last active day) leaves the state unchanged.
+    """
+    last = state.last_active_date
+    if last is not None and activity_date <= last:
+        return state
+
+    if last is not None and activity_date == last + timedelta(days=1):
+        current = state.current_streak_days + 1
+    else:
+        current = 1
+
+    return StreakState(current, max(state.longest_streak_days, current), activity_date)
+
+
+def compute_streak(active_dates: Iterable[date]) -> StreakState:
+    """Computes a streak state from scratch out of a client's active dates (any order)."""
+    state = EMPTY_STREAK
+    for activity_date in sorted(set(active_dates)):
+        state = advance_streak(state, activity_date)
+    return state
+
+
+def streak_as_of(state: StreakState, today: date) -> int:
+    """
+    The streak shown on the dashboard: only counts if the client has been active today.
+    """
+    if state.last_active_date == today:
+        return state.current_streak_days
+    return 0
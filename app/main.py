@@ -1,11 +1,19 @@
 # app/main.py
 # The main entry point for the FastAPI application.
 
-from fastapi import FastAPI, Request
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from app.api.v1.api import api_router
 from app.core.config import settings
+from app.core.database import start_replica_health_checks
+from app.core.metrics import MetricsMiddleware, render_metrics
+from app.core.password_pool import PasswordPoolFull, password_pool
+from app.cache.auth_cache import start_invalidation_listener
+from app.services.activity_stream_service import start_activity_listener
+from app.scripts.reconcile_trainer_stats import reconcile_periodically
 from app.domain.errors import (
     OwnershipViolation,
     ResourceNotFound,
@@ -13,7 +21,33 @@ from app.domain.errors import (
     DomainError,
 )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Each worker process keeps its own in-memory auth cache tier and must
+    # hear about user/client changes made by the other workers.
+    listener = start_invalidation_listener()
+    # One LISTEN connection per worker feeds /trainers/me/activity-stream.
+    activity_listener = start_activity_listener()
+    # Keeps DATABASE_REPLICA_URLS in or out of the read rotation.
+    replica_checker = start_replica_health_checks()
+    reconciler = None
+    if settings.TRAINER_STATS_RECONCILE_SECONDS > 0:
+        reconciler = asyncio.create_task(reconcile_periodically(settings.TRAINER_STATS_RECONCILE_SECONDS))
+    yield
+    if reconciler is not None:
+        reconciler.cancel()
+    if listener is not None:
+        listener.stop()
+    if activity_listener is not None:
+        activity_listener.stop()
+    if replica_checker is not None:
+        replica_checker.stop()
+    password_pool.shutdown()
+
+
 app = FastAPI(
+    lifespan=lifespan,
     title="Fitbud API",
     description="The backend for the Fitbud fitness platform.",
     version="1.0.0",
@@ -38,6 +72,9 @@ app.add_middleware(
     allow_headers=["*"], # Allows all headers
 )
 
+# Outermost, so latency covers the other middleware too.
+app.add_middleware(MetricsMiddleware)
+
 # Include the main API router with a prefix
 app.include_router(api_router, prefix="/api/v1")
 
@@ -62,9 +99,25 @@ def domain_error_handler(request: Request, exc: DomainError):
     return JSONResponse(status_code=400, content={"detail": str(exc)})
 
 
+@app.exception_handler(PasswordPoolFull)
+def password_pool_full_handler(request: Request, exc: PasswordPoolFull):
+    return JSONResponse(status_code=503, content={"detail": str(exc)}, headers={"Retry-After": "1"})
+
+
 @app.get("/health", tags=["Health Check"])
 def health_check():
     """
     Simple health check endpoint to confirm the API is running.
     """
     return {"status": "ok", "version": "1.0.0"}
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """
+    Prometheus scrape endpoint: request latency, SQL statements / DB time / pool
+    wait per request by route template, auth cache hit/miss counters and the
+    bcrypt pool's in-flight, latency and rejection metrics.
+    """
+    payload, content_type = render_metrics()
+    return Response(content=payload, media_type=content_type)
@@ -1,7 +1,7 @@
 # app/models/activity.py
 # SQLAlchemy ORM model for the 'activity_feed' table.
 
-from sqlalchemy import Column, DateTime, func, ForeignKey, String, BigInteger
+from sqlalchemy import Column, DateTime, func, ForeignKey, String, BigInteger, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -15,3 +15,13 @@ class ActivityFeed(Base):
     event_metadata = Column(JSONB, nullable=True)
 
     client = relationship("Client", back_populates="activity_feed")
+
+    __table_args__ = (
+        # Serves keyset pagination on (event_timestamp, id) per client.
+        Index("activity_feed_client_id_event_timestamp_id_desc_idx", "client_id", event_timestamp.desc(), id.desc()),
+        # Serves the event_type-filtered, trainer-wide feed: one keyset scan per (client, event type).
+        Index(
+            "activity_feed_client_id_event_type_event_timestamp_id_desc_idx",
+            "client_id", "event_type", event_timestamp.desc(), id.desc(),
+        ),
+    )
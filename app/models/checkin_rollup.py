@@ -0,0 +1,22 @@
+# app/models/checkin_rollup.py
+# SQLAlchemy ORM model for the 'checkin_rollups' table.
+
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer, Numeric, String
+from sqlalchemy.dialects.postgresql import UUID
+from app.core.database import Base
+
+class CheckinRollup(Base):
+    __tablename__ = "checkin_rollups"
+    # One row per client, granularity (day/week/month), metric and bucket, upserted
+    # by the check-in service so progress charts never scan raw check-ins.
+    client_id = Column(UUID(as_uuid=True), ForeignKey("clients.id", ondelete="CASCADE"), primary_key=True)
+    granularity = Column(String, primary_key=True)
+    metric = Column(String, primary_key=True)
+    bucket_start = Column(Date, primary_key=True)
+    sample_count = Column(Integer, nullable=False)
+    value_sum = Column(Numeric, nullable=False)
+    value_min = Column(Numeric, nullable=False)
+    value_max = Column(Numeric, nullable=False)
+    # Value of the latest check-in in the bucket.
+    last_value = Column(Numeric, nullable=False)
+    last_checked_in_at = Column(DateTime(timezone=True), nullable=False)
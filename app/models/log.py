@@ -1,7 +1,7 @@
 # app/models/log.py
 # SQLAlchemy ORM models for logging tables.
 
-from sqlalchemy import Column, DateTime, func, ForeignKey, String, BigInteger, Numeric
+from sqlalchemy import Column, DateTime, func, ForeignKey, String, BigInteger, Numeric, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -16,6 +16,11 @@ class WorkoutLog(Base):
     
     client = relationship("Client", back_populates="workout_logs")
 
+    __table_args__ = (
+        # Serves keyset pagination on (logged_at, id) per client.
+        Index("workout_logs_client_id_logged_at_id_desc_idx", "client_id", logged_at.desc(), id.desc()),
+    )
+
 class DietLog(Base):
     __tablename__ = "diet_logs"
     id = Column(BigInteger, primary_key=True)
@@ -27,6 +32,10 @@ class DietLog(Base):
 
     client = relationship("Client", back_populates="diet_logs")
 
+    __table_args__ = (
+        Index("diet_logs_client_id_logged_at_id_desc_idx", "client_id", logged_at.desc(), id.desc()),
+    )
+
 class Checkin(Base):
     __tablename__ = "checkins"
     id = Column(BigInteger, primary_key=True)
@@ -38,4 +47,8 @@ class Checkin(Base):
     notes = Column(String, nullable=True)
     checked_in_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
-    client = relationship("Client", back_populates="checkins")
\ No newline at end of file
+    client = relationship("Client", back_populates="checkins")
+
+    __table_args__ = (
+        Index("checkins_client_id_checked_in_at_id_desc_idx", "client_id", checked_in_at.desc(), id.desc()),
+    )
\ No newline at end of file
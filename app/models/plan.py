@@ -1,19 +1,61 @@
 # app/models/plan.py
 # SQLAlchemy ORM models for assigned plans.
 
+import hashlib
+import json
 import uuid
-from sqlalchemy import Column, DateTime, func, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, DateTime, Index, Integer, String, event, func, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID, JSONB, insert as pg_insert
+from sqlalchemy.orm import Session, relationship
 from app.core.database import Base
 
-class AssignedWorkoutPlan(Base):
+
+def snapshot_hash(details: dict) -> str:
+    """Content address of a plan snapshot: sha256 of its canonical JSON."""
+    canonical = json.dumps(details, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class PlanSnapshot(Base):
+    """
+    Immutable plan documents shared by every assignment with identical content.
+    Rows are only ever inserted (see _store_pending_snapshots), never updated.
+    """
+    __tablename__ = "plan_snapshots"
+
+    content_hash = Column(String(64), primary_key=True)
+    plan_details = Column(JSONB, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+class SnapshotBackedPlan:
+    """
+    Exposes the shared snapshot as `plan_details`. Assigning it only records the
+    content hash; the snapshot row is upserted when the session flushes.
+    """
+
+    @property
+    def plan_details(self) -> dict:
+        if "_plan_details" in self.__dict__:
+            return self.__dict__["_plan_details"]
+        return self.snapshot.plan_details
+
+    @plan_details.setter
+    def plan_details(self, details: dict) -> None:
+        self.__dict__["_plan_details"] = details
+        self.__dict__["_snapshot_unsaved"] = True
+        self.snapshot_hash = snapshot_hash(details)
+
+
+class AssignedWorkoutPlan(SnapshotBackedPlan, Base):
     __tablename__ = "assigned_workout_plans"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     client_id = Column(UUID(as_uuid=True), ForeignKey("clients.id", ondelete="CASCADE"), nullable=False)
     source_template_id = Column(UUID(as_uuid=True), ForeignKey("workout_plan_templates.id", ondelete="SET NULL"), nullable=True)
-    plan_details = Column(JSONB, nullable=False)
+    snapshot_hash = Column(String(64), ForeignKey("plan_snapshots.content_hash", ondelete="RESTRICT"), nullable=False)
+    # The template version the snapshot was built from, so later assignments can reuse it.
+    template_version = Column(Integer, nullable=True)
     assigned_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
@@ -21,14 +63,21 @@ class AssignedWorkoutPlan(Base):
 
     client = relationship("Client", back_populates="assigned_workout_plans")
     source_template = relationship("WorkoutPlanTemplate")
+    snapshot = relationship("PlanSnapshot", lazy="joined")
 
-class AssignedDietPlan(Base):
+    __table_args__ = (
+        Index("ix_assigned_workout_plans_template_version", "source_template_id", "template_version"),
+    )
+
+class AssignedDietPlan(SnapshotBackedPlan, Base):
     __tablename__ = "assigned_diet_plans"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     client_id = Column(UUID(as_uuid=True), ForeignKey("clients.id", ondelete="CASCADE"), nullable=False)
     source_template_id = Column(UUID(as_uuid=True), ForeignKey("diet_plan_templates.id", ondelete="SET NULL"), nullable=True)
-    plan_details = Column(JSONB, nullable=False)
+    snapshot_hash = Column(String(64), ForeignKey("plan_snapshots.content_hash", ondelete="RESTRICT"), nullable=False)
+    # The template version the snapshot was built from, so later assignments can reuse it.
+    template_version = Column(Integer, nullable=True)
     assigned_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
@@ -36,3 +85,33 @@ class AssignedDietPlan(Base):
 
     client = relationship("Client", back_populates="assigned_diet_plans")
     source_template = relationship("DietPlanTemplate")
+    snapshot = relationship("PlanSnapshot", lazy="joined")
+
+    __table_args__ = (
+        Index("ix_assigned_diet_plans_template_version", "source_template_id", "template_version"),
+    )
+
+
+def upsert_snapshots(session: Session, snapshots: dict) -> None:
+    """Inserts {content_hash: plan_details} snapshots that don't exist yet, in one statement."""
+    if not snapshots:
+        return
+    session.execute(
+        pg_insert(PlanSnapshot)
+        .values([{"content_hash": content_hash, "plan_details": details} for content_hash, details in snapshots.items()])
+        .on_conflict_do_nothing(index_elements=[PlanSnapshot.content_hash])
+    )
+
+
+@event.listens_for(Session, "before_flush")
+def _store_pending_snapshots(session, flush_context, instances):
+    """Upserts the snapshots of plans whose plan_details were assigned, before the plans themselves are written."""
+    pending = [
+        obj for obj in (*session.new, *session.dirty)
+        if isinstance(obj, SnapshotBackedPlan) and obj.__dict__.get("_snapshot_unsaved")
+    ]
+    if not pending:
+        return
+    upsert_snapshots(session, {obj.snapshot_hash: obj.__dict__["_plan_details"] for obj in pending})
+    for obj in pending:
+        obj.__dict__["_snapshot_unsaved"] = False
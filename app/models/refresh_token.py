@@ -0,0 +1,25 @@
+# app/models/refresh_token.py
+# SQLAlchemy ORM model for the 'refresh_tokens' table.
+
+import uuid
+from sqlalchemy import Column, DateTime, ForeignKey, Index, String, func
+from sqlalchemy.dialects.postgresql import UUID
+from app.core.database import Base
+
+class RefreshToken(Base):
+    __tablename__ = "refresh_tokens"
+    # Only a SHA-256 of each token is stored. Every refresh revokes the presented
+    # token and issues a new one in the same family; presenting a revoked token
+    # again revokes the whole family.
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    family_id = Column(UUID(as_uuid=True), nullable=False)
+    token_hash = Column(String(64), nullable=False, unique=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    revoked_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index("refresh_tokens_user_id_idx", "user_id"),
+        Index("refresh_tokens_family_id_idx", "family_id"),
+    )
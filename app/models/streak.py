@@ -0,0 +1,15 @@
+# app/models/streak.py
+# SQLAlchemy ORM model for the 'client_streaks' table.
+
+from sqlalchemy import Column, Date, DateTime, func, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from app.core.database import Base
+
+class ClientStreak(Base):
+    __tablename__ = "client_streaks"
+    # One row per client, maintained incrementally by the log service.
+    client_id = Column(UUID(as_uuid=True), ForeignKey("clients.id", ondelete="CASCADE"), primary_key=True)
+    current_streak_days = Column(Integer, nullable=False, default=0, server_default="0")
+    longest_streak_days = Column(Integer, nullable=False, default=0, server_default="0")
+    last_active_date = Column(Date, nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
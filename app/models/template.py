@@ -2,7 +2,7 @@
 # SQLAlchemy ORM models for plan templates, updated for V2 structure.
 
 import uuid
-from sqlalchemy import Column, String, DateTime, func, ForeignKey, Integer, BigInteger, Text, Boolean, Numeric, UniqueConstraint, Index
+from sqlalchemy import Column, String, DateTime, func, ForeignKey, Integer, BigInteger, Text, Boolean, Numeric, Float, UniqueConstraint, Index, DDL, event
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -35,6 +35,14 @@ class ExerciseLibrary(Base):
         unique=True,
         postgresql_where=(is_verified == False)
     ),
+    # Serves the ranked name search (ILIKE and pg_trgm word similarity).
+    Index(
+        "exercise_library_name_trgm_idx",
+        "name",
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+        postgresql_where=(deleted_at.is_(None))
+    ),
     )
 
 class FoodItemLibrary(Base):
@@ -68,8 +76,18 @@ class FoodItemLibrary(Base):
         unique=True,
         postgresql_where=(is_verified == False)
     ),
+    Index(
+        "food_item_library_name_trgm_idx",
+        "name",
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+        postgresql_where=(deleted_at.is_(None))
+    ),
     )
 
+# The trigram indexes need pg_trgm; the migration creates it too, this covers metadata.create_all().
+event.listen(Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
 # --- NEW V2 LINKING MODELS ---
 
 class WorkoutTemplateItem(Base):
@@ -96,6 +114,12 @@ class DietTemplateItem(Base):
     serving_unit = Column(String, nullable=True)
     notes = Column(Text, nullable=True)
     display_order = Column(Integer)
+    # Nutrition of this serving, computed when the item is written and refreshed
+    # when the referenced food item changes (see TemplateService).
+    calories = Column(Float, nullable=True)
+    protein_g = Column(Float, nullable=True)
+    carbs_g = Column(Float, nullable=True)
+    fat_g = Column(Float, nullable=True)
 
     food_item = relationship("FoodItemLibrary")
 
@@ -126,6 +150,8 @@ class DietPlanTemplate(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     deleted_at = Column(DateTime(timezone=True), nullable=True)
+    # {"meals": [{"meal_name", "calories", "protein_g", "carbs_g", "fat_g"}, ...], "total": {...}}
+    nutrition_totals = Column(JSONB, nullable=True)
 
     items = relationship("DietTemplateItem", cascade="all, delete-orphan")
 
@@ -0,0 +1,17 @@
+# app/models/trainer_stats.py
+# SQLAlchemy ORM model for the 'trainer_stats' table.
+
+from sqlalchemy import Column, Date, DateTime, func, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from app.core.database import Base
+
+class TrainerStats(Base):
+    __tablename__ = "trainer_stats"
+    # One row per trainer, maintained from client status transitions and
+    # periodically reconciled against the clients table.
+    trainer_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    active_clients = Column(Integer, nullable=False, default=0, server_default="0")
+    # Snapshot of active_clients taken when snapshot_month began.
+    active_at_month_start = Column(Integer, nullable=False, default=0, server_default="0")
+    snapshot_month = Column(Date, nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
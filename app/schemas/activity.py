@@ -11,4 +11,8 @@ class ActivityFeedItem(CamelCaseModel):
     event_timestamp: datetime
     event_metadata: Any = Field(alias="event_metadata")
 
-    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+class TrainerActivityFeedItem(ActivityFeedItem):
+    """An entry of the trainer-wide feed, which mixes events of every client."""
+    client_id: uuid.UUID
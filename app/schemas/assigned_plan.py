@@ -2,8 +2,8 @@
 # Pydantic models for assigning plans to clients.
 
 import uuid
-from typing import Any, Optional
-from pydantic import BaseModel, ConfigDict, computed_field
+from typing import Any, List, Literal, Optional
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 from datetime import datetime
 from .core import CamelCaseModel
 
@@ -18,6 +18,23 @@ class WorkoutPlanAssign(PlanAssignmentBase):
 class DietPlanAssign(PlanAssignmentBase):
     pass
 
+MAX_BULK_ASSIGN_SIZE = 500
+
+class PlanBulkAssign(CamelCaseModel):
+    source_template_id: uuid.UUID
+    client_ids: List[uuid.UUID] = Field(min_length=1, max_length=MAX_BULK_ASSIGN_SIZE)
+
+class BulkAssignItemResult(CamelCaseModel):
+    client_id: uuid.UUID
+    status: Literal["assigned", "rejected"]
+    id: Optional[uuid.UUID] = None
+    error: Optional[str] = None
+
+class BulkAssignResult(CamelCaseModel):
+    assigned: int
+    rejected: int
+    results: List[BulkAssignItemResult]
+
 # --- Assigned Plan Response Schemas ---
 class AssignedPlan(CamelCaseModel):
     id: uuid.UUID
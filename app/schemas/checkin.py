@@ -2,8 +2,8 @@
 # Pydantic models for weekly check-ins.
 
 import uuid
-from datetime import datetime
-from typing import Any, Optional
+from datetime import date, datetime
+from typing import Any, List, Optional
 from pydantic import BaseModel, ConfigDict, HttpUrl
 from decimal import Decimal
 from .core import CamelCaseModel
@@ -28,3 +28,21 @@ class Checkin(CamelCaseModel):
     checked_in_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+class CheckinSeriesPoint(CamelCaseModel):
+    bucket_start: date
+    count: int
+    min: float
+    max: float
+    avg: float
+    last: float
+
+class CheckinMetricSeries(CamelCaseModel):
+    # "weight_kg" or "measurements.<key>", e.g. "measurements.waist_cm"
+    metric: str
+    points: List[CheckinSeriesPoint]
+
+class CheckinSeries(CamelCaseModel):
+    client_id: uuid.UUID
+    granularity: str
+    series: List[CheckinMetricSeries]
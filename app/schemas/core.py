@@ -1,3 +1,4 @@
+from typing import Generic, List, Optional, TypeVar
 from pydantic import BaseModel, ConfigDict
 from pydantic.alias_generators import to_camel
 
@@ -5,4 +6,11 @@ class CamelCaseModel(BaseModel):
     model_config = ConfigDict(
         alias_generator=to_camel,
         populate_by_name=True,
-    )
\ No newline at end of file
+    )
+
+T = TypeVar("T")
+
+class CursorPage(CamelCaseModel, Generic[T]):
+    """Response envelope for keyset-paginated lists."""
+    items: List[T]
+    next_cursor: Optional[str] = None
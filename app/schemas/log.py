@@ -3,8 +3,8 @@
 
 import uuid
 from datetime import datetime
-from typing import Any, List, Optional
-from pydantic import BaseModel, ConfigDict, constr
+from typing import Annotated, Any, List, Literal, Optional, Union
+from pydantic import AwareDatetime, BaseModel, ConfigDict, Field, constr
 from .core import CamelCaseModel
 
 # --- Workout Log Schemas ---
@@ -40,3 +40,33 @@ class DietLog(CamelCaseModel):
     logged_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+# --- Batch Log Schemas ---
+
+MAX_LOG_BATCH_SIZE = 500
+
+class WorkoutLogBatchItem(WorkoutLogCreate):
+    kind: Literal["workout"]
+    # When the log was recorded on the device; defaults to the time of the upload.
+    logged_at: Optional[AwareDatetime] = None
+
+class DietLogBatchItem(DietLogCreate):
+    kind: Literal["diet"]
+    logged_at: Optional[AwareDatetime] = None
+
+LogBatchItem = Annotated[Union[WorkoutLogBatchItem, DietLogBatchItem], Field(discriminator="kind")]
+
+class LogBatchCreate(CamelCaseModel):
+    items: List[LogBatchItem] = Field(min_length=1, max_length=MAX_LOG_BATCH_SIZE)
+
+class LogBatchItemResult(CamelCaseModel):
+    index: int
+    kind: Literal["workout", "diet"]
+    status: Literal["created", "rejected"]
+    id: Optional[int] = None
+    error: Optional[str] = None
+
+class LogBatchResult(CamelCaseModel):
+    created: int
+    rejected: int
+    results: List[LogBatchItemResult]
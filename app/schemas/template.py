@@ -40,6 +40,8 @@ class WorkoutTemplateItemGet(CamelCaseModel):
     model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
 class WorkoutTemplateItemCreate(CamelCaseModel):
+    # Set to an existing item's id to update it in place; omit to add a new item.
+    item_id: Optional[int] = None
     exercise_id: uuid.UUID
     day_name: str
     display_order: Optional[int] = None
@@ -68,6 +70,11 @@ class DietTemplateItemGet(CamelCaseModel):
     food_item: LibraryFoodItem
     serving_size: Optional[float] = Field(default=None, exclude=True)
     serving_unit: Optional[str] = Field(default=None, exclude=True)
+    # Persisted at write time; None only for rows written before nutrition was stored.
+    calories: Optional[float] = Field(default=None, exclude=True)
+    protein_g: Optional[float] = Field(default=None, exclude=True)
+    carbs_g: Optional[float] = Field(default=None, exclude=True)
+    fat_g: Optional[float] = Field(default=None, exclude=True)
 
     @computed_field
     @property
@@ -77,6 +84,13 @@ class DietTemplateItemGet(CamelCaseModel):
     @computed_field
     @property
     def calculated_nutrition(self) -> CalculatedNutrition:
+        if self.calories is not None:
+            return CalculatedNutrition(
+                calories=self.calories,
+                protein_g=self.protein_g or 0,
+                carbs_g=self.carbs_g or 0,
+                fat_g=self.fat_g or 0,
+            )
         nut = calculate_nutrition(self.food_item, float(self.serving_size or 0), self.serving_unit or "g")
         return CalculatedNutrition(
             calories=nut["calories"],
@@ -87,7 +101,16 @@ class DietTemplateItemGet(CamelCaseModel):
 
     model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
+class MealNutrition(CalculatedNutrition):
+    meal_name: str
+
+class NutritionTotals(CamelCaseModel):
+    meals: List[MealNutrition]
+    total: CalculatedNutrition
+
 class DietTemplateItemCreate(CamelCaseModel):
+    # Set to an existing item's id to update it in place; omit to add a new item.
+    item_id: Optional[int] = None
     food_item_id: uuid.UUID
     meal_name: str
     display_order: Optional[int] = None
@@ -105,9 +128,17 @@ class WorkoutPlanTemplateCreate(PlanTemplateBase):
 class WorkoutPlanTemplateUpdate(PlanTemplateBase):
     items: List[WorkoutTemplateItemCreate]
 
+class WorkoutPlanTemplatePatch(CamelCaseModel):
+    """Partial update: changed or new items only, plus the ids of removed items."""
+    name: Optional[constr(min_length=1)] = None
+    description: Optional[str] = None
+    items: List[WorkoutTemplateItemCreate] = []
+    deleted_item_ids: List[int] = []
+
 class WorkoutPlanTemplate(PlanTemplateBase):
     id: uuid.UUID
     trainer_id: uuid.UUID
+    version: int
     created_at: datetime
     items: List[WorkoutTemplateItemGet]
 
@@ -119,10 +150,19 @@ class DietPlanTemplateCreate(PlanTemplateBase):
 class DietPlanTemplateUpdate(PlanTemplateBase):
     items: List[DietTemplateItemCreate]
 
+class DietPlanTemplatePatch(CamelCaseModel):
+    """Partial update: changed or new items only, plus the ids of removed items."""
+    name: Optional[constr(min_length=1)] = None
+    description: Optional[str] = None
+    items: List[DietTemplateItemCreate] = []
+    deleted_item_ids: List[int] = []
+
 class DietPlanTemplate(PlanTemplateBase):
     id: uuid.UUID
     trainer_id: uuid.UUID
+    version: int
     created_at: datetime
     items: List[DietTemplateItemGet]
+    nutrition_totals: Optional[NutritionTotals] = None
 
     model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
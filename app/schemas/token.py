@@ -6,6 +6,11 @@ from .core import CamelCaseModel
 class Token(CamelCaseModel):
     access_token: str
     token_type: str
+    # Exchange at POST /auth/refresh for a new access token; each one works once.
+    refresh_token: str | None = None
+
+class TokenRefresh(CamelCaseModel):
+    refresh_token: str
 
 class TokenData(CamelCaseModel):
     email: EmailStr | None = None
\ No newline at end of file
@@ -0,0 +1 @@
+#marks app.scripts as a package
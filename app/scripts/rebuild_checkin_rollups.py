@@ -0,0 +1,29 @@
+# app/scripts/rebuild_checkin_rollups.py
+# Recomputes the check-in rollups behind GET /checkins/series from the stored check-ins.
+#
+# Usage:
+#   python -m app.scripts.rebuild_checkin_rollups                 # every client
+#   python -m app.scripts.rebuild_checkin_rollups --client-id ID  # a single client
+
+import argparse
+import uuid
+
+from app.core.database import SessionLocal
+from app.services.checkin_service import checkin_service
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild check-in rollups from the stored check-ins.")
+    parser.add_argument("--client-id", type=uuid.UUID, default=None)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        rebuilt = checkin_service.rebuild_rollups(db, client_id=args.client_id)
+        print(f"Rebuilt {rebuilt} check-in rollup row(s)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+# app/scripts/rebuild_streaks.py
+# Recomputes the persisted client streaks from workout/diet log history.
+#
+# Usage:
+#   python -m app.scripts.rebuild_streaks                 # every client
+#   python -m app.scripts.rebuild_streaks --client-id ID  # a single client
+
+import argparse
+import uuid
+
+from app.core.database import SessionLocal
+from app.services.streak_service import streak_service
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild client streaks from log history.")
+    parser.add_argument("--client-id", type=uuid.UUID, default=None)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        rebuilt = streak_service.rebuild(db, client_id=args.client_id)
+        print(f"Rebuilt streaks for {rebuilt} client(s)")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+# app/scripts/reconcile_trainer_stats.py
+# Recounts active clients per trainer and corrects drift in trainer_stats.
+# Meant to run periodically (cron), or in-process via TRAINER_STATS_RECONCILE_SECONDS.
+#
+# Usage:
+#   python -m app.scripts.reconcile_trainer_stats                  # every trainer
+#   python -m app.scripts.reconcile_trainer_stats --trainer-id ID  # a single trainer
+
+import argparse
+import asyncio
+import logging
+import uuid
+
+from app.core.database import SessionLocal
+from app.services.trainer_service import trainer_service
+
+logger = logging.getLogger(__name__)
+
+
+def reconcile(trainer_id: uuid.UUID | None = None) -> int:
+    db = SessionLocal()
+    try:
+        return trainer_service.reconcile_stats(db, trainer_id=trainer_id)
+    finally:
+        db.close()
+
+
+async def reconcile_periodically(interval_seconds: int):
+    """Background loop started by the app when TRAINER_STATS_RECONCILE_SECONDS > 0."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await asyncio.to_thread(reconcile)
+        except Exception:
+            logger.exception("Trainer stats reconciliation failed")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reconcile trainer stats against the clients table.")
+    parser.add_argument("--trainer-id", type=uuid.UUID, default=None)
+    args = parser.parse_args()
+
+    reconciled = reconcile(args.trainer_id)
+    print(f"Reconciled stats for {reconciled} trainer(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,31 +1,140 @@
 # app/services/activity_feed_service.py
 import uuid
-from typing import List
-from sqlalchemy.orm import Session
+from typing import List, Optional, Sequence
+from sqlalchemy import String, column, select, true, values
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.activity import ActivityFeed
 from app.domain.client_guards import assert_client_active
 from app.models.client import Client
+from app.core.pagination import keyset_page, build_page
 from fastapi import HTTPException, status
 
 class ActivityFeedService:
-    def get_activity_feed_for_client(self, db: Session, *, client_id: uuid.UUID, skip: int, limit: int) -> List[ActivityFeed]:
-         # 1. Validate that the client exists and is active
-        client = db.query(Client).filter(
+    def _live_client_stmt(self, client_id: uuid.UUID):
+        return select(Client).where(
             Client.id == client_id,
             Client.deleted_at.is_(None)
-        ).first()
+        )
+
+    def _feed_stmt(self, *, client_id: uuid.UUID, skip: int, limit: int):
+        return (
+            select(ActivityFeed)
+            .where(ActivityFeed.client_id == client_id)
+            .order_by(ActivityFeed.event_timestamp.desc(), ActivityFeed.id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+
+    def _feed_page_stmt(self, *, client_id: uuid.UUID, cursor: Optional[str], limit: int):
+        return keyset_page(
+            select(ActivityFeed).where(ActivityFeed.client_id == client_id),
+            sort_column=ActivityFeed.event_timestamp,
+            id_column=ActivityFeed.id,
+            cursor=cursor,
+            limit=limit,
+        )
+
+    def _trainer_feed_page_stmt(self, *, trainer_id: uuid.UUID, event_types: Optional[Sequence[str]], cursor: Optional[str], limit: int):
+        """
+        Newest-first page across every live client of the trainer. Each client (and
+        event type, when filtered) gets a LATERAL keyset scan of at most limit + 1 rows
+        on its (client_id[, event_type], event_timestamp DESC, id DESC) index; the
+        outer query merges those short runs, so the cost is bounded by roster size
+        times page size rather than by the total feed length.
+        """
+        roster = select(Client.id.label("client_id")).where(
+            Client.trainer_user_id == trainer_id,
+            Client.deleted_at.is_(None),
+        )
+        per_client = select(ActivityFeed)
+        if event_types:
+            # Deduplicated, or a repeated type would return its events twice.
+            types = values(column("event_type", String), name="event_types").data([(t,) for t in sorted(set(event_types))])
+            roster = roster.add_columns(types.c.event_type).subquery("roster")
+            per_client = per_client.where(ActivityFeed.event_type == roster.c.event_type)
+        else:
+            roster = roster.subquery("roster")
+        per_client = keyset_page(
+            per_client.where(ActivityFeed.client_id == roster.c.client_id),
+            sort_column=ActivityFeed.event_timestamp,
+            id_column=ActivityFeed.id,
+            cursor=cursor,
+            limit=limit,
+        ).lateral("feed")
+
+        feed = aliased(ActivityFeed, per_client)
+        return keyset_page(
+            select(feed).select_from(roster).join(per_client, true()),
+            sort_column=feed.event_timestamp,
+            id_column=feed.id,
+            cursor=None,
+            limit=limit,
+        )
+
+    def get_trainer_activity_since(self, db: Session, *, trainer_id: uuid.UUID, after_id: int, limit: int) -> List[ActivityFeed]:
+        """Events of the trainer's live clients with an id above after_id, oldest first (stream resume)."""
+        stmt = (
+            select(ActivityFeed)
+            .join(Client, Client.id == ActivityFeed.client_id)
+            .where(
+                Client.trainer_user_id == trainer_id,
+                Client.deleted_at.is_(None),
+                ActivityFeed.id > after_id,
+            )
+            .order_by(ActivityFeed.id)
+            .limit(limit)
+        )
+        return db.scalars(stmt).all()
+
+    def get_activity_feed_for_client(self, db: Session, *, client_id: uuid.UUID, skip: int, limit: int) -> List[ActivityFeed]:
+         # 1. Validate that the client exists and is active
+        client = db.scalars(self._live_client_stmt(client_id)).first()
         if not client:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Client not found")
         assert_client_active(client)
         
         # 2. Get the activity feed for the client
-        return (
-            db.query(ActivityFeed)
-            .filter(ActivityFeed.client_id == client_id)
-            .order_by(ActivityFeed.event_timestamp.desc())
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
+        return db.scalars(self._feed_stmt(client_id=client_id, skip=skip, limit=limit)).all()
+
+    async def get_activity_feed_for_client_async(self, db: AsyncSession, *, client_id: uuid.UUID, skip: int, limit: int) -> List[ActivityFeed]:
+        """AsyncSession counterpart of get_activity_feed_for_client."""
+        client = (await db.scalars(self._live_client_stmt(client_id))).first()
+        if not client:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Client not found")
+        assert_client_active(client)
+
+        return (await db.scalars(self._feed_stmt(client_id=client_id, skip=skip, limit=limit))).all()
+
+    def get_activity_feed_page_for_client(self, db: Session, *, client_id: uuid.UUID, cursor: Optional[str], limit: int) -> dict:
+        """Keyset-paginated activity feed, newest first, keyed on (event_timestamp, id)."""
+        client = db.scalars(self._live_client_stmt(client_id)).first()
+        if not client:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Client not found")
+        assert_client_active(client)
+
+        rows = db.scalars(self._feed_page_stmt(client_id=client_id, cursor=cursor, limit=limit)).all()
+        return build_page(rows, sort_attr="event_timestamp", limit=limit)
+
+    async def get_activity_feed_page_for_client_async(self, db: AsyncSession, *, client_id: uuid.UUID, cursor: Optional[str], limit: int) -> dict:
+        """AsyncSession counterpart of get_activity_feed_page_for_client."""
+        client = (await db.scalars(self._live_client_stmt(client_id))).first()
+        if not client:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Client not found")
+        assert_client_active(client)
+
+        rows = (await db.scalars(self._feed_page_stmt(client_id=client_id, cursor=cursor, limit=limit))).all()
+        return build_page(rows, sort_attr="event_timestamp", limit=limit)
+
+    def get_trainer_activity_feed_page(self, db: Session, *, trainer_id: uuid.UUID, event_types: Optional[Sequence[str]], cursor: Optional[str], limit: int) -> dict:
+        """Keyset-paginated feed merged across the trainer's whole roster, newest first."""
+        rows = db.scalars(self._trainer_feed_page_stmt(trainer_id=trainer_id, event_types=event_types, cursor=cursor, limit=limit)).all()
+        return build_page(rows, sort_attr="event_timestamp", limit=limit)
+
+    async def get_trainer_activity_feed_page_async(self, db: AsyncSession, *, trainer_id: uuid.UUID, event_types: Optional[Sequence[str]], cursor: Optional[str], limit: int) -> dict:
+        """AsyncSession counterpart of get_trainer_activity_feed_page."""
+        stmt = self._trainer_feed_page_stmt(trainer_id=trainer_id, event_types=event_types, cursor=cursor, limit=limit)
+        rows = (await db.scalars(stmt)).all()
+        return build_page(rows, sort_attr="event_timestamp", limit=limit)
 
-activity_feed_service = ActivityFeedService()
\ No newline at end of file
+activity_feed_service = ActivityFeedService()
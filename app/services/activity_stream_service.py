@@ -0,0 +1,174 @@
+# app/services/activity_stream_service.py
+# Live activity push: activity_feed inserts NOTIFY on commit, and one LISTEN
+# connection per worker fans the events out to that worker's SSE subscribers.
+
+import asyncio
+import json
+import logging
+import select
+import threading
+import uuid
+from collections import defaultdict
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import listen_engine
+from app.schemas.activity import TrainerActivityFeedItem
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "activity_feed"
+# Postgres rejects NOTIFY payloads of 8000 bytes or more.
+MAX_PAYLOAD_BYTES = 7900
+SUBSCRIBER_QUEUE_SIZE = 256
+# Tells a stream to end so its client reconnects and catches up from the database.
+RESYNC = object()
+
+
+def _field(event: Any, name: str) -> Any:
+    return event[name] if isinstance(event, dict) else getattr(event, name)
+
+
+def format_sse(item: TrainerActivityFeedItem) -> str:
+    return f"id: {item.id}\nevent: activity\ndata: {item.model_dump_json(by_alias=True)}\n\n"
+
+
+class ActivityStreamService:
+    def __init__(self):
+        self._subscribers: dict[uuid.UUID, set[asyncio.Queue]] = defaultdict(set)
+
+    def notify(self, db: Session, *, trainer_id: uuid.UUID, events: Iterable[Any]) -> None:
+        """
+        Queues a NOTIFY for each activity_feed row (ORM object or dict, id already
+        assigned). Postgres delivers them when the surrounding transaction commits
+        and drops them on rollback.
+        """
+        payloads = []
+        for event in events:
+            payload = {
+                "trainer_id": str(trainer_id),
+                "id": _field(event, "id"),
+                "client_id": str(_field(event, "client_id")),
+                "event_type": _field(event, "event_type"),
+                "event_timestamp": _field(event, "event_timestamp").isoformat(),
+                "event_metadata": _field(event, "event_metadata"),
+            }
+            encoded = json.dumps(payload, default=str)
+            if len(encoded.encode()) >= MAX_PAYLOAD_BYTES:
+                # Subscribers can still read the full row through the activity feed.
+                payload["event_metadata"] = None
+                encoded = json.dumps(payload, default=str)
+            payloads.append(encoded)
+        if payloads:
+            db.execute(
+                text("SELECT pg_notify(:channel, payload) FROM unnest(CAST(:payloads AS text[])) AS payload"),
+                {"channel": CHANNEL, "payloads": payloads},
+            )
+
+    def subscribe(self, trainer_id: uuid.UUID) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers[trainer_id].add(queue)
+        return queue
+
+    def unsubscribe(self, trainer_id: uuid.UUID, queue: asyncio.Queue) -> None:
+        queues = self._subscribers.get(trainer_id)
+        if queues is not None:
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[trainer_id]
+
+    def publish(self, payload: str) -> None:
+        """Routes one NOTIFY payload to the trainer's subscribers. Runs on the event loop."""
+        try:
+            event = json.loads(payload)
+            queues = self._subscribers.get(uuid.UUID(event["trainer_id"]))
+            if not queues:
+                return
+            item = TrainerActivityFeedItem.model_validate(event)
+        except (ValueError, KeyError):
+            logger.warning("Ignoring malformed activity notification: %.200s", payload)
+            return
+        for queue in list(queues):
+            self._offer(queue, item)
+
+    def resync_all(self) -> None:
+        """Ends every stream, e.g. after the listener reconnected and may have missed events."""
+        for queues in list(self._subscribers.values()):
+            for queue in list(queues):
+                self._offer(queue, RESYNC)
+
+    @staticmethod
+    def _offer(queue: asyncio.Queue, item: Any) -> None:
+        try:
+            queue.put_nowait(item)
+        except asyncio.QueueFull:
+            # A slow consumer: drop its backlog and let it catch up from the database.
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(RESYNC)
+
+
+activity_stream_service = ActivityStreamService()
+
+
+class ActivityListener(threading.Thread):
+    """
+    Holds a dedicated LISTEN connection (outside the pool) and hands notifications
+    to activity_stream_service on the event loop. Reconnects with backoff; every
+    reconnect resyncs the open streams, since notifications sent meanwhile are lost.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, poll_seconds: float = 5.0):
+        super().__init__(name="activity-listener", daemon=True)
+        self.loop = loop
+        self.poll_seconds = poll_seconds
+        self._stopped = threading.Event()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def run(self) -> None:
+        backoff = 1.0
+        while not self._stopped.is_set():
+            try:
+                self._listen()
+                backoff = 1.0
+            except Exception:
+                logger.exception("Activity listener connection failed; retrying in %.0fs", backoff)
+                self._stopped.wait(backoff)
+                backoff = min(backoff * 2, 30.0)
+
+    def _listen(self) -> None:
+        conn = listen_engine.raw_connection()
+        conn.detach()
+        dbapi_conn = conn.driver_connection
+        try:
+            dbapi_conn.autocommit = True
+            with dbapi_conn.cursor() as cursor:
+                cursor.execute(f"LISTEN {CHANNEL}")
+            self.loop.call_soon_threadsafe(activity_stream_service.resync_all)
+            while not self._stopped.is_set():
+                readable, _, _ = select.select([dbapi_conn], [], [], self.poll_seconds)
+                if not readable:
+                    continue
+                dbapi_conn.poll()
+                while dbapi_conn.notifies:
+                    notification = dbapi_conn.notifies.pop(0)
+                    self.loop.call_soon_threadsafe(activity_stream_service.publish, notification.payload)
+        finally:
+            conn.close()
+
+
+def start_activity_listener() -> Optional[ActivityListener]:
+    """
+    Starts this worker's listener thread from the running event loop. Returns it
+    (call .stop() on shutdown), or None when ACTIVITY_STREAM_ENABLED is off.
+    """
+    if not settings.ACTIVITY_STREAM_ENABLED:
+        return None
+    listener = ActivityListener(asyncio.get_running_loop())
+    listener.start()
+    return listener
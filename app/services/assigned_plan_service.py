@@ -2,17 +2,57 @@
 # V2 Business logic for assigning plans, using the new normalized structure.
 
 import uuid
-from typing import List
+from typing import List, Optional
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
-from app.models.plan import AssignedWorkoutPlan, AssignedDietPlan
-from app.schemas.assigned_plan import WorkoutPlanAssign, DietPlanAssign
+from app.models.client import Client
+from app.models.plan import AssignedWorkoutPlan, AssignedDietPlan, snapshot_hash, upsert_snapshots
+from app.schemas.assigned_plan import (
+    WorkoutPlanAssign, DietPlanAssign, PlanBulkAssign, BulkAssignItemResult, BulkAssignResult
+)
 from app.services.template_service import template_service
 from app.domain.client_guards import assert_client_allows_action
-from app.domain.authorization.client_access import get_client_for_trainer, get_client_for_viewer
+from app.domain.errors import InvalidClientState, OwnershipViolation, ResourceNotFound
+from app.domain.authorization.client_access import assert_trainer_owns_client, get_client_for_trainer, get_client_for_viewer
 
 class AssignedPlanService:
+    def _reusable_snapshot(self, db: Session, model, *, template_id: uuid.UUID, template_version: int) -> Optional[str]:
+        """Hash of a snapshot already built from this template version, if any assignment has one."""
+        return db.execute(
+            select(model.snapshot_hash)
+            .where(model.source_template_id == template_id, model.template_version == template_version)
+            .limit(1)
+        ).scalar()
+
+    def _snapshot_fields(self, db: Session, kind: str, *, template_id: uuid.UUID, trainer_id: uuid.UUID) -> dict:
+        """
+        Validates that the template exists and belongs to the trainer, then reuses the
+        snapshot of its current version or builds the rich JSON snapshot from the
+        template's relational items. Returns the snapshot columns for a new assignment.
+        """
+        if kind == "workout":
+            model, label = AssignedWorkoutPlan, "Workout"
+            get_version, get_template = template_service.get_workout_template_version, template_service.get_workout_template
+            build = template_service.create_workout_plan_snapshot
+        else:
+            model, label = AssignedDietPlan, "Diet"
+            get_version, get_template = template_service.get_diet_template_version, template_service.get_diet_template
+            build = template_service.create_diet_plan_snapshot
+
+        version = get_version(db, template_id=template_id, trainer_id=trainer_id)
+        if version is None:
+            raise HTTPException(status_code=404, detail=f"{label} plan template not found.")
+        reused = self._reusable_snapshot(db, model, template_id=template_id, template_version=version)
+        if reused:
+            return {"snapshot_hash": reused, "template_version": version}
+
+        template = get_template(db, template_id=template_id, trainer_id=trainer_id)
+        if not template:
+            raise HTTPException(status_code=404, detail=f"{label} plan template not found.")
+        return {"plan_details": build(template=template), "template_version": template.version}
+
     def assign_workout_plan(self, db: Session, *, assignment_in: WorkoutPlanAssign, trainer_id: uuid.UUID) -> AssignedWorkoutPlan:
         """
         Assigns a workout plan to a client by building a complete JSON snapshot
@@ -28,19 +68,14 @@ class AssignedPlanService:
         # 2. Validate that client is allowed to assign a plan
         assert_client_allows_action(client, "assign_workout")
 
-        # 3. Validate that the template exists and belongs to the trainer
-        template = template_service.get_workout_template(db, template_id=assignment_in.source_template_id, trainer_id=trainer_id)
-        if not template:
-            raise HTTPException(status_code=404, detail="Workout plan template not found.")
+        # 3. Validate the template and reuse or build its snapshot
+        snapshot = self._snapshot_fields(db, "workout", template_id=assignment_in.source_template_id, trainer_id=trainer_id)
 
-        # 4. Build the rich JSON snapshot from the template's relational items
-        plan_snapshot = plan_snapshot = template_service.create_workout_plan_snapshot(template=template)
-
-        # 5. Create the immutable assigned plan record
+        # 4. Create the immutable assigned plan record
         db_obj = AssignedWorkoutPlan(
             client_id=assignment_in.client_id,
             source_template_id=assignment_in.source_template_id,
-            plan_details=plan_snapshot,
+            **snapshot,
         )
         
         db.add(db_obj)
@@ -59,19 +94,13 @@ class AssignedPlanService:
             trainer_id=trainer_id,
             )
         
-        # 2. Validate that the template exists and belongs to the trainer
-        
-        template = template_service.get_diet_template(db, template_id=assignment_in.source_template_id, trainer_id=trainer_id)
-        if not template:
-            raise HTTPException(status_code=404, detail="Diet plan template not found.")
-
-        # Build the snapshot from the new structure
-        plan_snapshot = plan_snapshot = template_service.create_diet_plan_snapshot(template=template)
+        # 2. Validate the template and reuse or build its snapshot
+        snapshot = self._snapshot_fields(db, "diet", template_id=assignment_in.source_template_id, trainer_id=trainer_id)
 
         db_obj = AssignedDietPlan(
             client_id=assignment_in.client_id,
             source_template_id=assignment_in.source_template_id,
-            plan_details=plan_snapshot,
+            **snapshot,
         )
         
         db.add(db_obj)
@@ -79,6 +108,55 @@ class AssignedPlanService:
         db.refresh(db_obj)
         return db_obj
 
+    def assign_plan_bulk(self, db: Session, *, kind: str, assignment_in: PlanBulkAssign, trainer_id: uuid.UUID) -> BulkAssignResult:
+        """
+        Assigns one template to many clients: one query validates all the clients,
+        the snapshot is built (or reused) once, and every accepted assignment is
+        written in a single insert. Each client is accepted or rejected on its own.
+        """
+        model = AssignedWorkoutPlan if kind == "workout" else AssignedDietPlan
+        client_ids = list(dict.fromkeys(assignment_in.client_ids))
+        snapshot = self._snapshot_fields(db, kind, template_id=assignment_in.source_template_id, trainer_id=trainer_id)
+
+        clients = {
+            client.id: client
+            for client in db.scalars(select(Client).where(Client.id.in_(client_ids), Client.deleted_at.is_(None)))
+        }
+        results = []
+        for client_id in client_ids:
+            client = clients.get(client_id)
+            try:
+                if client is None:
+                    raise ResourceNotFound("Client not found")
+                assert_trainer_owns_client(client, trainer_id)
+                assert_client_allows_action(client, f"assign_{kind}")
+            except (ResourceNotFound, OwnershipViolation, InvalidClientState) as e:
+                results.append(BulkAssignItemResult(client_id=client_id, status="rejected", error=str(e)))
+                continue
+            results.append(BulkAssignItemResult(client_id=client_id, status="assigned", id=uuid.uuid4()))
+
+        accepted = [result for result in results if result.status == "assigned"]
+        if accepted:
+            details = snapshot.pop("plan_details", None)
+            if details is not None:
+                snapshot["snapshot_hash"] = snapshot_hash(details)
+                upsert_snapshots(db, {snapshot["snapshot_hash"]: details})
+            db.execute(
+                insert(model),
+                [
+                    {
+                        "id": result.id,
+                        "client_id": result.client_id,
+                        "source_template_id": assignment_in.source_template_id,
+                        **snapshot,
+                    }
+                    for result in accepted
+                ],
+            )
+            db.commit()
+
+        return BulkAssignResult(assigned=len(accepted), rejected=len(results) - len(accepted), results=results)
+
     def list_assigned_workout_plans(
         self, db: Session, *, client_id: uuid.UUID, current_user
     ) -> List[AssignedWorkoutPlan]:
@@ -1,9 +1,10 @@
 # app/services/auth_service.py
 
 from sqlalchemy.orm import Session
-from app.core.security import verify_password
+from app.core.password_pool import password_pool
 from app.models.user import User
 from app.services.user_service import user_service
+from app.services.refresh_token_service import refresh_token_service
 from fastapi import HTTPException, status
 from datetime import datetime, timedelta
 from app.core.config import settings
@@ -23,12 +24,26 @@ class AuthService:
                 status_code=status.HTTP_401_UNAUTHORIZED, 
                 detail="Invalid credentials",
             )
-        if not verify_password(password, user.hashed_password):
+        if not password_pool.verify(password, user.hashed_password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED, 
                 detail="Invalid credentials",
             )
         
+        refresh_token_service.prune_expired(db, user_id=user.id)
+        refresh_token = refresh_token_service.issue(db, user_id=user.id)
+        db.commit()
+        return self._token_response(user, refresh_token)
+
+    def refresh_access_token(self, db: Session, *, refresh_token: str) -> dict:
+        """
+        Mints a new access token from a refresh token, rotating the refresh token.
+        No password check, so no bcrypt.
+        """
+        user, new_refresh_token = refresh_token_service.rotate(db, token=refresh_token)
+        return self._token_response(user, new_refresh_token)
+
+    def _token_response(self, user: User, refresh_token: str) -> dict:
         access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token = security.create_access_token(
             user.email,
@@ -37,6 +52,7 @@ class AuthService:
         return {
             "access_token": access_token,
             "token_type": "bearer",
+            "refresh_token": refresh_token,
         }
 
 auth_service = AuthService()
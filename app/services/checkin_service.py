@@ -2,17 +2,52 @@
 # Business logic for creating and retrieving weekly check-ins.
 
 import uuid
-from datetime import datetime, timezone
-from typing import List, Optional
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from itertools import groupby
+from typing import Any, List, Optional
+from sqlalchemy import case, delete, func, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 from app.api.deps import CurrentClient, CurrentUser
 from app.domain.client_guards import assert_client_allows_action
-from app.domain.authorization.client_access import get_client_for_viewer
+from app.domain.authorization.client_access import get_client_for_viewer, get_client_for_viewer_async
 from app.models.client import Client
 from app.models.log import Checkin
 from app.models.activity import ActivityFeed
-from app.schemas.checkin import CheckinCreate
+from app.models.checkin_rollup import CheckinRollup
+from app.schemas.checkin import CheckinCreate, CheckinSeries
+from app.domain.checkin_series import GRANULARITIES, bucket_day, bucket_start, checkin_metrics
+from app.core.pagination import keyset_page, build_page
+from app.services.activity_stream_service import activity_stream_service
+
+# Rebuilds checkin_rollups from the stored check-ins, bucketed like
+# app/domain/checkin_series.py. Migration b37f02b988cb ran the same backfill.
+ROLLUP_REBUILD_SQL = """
+    WITH samples AS (
+        SELECT c.client_id, c.checked_in_at, 'weight_kg' AS metric, c.weight_kg AS value
+        FROM checkins c
+        WHERE c.weight_kg IS NOT NULL {client_filter}
+        UNION ALL
+        SELECT c.client_id, c.checked_in_at, 'measurements.' || m.key, (m.value #>> '{{}}')::numeric
+        FROM checkins c
+        CROSS JOIN LATERAL jsonb_each(c.measurements) AS m
+        WHERE jsonb_typeof(c.measurements) = 'object' AND jsonb_typeof(m.value) = 'number' {client_filter}
+    )
+    INSERT INTO checkin_rollups (
+        client_id, granularity, metric, bucket_start,
+        sample_count, value_sum, value_min, value_max, last_value, last_checked_in_at
+    )
+    SELECT s.client_id, g.granularity, s.metric,
+           date_trunc(g.granularity, s.checked_in_at AT TIME ZONE 'UTC')::date,
+           COUNT(*), SUM(s.value), MIN(s.value), MAX(s.value),
+           (array_agg(s.value ORDER BY s.checked_in_at DESC))[1], MAX(s.checked_in_at)
+    FROM samples s
+    CROSS JOIN (VALUES ('day'), ('week'), ('month')) AS g(granularity)
+    GROUP BY 1, 2, 3, 4
+"""
 
 class CheckinService:
     def create_checkin(self, db: Session, *, obj_in: CheckinCreate, current_client: CurrentClient) -> Checkin:
@@ -38,9 +73,11 @@ class CheckinService:
 
         try:
             # 1. Create the check-in entry
+            checked_in_at = datetime.now(timezone.utc)
             checkin_entry = Checkin(
                 **obj_in.model_dump(),
-                client_id=client_id
+                client_id=client_id,
+                checked_in_at=checked_in_at
             )
             db.add(checkin_entry)
             
@@ -56,8 +93,21 @@ class CheckinService:
                 event_metadata=activity_metadata
             )
             db.add(activity_entry)
+
+            # 3. Fold the values into the client's progress chart rollups
+            self.record_rollups(
+                db,
+                client_id=client_id,
+                checked_in_at=checked_in_at,
+                weight_kg=obj_in.weight_kg,
+                measurements=obj_in.measurements,
+            )
+
+            # 4. Push the event to the trainer's live stream once committed
+            db.flush()
+            activity_stream_service.notify(db, trainer_id=client.trainer_user_id, events=[activity_entry])
             
-            # 3. Commit the transaction
+            # 5. Commit the transaction
             db.commit()
             db.refresh(checkin_entry)
             return checkin_entry
@@ -68,6 +118,170 @@ class CheckinService:
                 detail=f"Failed to submit check-in: {e}"
             )
 
+    def record_rollups(
+        self,
+        db: Session,
+        *,
+        client_id: uuid.UUID,
+        checked_in_at: datetime,
+        weight_kg: Optional[Decimal],
+        measurements: Any,
+    ) -> None:
+        """
+        Adds one check-in's metrics to its day, week and month rollup buckets with a
+        single upsert. Must be called inside the check-in's transaction, before commit.
+        """
+        metrics = checkin_metrics(weight_kg, measurements)
+        if not metrics:
+            return
+        day = bucket_day(checked_in_at)
+        rows = [
+            {
+                "client_id": client_id,
+                "granularity": granularity,
+                "metric": metric,
+                "bucket_start": bucket_start(day, granularity),
+                "sample_count": 1,
+                "value_sum": value,
+                "value_min": value,
+                "value_max": value,
+                "last_value": value,
+                "last_checked_in_at": checked_in_at,
+            }
+            for granularity in GRANULARITIES
+            for metric, value in metrics.items()
+        ]
+        stmt = pg_insert(CheckinRollup).values(rows)
+        new = stmt.excluded
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=[CheckinRollup.client_id, CheckinRollup.granularity, CheckinRollup.metric, CheckinRollup.bucket_start],
+            set_={
+                "sample_count": CheckinRollup.sample_count + new.sample_count,
+                "value_sum": CheckinRollup.value_sum + new.value_sum,
+                "value_min": func.least(CheckinRollup.value_min, new.value_min),
+                "value_max": func.greatest(CheckinRollup.value_max, new.value_max),
+                "last_value": case(
+                    (new.last_checked_in_at >= CheckinRollup.last_checked_in_at, new.last_value),
+                    else_=CheckinRollup.last_value,
+                ),
+                "last_checked_in_at": func.greatest(CheckinRollup.last_checked_in_at, new.last_checked_in_at),
+            },
+        ))
+
+    def rebuild_rollups(self, db: Session, *, client_id: Optional[uuid.UUID] = None) -> int:
+        """
+        Recomputes the rollups from the stored check-ins, for one client or for every
+        client, e.g. after check-ins were bulk-loaded. Returns the number of rollup rows written.
+        """
+        stale = delete(CheckinRollup)
+        if client_id:
+            stale = stale.where(CheckinRollup.client_id == client_id)
+        db.execute(stale)
+        rebuilt = db.execute(
+            text(ROLLUP_REBUILD_SQL.format(client_filter="AND c.client_id = :client_id" if client_id else "")),
+            {"client_id": client_id} if client_id else {},
+        ).rowcount
+        db.commit()
+        return rebuilt
+
+    def _series_stmt(
+        self,
+        *,
+        client_id: uuid.UUID,
+        granularity: str,
+        metrics: Optional[List[str]],
+        start_date: Optional[date],
+        end_date: Optional[date],
+    ):
+        stmt = select(CheckinRollup).where(
+            CheckinRollup.client_id == client_id,
+            CheckinRollup.granularity == granularity,
+        )
+        if metrics:
+            stmt = stmt.where(CheckinRollup.metric.in_(set(metrics)))
+        if start_date:
+            # Include the bucket that start_date falls in.
+            stmt = stmt.where(CheckinRollup.bucket_start >= bucket_start(start_date, granularity))
+        if end_date:
+            stmt = stmt.where(CheckinRollup.bucket_start <= end_date)
+        return stmt.order_by(CheckinRollup.metric, CheckinRollup.bucket_start)
+
+    def _build_series(self, rollups: List[CheckinRollup], *, client_id: uuid.UUID, granularity: str) -> CheckinSeries:
+        return CheckinSeries(
+            client_id=client_id,
+            granularity=granularity,
+            series=[
+                {
+                    "metric": metric,
+                    "points": [
+                        {
+                            "bucket_start": rollup.bucket_start,
+                            "count": rollup.sample_count,
+                            "min": rollup.value_min,
+                            "max": rollup.value_max,
+                            "avg": rollup.value_sum / rollup.sample_count,
+                            "last": rollup.last_value,
+                        }
+                        for rollup in points
+                    ],
+                }
+                for metric, points in groupby(rollups, key=lambda rollup: rollup.metric)
+            ],
+        )
+
+    def get_checkin_series(
+        self,
+        db: Session,
+        *,
+        client_id: uuid.UUID,
+        current_user: CurrentUser,
+        granularity: str,
+        metrics: Optional[List[str]],
+        start_date: Optional[date],
+        end_date: Optional[date],
+    ) -> CheckinSeries:
+        """
+        Downsampled weight and measurement series for progress charts, read from the
+        rollup table: one point per day, week or month that has check-ins.
+        """
+        client = get_client_for_viewer(db, client_id=client_id, current_user=current_user)
+        assert_client_allows_action(client, "view_checkins")
+
+        stmt = self._series_stmt(
+            client_id=client_id, granularity=granularity, metrics=metrics, start_date=start_date, end_date=end_date
+        )
+        return self._build_series(db.scalars(stmt).all(), client_id=client_id, granularity=granularity)
+
+    async def get_checkin_series_async(
+        self,
+        db: AsyncSession,
+        *,
+        client_id: uuid.UUID,
+        current_user: CurrentUser,
+        granularity: str,
+        metrics: Optional[List[str]],
+        start_date: Optional[date],
+        end_date: Optional[date],
+    ) -> CheckinSeries:
+        """
+        AsyncSession counterpart of get_checkin_series.
+        """
+        client = await get_client_for_viewer_async(db, client_id=client_id, current_user=current_user)
+        assert_client_allows_action(client, "view_checkins")
+
+        stmt = self._series_stmt(
+            client_id=client_id, granularity=granularity, metrics=metrics, start_date=start_date, end_date=end_date
+        )
+        return self._build_series((await db.scalars(stmt)).all(), client_id=client_id, granularity=granularity)
+
+    def _checkins_stmt(self, *, client_id: uuid.UUID, start_date: Optional[datetime], end_date: Optional[datetime]):
+        stmt = select(Checkin).where(Checkin.client_id == client_id)
+        if start_date:
+            stmt = stmt.where(Checkin.checked_in_at >= start_date)
+        if end_date:
+            stmt = stmt.where(Checkin.checked_in_at <= end_date)
+        return stmt
+
     def get_checkins_by_client(
         self, 
         db: Session, 
@@ -85,13 +299,73 @@ class CheckinService:
         client = get_client_for_viewer(db, client_id=client_id, current_user=current_user)
         assert_client_allows_action(client, "view_checkins")
 
-        query = db.query(Checkin).filter(Checkin.client_id == client_id)
-        
-        if start_date:
-            query = query.filter(Checkin.checked_in_at >= start_date)
-        if end_date:
-            query = query.filter(Checkin.checked_in_at <= end_date)
-            
-        return query.order_by(Checkin.checked_in_at.desc()).offset(skip).limit(limit).all()
+        stmt = self._checkins_stmt(client_id=client_id, start_date=start_date, end_date=end_date)
+        return db.scalars(stmt.order_by(Checkin.checked_in_at.desc(), Checkin.id.desc()).offset(skip).limit(limit)).all()
+
+    async def get_checkins_by_client_async(
+        self,
+        db: AsyncSession,
+        *,
+        client_id: uuid.UUID,
+        current_user: CurrentUser,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        skip: int,
+        limit: int
+    ) -> List[Checkin]:
+        """
+        AsyncSession counterpart of get_checkins_by_client.
+        """
+        client = await get_client_for_viewer_async(db, client_id=client_id, current_user=current_user)
+        assert_client_allows_action(client, "view_checkins")
+
+        stmt = self._checkins_stmt(client_id=client_id, start_date=start_date, end_date=end_date)
+        return (await db.scalars(stmt.order_by(Checkin.checked_in_at.desc(), Checkin.id.desc()).offset(skip).limit(limit))).all()
+
+    def get_checkins_page(
+        self,
+        db: Session,
+        *,
+        client_id: uuid.UUID,
+        current_user: CurrentUser,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        cursor: Optional[str],
+        limit: int
+    ) -> dict:
+        """
+        Keyset-paginated check-ins, newest first, keyed on (checked_in_at, id).
+        """
+        client = get_client_for_viewer(db, client_id=client_id, current_user=current_user)
+        assert_client_allows_action(client, "view_checkins")
+
+        stmt = keyset_page(
+            self._checkins_stmt(client_id=client_id, start_date=start_date, end_date=end_date),
+            sort_column=Checkin.checked_in_at, id_column=Checkin.id, cursor=cursor, limit=limit,
+        )
+        return build_page(db.scalars(stmt).all(), sort_attr="checked_in_at", limit=limit)
+
+    async def get_checkins_page_async(
+        self,
+        db: AsyncSession,
+        *,
+        client_id: uuid.UUID,
+        current_user: CurrentUser,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        cursor: Optional[str],
+        limit: int
+    ) -> dict:
+        """
+        AsyncSession counterpart of get_checkins_page.
+        """
+        client = await get_client_for_viewer_async(db, client_id=client_id, current_user=current_user)
+        assert_client_allows_action(client, "view_checkins")
+
+        stmt = keyset_page(
+            self._checkins_stmt(client_id=client_id, start_date=start_date, end_date=end_date),
+            sort_column=Checkin.checked_in_at, id_column=Checkin.id, cursor=cursor, limit=limit,
+        )
+        return build_page((await db.scalars(stmt)).all(), sort_attr="checked_in_at", limit=limit)
 
 checkin_service = CheckinService()
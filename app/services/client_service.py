@@ -6,6 +6,7 @@ import string
 from typing import List, Optional
 from fastapi import HTTPException, status, APIRouter, Depends
 from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import desc
 from app.models.client import Client
 from app.models.log import Checkin
@@ -14,23 +15,37 @@ from app.schemas.user import UserCreate
 from app.schemas.client import ClientInvite
 from app.schemas.client import ClientUpdate
 from app.services.user_service import user_service
+from app.services.trainer_service import trainer_service
+from app.cache.auth_cache import invalidate_cached_user
 from app.models.plan import AssignedWorkoutPlan, AssignedDietPlan
 from app.schemas.assigned_plan import ClientAssignedPlans
 from app.domain.client_lifecycle import assert_valid_client_transition
-from app.domain.authorization.client_access import get_client_for_trainer
+from app.domain.authorization.client_access import get_client_for_trainer, get_client_for_trainer_async
 from app.domain.errors import OwnershipViolation, ResourceNotFound
 
 
 class ClientService:
+    def _invalidate_client_user(self, client: Client) -> None:
+        # The client's status is part of the cached auth snapshot of its user.
+        if client.client_user is not None:
+            invalidate_cached_user(client.client_user.email)
+
     def update_client(
         self, db: Session, *, client: Client, obj_in: ClientUpdate
     ) -> Client:
+        old_status = client.client_status
         update_data = obj_in.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(client, field, value)
         db.add(client)
+        if "client_status" in update_data:
+            trainer_service.record_status_change(
+                db, trainer_id=client.trainer_user_id, old_status=old_status, new_status=client.client_status
+            )
         db.commit()
         db.refresh(client)
+        if "client_status" in update_data:
+            self._invalidate_client_user(client)
         return client
 
     def generate_invite_code(self, length: int = 10) -> str:
@@ -57,6 +72,23 @@ class ClientService:
                 status_code=status.HTTP_404_NOT_FOUND, detail="Client not found"
             )
 
+    async def get_client_by_id_async(
+        self, db: AsyncSession, *, client_id: uuid.UUID, trainer_id: uuid.UUID
+    ) -> Client:
+        """
+        AsyncSession counterpart of get_client_by_id, with the same 404 masking.
+        """
+        try:
+            return await get_client_for_trainer_async(
+                db,
+                client_id=client_id,
+                trainer_id=trainer_id,
+            )
+        except (OwnershipViolation, ResourceNotFound):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Client not found"
+            )
+
     def get_clients_by_trainer(
         self,
         db: Session,
@@ -83,10 +115,14 @@ class ClientService:
 
     def update_client_status(self, db, client, new_status: str):
         assert_valid_client_transition(client.client_status, new_status)
+        trainer_service.record_status_change(
+            db, trainer_id=client.trainer_user_id, old_status=client.client_status, new_status=new_status
+        )
         client.client_status = new_status
         db.add(client)
         db.commit()
         db.refresh(client)
+        self._invalidate_client_user(client)
         return client
 
     def create_client_invite(
@@ -273,9 +309,13 @@ class ClientService:
             client.client_user_id = new_user.id
             client.client_status = "active"
             db.add(client)
+            trainer_service.record_status_change(
+                db, trainer_id=client.trainer_user_id, old_status="invited", new_status="active"
+            )
 
             db.commit()
             db.refresh(new_user)
+            invalidate_cached_user(new_user.email)
             return new_user
         except Exception as e:
             db.rollback()
@@ -4,12 +4,70 @@
 import uuid
 from typing import List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import Numeric, case, cast, func, literal, or_, select, tuple_
 from datetime import datetime
 from app.models.template import ExerciseLibrary, FoodItemLibrary
+from app.core.pagination import encode_rank_cursor, decode_rank_cursor
+from app.services.template_service import template_service
 from app.schemas.library import LibraryExerciseCreate, LibraryExerciseUpdate, LibraryFoodItemCreate, LibraryFoodItemUpdate
 
+# Food item fields that feed into calculate_nutrition.
+NUTRITION_FIELDS = {"base_unit_type", "grams_per_ml", "calories_per_100g", "protein_per_100g", "carbs_per_100g", "fat_per_100g"}
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
 class LibraryService:
+    # --- Search ---
+
+    def _search(self, db: Session, model, *, trainer_id: uuid.UUID, q: str, cursor: Optional[str], limit: int) -> dict:
+        """
+        Ranked, cursor-paginated name search over verified items plus the trainer's
+        private ones, in a single query served by the trigram index on `name`.
+
+        Rank is a distance (lower is better): names starting with `q` come first,
+        then everything by descending word similarity; ties break on name, then id.
+        """
+        q = q.strip()
+        escaped = _escape_like(q)
+        rank = func.round(
+            cast(
+                case((model.name.ilike(f"{escaped}%", escape="\\"), 0), else_=1)
+                + (1 - func.word_similarity(q, model.name)),
+                Numeric,
+            ),
+            6,
+        ).label("search_rank")
+
+        stmt = (
+            select(model, rank)
+            .where(
+                or_(model.is_verified == True, model.owner_trainer_id == trainer_id),
+                model.deleted_at.is_(None),
+                # Substring match, or fuzzy word match (pg_trgm's <% operator) for typos.
+                or_(model.name.ilike(f"%{escaped}%", escape="\\"), literal(q).op("<%")(model.name)),
+            )
+        )
+        if cursor:
+            last_rank, last_name, last_id = decode_rank_cursor(cursor)
+            stmt = stmt.where(tuple_(rank, model.name, model.id) > tuple_(last_rank, last_name, last_id))
+        rows = db.execute(stmt.order_by(rank, model.name, model.id).limit(limit + 1)).all()
+
+        items = [row[0] for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            last_item, last_rank = rows[limit - 1]
+            next_cursor = encode_rank_cursor(last_rank, last_item.name, last_item.id)
+        return {"items": items, "next_cursor": next_cursor}
+
+    def search_exercises(self, db: Session, *, trainer_id: uuid.UUID, q: str, cursor: Optional[str] = None, limit: int = 20) -> dict:
+        return self._search(db, ExerciseLibrary, trainer_id=trainer_id, q=q, cursor=cursor, limit=limit)
+
+    def search_food_items(self, db: Session, *, trainer_id: uuid.UUID, q: str, cursor: Optional[str] = None, limit: int = 20) -> dict:
+        return self._search(db, FoodItemLibrary, trainer_id=trainer_id, q=q, cursor=cursor, limit=limit)
+
     # --- Exercise Library Methods ---
 
     def get_exercises(self, db: Session, *, trainer_id: uuid.UUID) -> List[ExerciseLibrary]:
@@ -21,6 +79,22 @@ class LibraryService:
             ExerciseLibrary.deleted_at.is_(None)
         ).all()
 
+    def _library_version(self, db: Session, model, *, trainer_id: uuid.UUID) -> tuple:
+        """
+        ETag fingerprint of the library list: live row count plus the latest change.
+        Soft-deleted rows are included in max(updated_at) so deletions count as changes.
+        """
+        row = db.execute(
+            select(
+                func.count(model.id).filter(model.deleted_at.is_(None)),
+                func.max(model.updated_at),
+            ).where(or_(model.is_verified == True, model.owner_trainer_id == trainer_id))
+        ).one()
+        return (trainer_id, *row)
+
+    def get_exercises_version(self, db: Session, *, trainer_id: uuid.UUID) -> tuple:
+        return self._library_version(db, ExerciseLibrary, trainer_id=trainer_id)
+
     def create_exercise(self, db: Session, *, obj_in: LibraryExerciseCreate, trainer_id: uuid.UUID) -> ExerciseLibrary:
         """
         Creates a new, private exercise for a trainer.
@@ -43,6 +117,9 @@ class LibraryService:
         for field, value in update_data.items():
             setattr(exercise, field, value)
         db.add(exercise)
+        # Plan snapshots embed the exercise and are reused per template version.
+        if update_data:
+            template_service.bump_versions_using_exercise(db, exercise_id=exercise.id)
         db.commit()
         db.refresh(exercise)
         return exercise
@@ -67,6 +144,9 @@ class LibraryService:
             FoodItemLibrary.deleted_at.is_(None)
         ).all()
 
+    def get_food_items_version(self, db: Session, *, trainer_id: uuid.UUID) -> tuple:
+        return self._library_version(db, FoodItemLibrary, trainer_id=trainer_id)
+
     def create_food_item(self, db: Session, *, obj_in: LibraryFoodItemCreate, trainer_id: uuid.UUID) -> FoodItemLibrary:
         """
         Creates a new, private food item for a trainer.
@@ -89,6 +169,11 @@ class LibraryService:
         for field, value in update_data.items():
             setattr(food_item, field, value)
         db.add(food_item)
+        # Diet templates store the nutrition derived from this row.
+        if NUTRITION_FIELDS & update_data.keys():
+            template_service.refresh_food_item_nutrition(db, food_item=food_item)
+        if update_data:
+            template_service.bump_versions_using_food_item(db, food_item_id=food_item.id)
         db.commit()
         db.refresh(food_item)
         return food_item
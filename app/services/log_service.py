@@ -4,16 +4,27 @@
 import uuid
 from datetime import datetime, timezone
 from typing import List, Optional
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 from app.models.client import Client
 from app.models.log import WorkoutLog, DietLog
 from app.models.activity import ActivityFeed
 from app.api.deps import CurrentClient, CurrentUser
-from app.models.plan import AssignedWorkoutPlan, AssignedDietPlan
-from app.schemas.log import WorkoutLogCreate, DietLogCreate
+from app.models.plan import AssignedWorkoutPlan, AssignedDietPlan, PlanSnapshot
+from app.schemas.log import WorkoutLogCreate, DietLogCreate, LogBatchCreate, LogBatchItemResult, LogBatchResult
 from app.domain.client_guards import assert_client_allows_action
-from app.domain.authorization.client_access import get_client_for_viewer
+from app.domain.streaks import activity_day
+from app.domain.errors import InvalidClientState
+from app.domain.authorization.client_access import get_client_for_viewer, get_client_for_viewer_async
+from app.services.streak_service import streak_service
+from app.services.activity_stream_service import activity_stream_service
+from app.core.pagination import keyset_page, build_page
+
+# Mirrors the CHECK constraint on diet_logs.status. Checked up front in the batch
+# path so one bad item cannot fail the multi-row insert for the whole batch.
+DIET_LOG_STATUSES = {"Followed", "Partially Followed", "Skipped"}
 
 class LogService:
     def create_workout_log(self, db: Session, *, obj_in: WorkoutLogCreate, current_client: CurrentClient) -> WorkoutLog:
@@ -65,8 +76,15 @@ class LogService:
                 }
             )
             db.add(activity_entry)
+
+            # 6. Advance the client's streak in the same transaction
+            streak_service.record_activity(db, client_id=client_id)
+
+            # 7. Push the event to the trainer's live stream once committed
+            db.flush()
+            activity_stream_service.notify(db, trainer_id=client.trainer_user_id, events=[activity_entry])
             
-            # 6. Commit the transaction
+            # 8. Commit the transaction
             db.commit()
             db.refresh(log_entry)
             return log_entry
@@ -119,6 +137,13 @@ class LogService:
                 }
             )
             db.add(activity_entry)
+
+            # 6. Advance the client's streak in the same transaction
+            streak_service.record_activity(db, client_id=client_id)
+
+            # 7. Push the event to the trainer's live stream once committed
+            db.flush()
+            activity_stream_service.notify(db, trainer_id=client.trainer_user_id, events=[activity_entry])
             
             db.commit()
             db.refresh(log_entry)
@@ -127,27 +152,237 @@ class LogService:
             db.rollback()
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to log diet: {e}")
 
+    def create_logs_batch(self, db: Session, *, obj_in: LogBatchCreate, current_client: CurrentClient) -> LogBatchResult:
+        """
+        Ingests a batch of workout and diet logs (e.g. replayed by an offline device).
+        Items are validated individually and rejected items do not block the rest;
+        the accepted ones are written in one transaction with one insert per table.
+        """
+        if not current_client.client_profile:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Client profile not found for this user.")
+        client_id = current_client.client_profile.id
+
+        client = db.query(Client).filter(
+            Client.id == client_id,
+            Client.deleted_at.is_(None)
+        ).first()
+        if not client:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Client not found")
+
+        # One IN query per plan table instead of one lookup per item.
+        plan_models = {"workout": AssignedWorkoutPlan, "diet": AssignedDietPlan}
+        plans = {}
+        for kind, model in plan_models.items():
+            plan_ids = {item.assigned_plan_id for item in obj_in.items if item.kind == kind}
+            if plan_ids:
+                plans[kind] = {
+                    row.id: row
+                    for row in db.execute(
+                        select(model.id, PlanSnapshot.plan_details)
+                        .join(PlanSnapshot, PlanSnapshot.content_hash == model.snapshot_hash)
+                        .where(
+                            model.id.in_(plan_ids),
+                            model.client_id == client_id,
+                            model.deleted_at.is_(None),
+                        )
+                    )
+                }
+
+        now = datetime.now(timezone.utc)
+        results = [
+            LogBatchItemResult(index=index, kind=item.kind, status="rejected")
+            for index, item in enumerate(obj_in.items)
+        ]
+        accepted = {"workout": [], "diet": []}
+        for index, item in enumerate(obj_in.items):
+            try:
+                assert_client_allows_action(client, f"log_{item.kind}")
+            except InvalidClientState as e:
+                results[index].error = str(e)
+                continue
+            if item.assigned_plan_id not in plans.get(item.kind, {}):
+                results[index].error = f"Assigned {item.kind} plan not found for this client."
+            elif item.kind == "diet" and item.status not in DIET_LOG_STATUSES:
+                results[index].error = f"Invalid diet log status '{item.status}'."
+            elif item.logged_at is not None and item.logged_at > now:
+                results[index].error = "loggedAt cannot be in the future."
+            else:
+                accepted[item.kind].append(index)
+
+        if not accepted["workout"] and not accepted["diet"]:
+            return LogBatchResult(created=0, rejected=len(results), results=results)
+
+        def logged_at(item):
+            return item.logged_at or now
+
+        try:
+            activity_rows = []
+            if accepted["workout"]:
+                items = [obj_in.items[i] for i in accepted["workout"]]
+                log_ids = db.scalars(
+                    insert(WorkoutLog).returning(WorkoutLog.id, sort_by_parameter_order=True),
+                    [
+                        {
+                            "client_id": client_id,
+                            "assigned_plan_id": item.assigned_plan_id,
+                            "performance_data": item.performance_data,
+                            "logged_at": logged_at(item),
+                        }
+                        for item in items
+                    ],
+                ).all()
+                for index, item, log_id in zip(accepted["workout"], items, log_ids):
+                    results[index].status, results[index].id = "created", log_id
+                    activity_rows.append({
+                        "client_id": client_id,
+                        "event_type": "WORKOUT_LOGGED",
+                        "event_timestamp": logged_at(item),
+                        "event_metadata": {
+                            "workout_name": plans["workout"][item.assigned_plan_id].plan_details.get("name", "Workout"),
+                            "log_id": str(log_id),
+                        },
+                    })
+
+            if accepted["diet"]:
+                items = [obj_in.items[i] for i in accepted["diet"]]
+                log_ids = db.scalars(
+                    insert(DietLog).returning(DietLog.id, sort_by_parameter_order=True),
+                    [
+                        {
+                            "client_id": client_id,
+                            "assigned_plan_id": item.assigned_plan_id,
+                            "meal_name": item.meal_name,
+                            "status": item.status,
+                            "logged_at": logged_at(item),
+                        }
+                        for item in items
+                    ],
+                ).all()
+                for index, item, log_id in zip(accepted["diet"], items, log_ids):
+                    results[index].status, results[index].id = "created", log_id
+                    activity_rows.append({
+                        "client_id": client_id,
+                        "event_type": "DIET_LOGGED",
+                        "event_timestamp": logged_at(item),
+                        "event_metadata": {
+                            "meal_name": item.meal_name,
+                            "status": item.status,
+                            "log_id": str(log_id),
+                        },
+                    })
+
+            activity_ids = db.scalars(
+                insert(ActivityFeed).returning(ActivityFeed.id, sort_by_parameter_order=True), activity_rows
+            ).all()
+            activity_stream_service.notify(
+                db,
+                trainer_id=client.trainer_user_id,
+                events=[{**row, "id": activity_id} for row, activity_id in zip(activity_rows, activity_ids)],
+            )
+
+            streak_service.record_activities(
+                db,
+                client_id=client_id,
+                activity_dates=[
+                    activity_day(logged_at(obj_in.items[i]))
+                    for i in accepted["workout"] + accepted["diet"]
+                ],
+            )
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to ingest logs: {e}")
+
+        created = len(accepted["workout"]) + len(accepted["diet"])
+        return LogBatchResult(created=created, rejected=len(results) - created, results=results)
+
+    def _workout_logs_stmt(self, *, client_id: uuid.UUID, start_date: Optional[datetime], end_date: Optional[datetime]):
+        stmt = select(WorkoutLog).where(WorkoutLog.client_id == client_id)
+        if start_date:
+            stmt = stmt.where(WorkoutLog.logged_at >= start_date)
+        if end_date:
+            stmt = stmt.where(WorkoutLog.logged_at <= end_date)
+        return stmt
+
+    def _diet_logs_stmt(self, *, client_id: uuid.UUID, start_date: Optional[datetime], end_date: Optional[datetime]):
+        stmt = select(DietLog).where(DietLog.client_id == client_id)
+        if start_date:
+            stmt = stmt.where(DietLog.logged_at >= start_date)
+        if end_date:
+            stmt = stmt.where(DietLog.logged_at <= end_date)
+        return stmt
+
     def get_workout_logs(self, db: Session, *, client_id: uuid.UUID, current_user: CurrentUser, start_date: Optional[datetime], end_date: Optional[datetime], skip: int, limit: int) -> List[WorkoutLog]:
         client = get_client_for_viewer(db, client_id=client_id, current_user=current_user)
         assert_client_allows_action(client, "view_logs")
 
-        query = db.query(WorkoutLog).filter(WorkoutLog.client_id == client_id)
-        if start_date:
-            query = query.filter(WorkoutLog.logged_at >= start_date)
-        if end_date:
-            query = query.filter(WorkoutLog.logged_at <= end_date)
-        return query.order_by(WorkoutLog.logged_at.desc()).offset(skip).limit(limit).all()
+        stmt = self._workout_logs_stmt(client_id=client_id, start_date=start_date, end_date=end_date)
+        return db.scalars(stmt.order_by(WorkoutLog.logged_at.desc(), WorkoutLog.id.desc()).offset(skip).limit(limit)).all()
 
     def get_diet_logs(self, db: Session, *, client_id: uuid.UUID, current_user: CurrentUser, start_date: Optional[datetime], end_date: Optional[datetime], skip: int, limit: int) -> List[DietLog]:
         client = get_client_for_viewer(db, client_id=client_id, current_user=current_user)
         assert_client_allows_action(client, "view_logs")
 
-        query = db.query(DietLog).filter(DietLog.client_id == client_id)
-        if start_date:
-            query = query.filter(DietLog.logged_at >= start_date)
-        if end_date:
-            query = query.filter(DietLog.logged_at <= end_date)
-        return query.order_by(DietLog.logged_at.desc()).offset(skip).limit(limit).all()
+        stmt = self._diet_logs_stmt(client_id=client_id, start_date=start_date, end_date=end_date)
+        return db.scalars(stmt.order_by(DietLog.logged_at.desc(), DietLog.id.desc()).offset(skip).limit(limit)).all()
+
+    # --- Keyset pagination on (logged_at, id) ---
+
+    def get_workout_logs_page(self, db: Session, *, client_id: uuid.UUID, current_user: CurrentUser, start_date: Optional[datetime], end_date: Optional[datetime], cursor: Optional[str], limit: int) -> dict:
+        client = get_client_for_viewer(db, client_id=client_id, current_user=current_user)
+        assert_client_allows_action(client, "view_logs")
+
+        stmt = keyset_page(
+            self._workout_logs_stmt(client_id=client_id, start_date=start_date, end_date=end_date),
+            sort_column=WorkoutLog.logged_at, id_column=WorkoutLog.id, cursor=cursor, limit=limit,
+        )
+        return build_page(db.scalars(stmt).all(), sort_attr="logged_at", limit=limit)
+
+    def get_diet_logs_page(self, db: Session, *, client_id: uuid.UUID, current_user: CurrentUser, start_date: Optional[datetime], end_date: Optional[datetime], cursor: Optional[str], limit: int) -> dict:
+        client = get_client_for_viewer(db, client_id=client_id, current_user=current_user)
+        assert_client_allows_action(client, "view_logs")
+
+        stmt = keyset_page(
+            self._diet_logs_stmt(client_id=client_id, start_date=start_date, end_date=end_date),
+            sort_column=DietLog.logged_at, id_column=DietLog.id, cursor=cursor, limit=limit,
+        )
+        return build_page(db.scalars(stmt).all(), sort_attr="logged_at", limit=limit)
+
+    # --- AsyncSession read paths (used when DB_ASYNC_ENABLED is set) ---
+
+    async def get_workout_logs_async(self, db: AsyncSession, *, client_id: uuid.UUID, current_user: CurrentUser, start_date: Optional[datetime], end_date: Optional[datetime], skip: int, limit: int) -> List[WorkoutLog]:
+        client = await get_client_for_viewer_async(db, client_id=client_id, current_user=current_user)
+        assert_client_allows_action(client, "view_logs")
+
+        stmt = self._workout_logs_stmt(client_id=client_id, start_date=start_date, end_date=end_date)
+        return (await db.scalars(stmt.order_by(WorkoutLog.logged_at.desc(), WorkoutLog.id.desc()).offset(skip).limit(limit))).all()
+
+    async def get_diet_logs_async(self, db: AsyncSession, *, client_id: uuid.UUID, current_user: CurrentUser, start_date: Optional[datetime], end_date: Optional[datetime], skip: int, limit: int) -> List[DietLog]:
+        client = await get_client_for_viewer_async(db, client_id=client_id, current_user=current_user)
+        assert_client_allows_action(client, "view_logs")
+
+        stmt = self._diet_logs_stmt(client_id=client_id, start_date=start_date, end_date=end_date)
+        return (await db.scalars(stmt.order_by(DietLog.logged_at.desc(), DietLog.id.desc()).offset(skip).limit(limit))).all()
+
+    async def get_workout_logs_page_async(self, db: AsyncSession, *, client_id: uuid.UUID, current_user: CurrentUser, start_date: Optional[datetime], end_date: Optional[datetime], cursor: Optional[str], limit: int) -> dict:
+        client = await get_client_for_viewer_async(db, client_id=client_id, current_user=current_user)
+        assert_client_allows_action(client, "view_logs")
+
+        stmt = keyset_page(
+            self._workout_logs_stmt(client_id=client_id, start_date=start_date, end_date=end_date),
+            sort_column=WorkoutLog.logged_at, id_column=WorkoutLog.id, cursor=cursor, limit=limit,
+        )
+        return build_page((await db.scalars(stmt)).all(), sort_attr="logged_at", limit=limit)
+
+    async def get_diet_logs_page_async(self, db: AsyncSession, *, client_id: uuid.UUID, current_user: CurrentUser, start_date: Optional[datetime], end_date: Optional[datetime], cursor: Optional[str], limit: int) -> dict:
+        client = await get_client_for_viewer_async(db, client_id=client_id, current_user=current_user)
+        assert_client_allows_action(client, "view_logs")
+
+        stmt = keyset_page(
+            self._diet_logs_stmt(client_id=client_id, start_date=start_date, end_date=end_date),
+            sort_column=DietLog.logged_at, id_column=DietLog.id, cursor=cursor, limit=limit,
+        )
+        return build_page((await db.scalars(stmt)).all(), sort_attr="logged_at", limit=limit)
 
 
 log_service = LogService()
@@ -0,0 +1,92 @@
+# app/services/refresh_token_service.py
+# Issues and rotates long-lived refresh tokens, so clients renew access tokens without a password (bcrypt) check.
+
+import hashlib
+import secrets
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from fastapi import HTTPException, status
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.refresh_token import RefreshToken
+from app.models.user import User
+
+
+def _hash(token: str) -> str:
+    # Tokens are 256 random bits, so a plain SHA-256 is enough; no slow hash needed.
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class RefreshTokenService:
+    def issue(self, db: Session, *, user_id: uuid.UUID, family_id: Optional[uuid.UUID] = None) -> str:
+        """
+        Adds a new refresh token for the user (a new family unless one is given) and
+        returns it. The caller commits.
+        """
+        token = secrets.token_urlsafe(32)
+        db.add(RefreshToken(
+            user_id=user_id,
+            family_id=family_id or uuid.uuid4(),
+            token_hash=_hash(token),
+            expires_at=datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+        ))
+        return token
+
+    def rotate(self, db: Session, *, token: str) -> tuple[User, str]:
+        """
+        Exchanges a valid refresh token for its user and a new token of the same family,
+        and commits. A token that was already used (or revoked) is treated as stolen:
+        its whole family is revoked.
+
+        Raises:
+            HTTPException: 401 if the token is unknown, expired, reused or revoked.
+        """
+        invalid = HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
+        now = datetime.now(timezone.utc)
+
+        # The row lock makes concurrent refreshes with the same token take turns,
+        # so only the first one can rotate it.
+        stored = db.scalars(
+            select(RefreshToken).where(RefreshToken.token_hash == _hash(token)).with_for_update()
+        ).first()
+        if stored is None:
+            raise invalid
+        if stored.revoked_at is not None:
+            self._revoke(db, RefreshToken.family_id == stored.family_id, now)
+            db.commit()
+            raise invalid
+        if stored.expires_at <= now:
+            raise invalid
+
+        user = db.get(User, stored.user_id)
+        if user is None or user.deleted_at is not None:
+            raise invalid
+
+        stored.revoked_at = now
+        new_token = self.issue(db, user_id=user.id, family_id=stored.family_id)
+        db.commit()
+        return user, new_token
+
+    def revoke_all(self, db: Session, *, user_id: uuid.UUID) -> None:
+        """Revokes every refresh token of the user (e.g. on password change). The caller commits."""
+        self._revoke(db, RefreshToken.user_id == user_id, datetime.now(timezone.utc))
+
+    def prune_expired(self, db: Session, *, user_id: uuid.UUID) -> None:
+        """Deletes the user's expired tokens, which are no longer needed for reuse detection. The caller commits."""
+        db.execute(delete(RefreshToken).where(
+            RefreshToken.user_id == user_id,
+            RefreshToken.expires_at <= datetime.now(timezone.utc),
+        ))
+
+    def _revoke(self, db: Session, condition, now: datetime) -> None:
+        db.execute(
+            update(RefreshToken)
+            .where(condition, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=now)
+            .execution_options(synchronize_session=False)
+        )
+
+
+refresh_token_service = RefreshTokenService()
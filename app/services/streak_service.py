@@ -0,0 +1,130 @@
+# app/services/streak_service.py
+# Maintains the persisted per-client streak state used by the trainee dashboard.
+
+import uuid
+from datetime import date
+from itertools import groupby
+from typing import Iterable, Optional
+from sqlalchemy import Date, cast, delete, func, insert, select, union
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.log import WorkoutLog, DietLog
+from app.models.streak import ClientStreak
+from app.domain import streaks
+from app.domain.streaks import StreakState, EMPTY_STREAK, advance_streak, compute_streak, streak_as_of
+
+class StreakService:
+    def record_activity(self, db: Session, *, client_id: uuid.UUID, activity_date: Optional[date] = None) -> ClientStreak:
+        """
+        Advances the client's streak for a newly created log.
+        Must be called inside the log's transaction, before commit; the row is locked
+        so concurrent logs for the same client are applied one after the other.
+        """
+        activity_date = activity_date or streaks.today()
+
+        streak = self._lock_streak(db, client_id)
+        state = advance_streak(
+            StreakState(streak.current_streak_days, streak.longest_streak_days, streak.last_active_date),
+            activity_date,
+        )
+        streak.current_streak_days, streak.longest_streak_days, streak.last_active_date = state
+        db.add(streak)
+        return streak
+
+    def record_activities(self, db: Session, *, client_id: uuid.UUID, activity_dates: Iterable[date]) -> ClientStreak:
+        """
+        Batch counterpart of record_activity, for logs replayed with their original dates.
+        Must be called after the logs have been flushed, inside their transaction.
+        """
+        activity_dates = sorted(set(activity_dates))
+        streak = self._lock_streak(db, client_id)
+        state = StreakState(streak.current_streak_days, streak.longest_streak_days, streak.last_active_date)
+        if state.last_active_date is not None and activity_dates and activity_dates[0] < state.last_active_date:
+            # Backdated activity can join or split past runs; recompute from the history,
+            # which already includes the flushed logs.
+            state = compute_streak(r.day for r in db.execute(self._active_days_stmt(client_id)))
+        else:
+            for activity_date in activity_dates:
+                state = advance_streak(state, activity_date)
+        streak.current_streak_days, streak.longest_streak_days, streak.last_active_date = state
+        db.add(streak)
+        return streak
+
+    def _lock_streak(self, db: Session, client_id: uuid.UUID) -> ClientStreak:
+        # Make sure the row exists without racing a concurrent first log.
+        db.execute(
+            pg_insert(ClientStreak)
+            .values(client_id=client_id)
+            .on_conflict_do_nothing(index_elements=[ClientStreak.client_id])
+        )
+        return (
+            db.query(ClientStreak)
+            .filter(ClientStreak.client_id == client_id)
+            .with_for_update()
+            .populate_existing()
+            .one()
+        )
+
+    def _streak_stmt(self, client_id: uuid.UUID):
+        return select(
+            ClientStreak.current_streak_days,
+            ClientStreak.longest_streak_days,
+            ClientStreak.last_active_date,
+        ).where(ClientStreak.client_id == client_id)
+
+    def get_streak(self, db: Session, *, client_id: uuid.UUID) -> StreakState:
+        row = db.execute(self._streak_stmt(client_id)).first()
+        return StreakState(*row) if row else EMPTY_STREAK
+
+    def get_current_streak_days(self, db: Session, *, client_id: uuid.UUID, today: date) -> int:
+        """Primary-key lookup of the streak to show on the dashboard for 'today'."""
+        return streak_as_of(self.get_streak(db, client_id=client_id), today)
+
+    async def get_current_streak_days_async(self, db: AsyncSession, *, client_id: uuid.UUID, today: date) -> int:
+        """AsyncSession counterpart of get_current_streak_days."""
+        row = (await db.execute(self._streak_stmt(client_id))).first()
+        return streak_as_of(StreakState(*row) if row else EMPTY_STREAK, today)
+
+    @staticmethod
+    def _activity_day(logged_at):
+        # SQL form of streaks.activity_day: the UTC date, whatever the session's TimeZone.
+        return cast(func.timezone("UTC", logged_at), Date)
+
+    def _active_days_stmt(self, client_id: Optional[uuid.UUID] = None):
+        """Distinct (client_id, day) pairs with any workout or diet log, ordered by client and day."""
+        workout_days = select(WorkoutLog.client_id, self._activity_day(WorkoutLog.logged_at).label("day"))
+        diet_days = select(DietLog.client_id, self._activity_day(DietLog.logged_at).label("day"))
+        if client_id:
+            workout_days = workout_days.filter(WorkoutLog.client_id == client_id)
+            diet_days = diet_days.filter(DietLog.client_id == client_id)
+
+        # UNION (not UNION ALL) already de-duplicates the (client, day) pairs.
+        active_days = union(workout_days, diet_days).subquery()
+        return (
+            select(active_days.c.client_id, active_days.c.day)
+            .order_by(active_days.c.client_id, active_days.c.day)
+        )
+
+    def rebuild(self, db: Session, *, client_id: Optional[uuid.UUID] = None) -> int:
+        """
+        Recomputes streak state from the full workout/diet log history, for one client
+        or for every client with logs. Returns the number of streak rows written.
+        """
+        rows = db.execute(self._active_days_stmt(client_id)).all()
+
+        streak_rows = []
+        for row_client_id, client_rows in groupby(rows, key=lambda r: r.client_id):
+            state = compute_streak(r.day for r in client_rows)
+            streak_rows.append({"client_id": row_client_id, **state._asdict()})
+
+        stale = delete(ClientStreak)
+        if client_id:
+            stale = stale.where(ClientStreak.client_id == client_id)
+        db.execute(stale)
+        if streak_rows:
+            db.execute(insert(ClientStreak), streak_rows)
+        db.commit()
+        return len(streak_rows)
+
+streak_service = StreakService()
@@ -1,8 +1,10 @@
 # app/services/template_service.py
 # Business logic updated for V2 with nutrition calculation.
 
-from typing import List, Optional
+from decimal import Decimal
+from typing import Iterable, List, Optional
 import uuid
+from sqlalchemy import bindparam, delete, func, insert, or_, select, update
 from sqlalchemy.orm import Session, joinedload
 from datetime import datetime
 from fastapi import HTTPException, status
@@ -11,43 +13,313 @@ from app.models.template import (
     DietPlanTemplate, 
     WorkoutTemplateItem, 
     DietTemplateItem,
-    FoodItemLibrary
+    FoodItemLibrary,
+    ExerciseLibrary
 )
 from app.schemas.template import (
     WorkoutPlanTemplateCreate, 
     WorkoutPlanTemplateUpdate,
+    WorkoutPlanTemplatePatch,
     DietPlanTemplateCreate,
-    DietPlanTemplateUpdate
+    DietPlanTemplateUpdate,
+    DietPlanTemplatePatch,
 )
-from app.core.units import UNIT_DICTIONARY, calculate_nutrition
+from app.core.units import UNIT_DICTIONARY, NUTRIENT_KEYS, calculate_nutrition_many, summarize_nutrition
+
+def _differs(current, new) -> bool:
+    # Numeric columns load as Decimal, while request values are floats.
+    if isinstance(current, Decimal) and new is not None:
+        return float(current) != float(new)
+    return current != new
+
 
 class TemplateService:
     
-    def _calculate_nutrition(self, food_item: FoodItemLibrary, serving_size: float, serving_unit: str) -> dict:
-        """Calculates nutrition for a given food item and serving size. Raises HTTPException for invalid units."""
+    def _check_serving_unit(self, food_item: FoodItemLibrary, serving_unit: str) -> None:
+        """Raises HTTPException when the unit is unknown or cannot be converted for this food item."""
         unit_info = UNIT_DICTIONARY.get((serving_unit or "").lower())
         if not unit_info:
             raise HTTPException(status_code=400, detail=f"Unit '{serving_unit}' is not a valid unit.")
         if unit_info["type"] == "VOLUME" and (food_item.base_unit_type != "VOLUME" or not food_item.grams_per_ml):
             raise HTTPException(status_code=400, detail=f"Cannot perform volume to mass conversion for '{food_item.name}'.")
-        return calculate_nutrition(food_item, serving_size, serving_unit)
+
+    def _items_nutrition(self, items: List[DietTemplateItem]) -> List[dict]:
+        """
+        The items' persisted nutrition. Rows written before it was stored are
+        computed in one batch.
+        """
+        result = [
+            None if item.calories is None else {key: getattr(item, key) for key in NUTRIENT_KEYS}
+            for item in items
+        ]
+        missing = [i for i, nutrition in enumerate(result) if nutrition is None]
+        computed = calculate_nutrition_many(
+            [items[i].food_item for i in missing],
+            [float(items[i].serving_size or 0) for i in missing],
+            [items[i].serving_unit or "g" for i in missing],
+        )
+        for i, nutrition in zip(missing, computed):
+            result[i] = nutrition
+        return result
+
+    def _resolve_library_items(self, db: Session, model, ids: List[uuid.UUID], *, trainer_id: uuid.UUID, label: str) -> dict:
+        """
+        Loads the referenced library rows in one IN query, limited to rows the trainer
+        may use (verified, or their own). Raises a 404 listing every id that is missing.
+        """
+        if not ids:
+            return {}
+        rows = db.execute(
+            select(model).where(
+                model.id.in_(set(ids)),
+                or_(model.is_verified == True, model.owner_trainer_id == trainer_id),
+                model.deleted_at.is_(None),
+            )
+        ).scalars().all()
+        found = {row.id: row for row in rows}
+        missing = [str(item_id) for item_id in dict.fromkeys(ids) if item_id not in found]
+        if missing:
+            raise HTTPException(status_code=404, detail=f"{label} not found: {', '.join(missing)}.")
+        return found
+
+    def _workout_item_values(self, item_in) -> dict:
+        """Column values for a workout item, accepting both the nested and the flat targets format."""
+        dump = item_in.model_dump(exclude={"item_id", "targets", "target_sets", "target_reps", "rest_period_seconds", "notes"})
+        sets_val = (item_in.targets.sets if item_in.targets else item_in.target_sets) or ""
+        reps_val = (item_in.targets.reps if item_in.targets else item_in.target_reps) or ""
+        dump["target_sets"] = sets_val
+        dump["target_reps"] = reps_val
+        dump["rest_period_seconds"] = (
+            item_in.targets.rest_period_seconds if item_in.targets else item_in.rest_period_seconds
+        )
+        dump["notes"] = item_in.targets.notes if item_in.targets else item_in.notes
+        return dump
+
+    def _diet_item_values(self, db: Session, items_in, *, trainer_id: uuid.UUID) -> List[dict]:
+        """Column values for diet items, including their nutrition, with the food items resolved in one query."""
+        food_items = self._resolve_library_items(
+            db, FoodItemLibrary, [item_in.food_item_id for item_in in items_in],
+            trainer_id=trainer_id, label="Food items",
+        )
+        for item_in in items_in:
+            self._check_serving_unit(food_items[item_in.food_item_id], item_in.serving.unit)
+
+        nutrition_rows = calculate_nutrition_many(
+            [food_items[item_in.food_item_id] for item_in in items_in],
+            [item_in.serving.size for item_in in items_in],
+            [item_in.serving.unit for item_in in items_in],
+        )
+        return [
+            {
+                "food_item_id": item_in.food_item_id,
+                "meal_name": item_in.meal_name,
+                "display_order": item_in.display_order,
+                "serving_size": item_in.serving.size,
+                "serving_unit": item_in.serving.unit,
+                **nutrition,
+            }
+            for item_in, nutrition in zip(items_in, nutrition_rows)
+        ]
+
+    def _build_workout_items(self, db: Session, *, template: WorkoutPlanTemplate, items_in) -> None:
+        """Adds the template's items with a single multi-row insert."""
+        self._resolve_library_items(
+            db, ExerciseLibrary, [item_in.exercise_id for item_in in items_in],
+            trainer_id=template.trainer_id, label="Exercises",
+        )
+        rows = [{"template_id": template.id, **self._workout_item_values(item_in)} for item_in in items_in]
+        if rows:
+            db.execute(insert(WorkoutTemplateItem), rows)
+
+    def _build_diet_items(self, db: Session, *, template: DietPlanTemplate, items_in) -> None:
+        """Adds the template's items with their nutrition in a single multi-row insert, and stores the meal and plan totals."""
+        rows = [
+            {"template_id": template.id, **values}
+            for values in self._diet_item_values(db, items_in, trainer_id=template.trainer_id)
+        ]
+        if rows:
+            db.execute(insert(DietTemplateItem), rows)
+        template.nutrition_totals = summarize_nutrition(
+            (row["meal_name"], {key: row[key] for key in NUTRIENT_KEYS}) for row in rows
+        )
+
+    def _sync_items(self, db: Session, *, template, item_model, items_in, values: List[dict], deleted_ids: Iterable[int]) -> bool:
+        """
+        Applies an item-level diff to the template. Items carrying an item_id are
+        updated only in the columns that differ, items without one are inserted in
+        one statement, and deleted_ids are removed. Returns whether anything changed.
+        """
+        existing = {item.id: item for item in template.items}
+        deleted_ids = set(deleted_ids)
+        referenced = [item_in.item_id for item_in in items_in if item_in.item_id is not None] + sorted(deleted_ids)
+        unknown = [str(item_id) for item_id in dict.fromkeys(referenced) if item_id not in existing]
+        if unknown:
+            raise HTTPException(status_code=404, detail=f"Template items not found: {', '.join(unknown)}.")
+
+        changed = False
+        inserts = []
+        for item_in, row in zip(items_in, values):
+            if item_in.item_id is None:
+                inserts.append({"template_id": template.id, **row})
+                continue
+            item = existing[item_in.item_id]
+            for key, value in row.items():
+                if _differs(getattr(item, key), value):
+                    setattr(item, key, value)
+                    changed = True
+        # Pending UPDATEs go out before the DELETE so no flush can target a removed row.
+        db.flush()
+        if deleted_ids:
+            db.execute(delete(item_model).where(item_model.template_id == template.id, item_model.id.in_(deleted_ids)))
+            changed = True
+        if inserts:
+            db.execute(insert(item_model), inserts)
+            changed = True
+        return changed
+
+    def _set_fields(self, template, fields: dict) -> bool:
+        changed = False
+        for key, value in fields.items():
+            if _differs(getattr(template, key), value):
+                setattr(template, key, value)
+                changed = True
+        return changed
+
+    def _patched_fields(self, obj_in) -> dict:
+        # An omitted description is left alone, while an explicit null clears it. The name can't be cleared.
+        fields = obj_in.model_dump(include={"description"}, exclude_unset=True)
+        if obj_in.name is not None:
+            fields["name"] = obj_in.name
+        return fields
+
+    def _apply_workout_changes(self, db: Session, *, template: WorkoutPlanTemplate, fields: dict, items_in, deleted_ids: Iterable[int]) -> WorkoutPlanTemplate:
+        self._resolve_library_items(
+            db, ExerciseLibrary, [item_in.exercise_id for item_in in items_in],
+            trainer_id=template.trainer_id, label="Exercises",
+        )
+        changed = self._set_fields(template, fields)
+        values = [self._workout_item_values(item_in) for item_in in items_in]
+        changed |= self._sync_items(db, template=template, item_model=WorkoutTemplateItem, items_in=items_in, values=values, deleted_ids=deleted_ids)
+        if changed:
+            template.version = WorkoutPlanTemplate.version + 1
+        db.commit()
+        db.refresh(template)
+        return template
+
+    def _apply_diet_changes(self, db: Session, *, template: DietPlanTemplate, fields: dict, items_in, deleted_ids: Iterable[int]) -> DietPlanTemplate:
+        values = self._diet_item_values(db, items_in, trainer_id=template.trainer_id)
+        changed = self._set_fields(template, fields)
+        if self._sync_items(db, template=template, item_model=DietTemplateItem, items_in=items_in, values=values, deleted_ids=deleted_ids):
+            self._store_nutrition_totals(db, [template.id])
+            changed = True
+        if changed:
+            template.version = DietPlanTemplate.version + 1
+        db.commit()
+        db.refresh(template)
+        return template
+
+    def _store_nutrition_totals(self, db: Session, template_ids) -> None:
+        """Recomputes the meal and plan totals of these templates from their stored item nutrition."""
+        db.flush()
+        rows = db.execute(
+            select(DietTemplateItem.template_id, DietTemplateItem.meal_name, *(getattr(DietTemplateItem, key) for key in NUTRIENT_KEYS))
+            .where(DietTemplateItem.template_id.in_(template_ids))
+            .order_by(DietTemplateItem.template_id, DietTemplateItem.id)
+        ).all()
+        per_template = {template_id: [] for template_id in template_ids}
+        for row in rows:
+            per_template[row.template_id].append((row.meal_name, {key: getattr(row, key) for key in NUTRIENT_KEYS}))
+        # Core UPDATE rather than ORM attribute writes, so onupdate doesn't touch
+        # updated_at: a library edit shouldn't reorder the trainer's template lists.
+        # Template edits bump updated_at themselves through the version change.
+        templates = DietPlanTemplate.__table__
+        db.execute(
+            update(templates)
+            .where(templates.c.id == bindparam("template_id"))
+            .values(
+                nutrition_totals=bindparam("totals", type_=templates.c.nutrition_totals.type),
+                updated_at=templates.c.updated_at,
+            ),
+            [
+                {"template_id": template_id, "totals": summarize_nutrition(items)}
+                for template_id, items in per_template.items()
+            ],
+        )
+
+    def refresh_food_item_nutrition(self, db: Session, *, food_item: FoodItemLibrary) -> int:
+        """
+        Recomputes the stored nutrition of every template item that uses this food item,
+        and the totals of the affected templates. Call before committing a change to
+        the food item. Returns the number of templates refreshed.
+        """
+        items = db.query(DietTemplateItem).filter(DietTemplateItem.food_item_id == food_item.id).all()
+        computed = calculate_nutrition_many(
+            [food_item] * len(items),
+            [float(item.serving_size or 0) for item in items],
+            [item.serving_unit or "g" for item in items],
+        )
+        for item, nutrition in zip(items, computed):
+            for key in NUTRIENT_KEYS:
+                setattr(item, key, nutrition[key])
+        template_ids = {item.template_id for item in items}
+        if not template_ids:
+            return 0
+        self._store_nutrition_totals(db, template_ids)
+        return len(template_ids)
+
+    def _templates_version(self, db: Session, template_model, item_model, library_model, library_fk, *, trainer_id: uuid.UUID, skip: int, limit: int) -> tuple:
+        """
+        ETag fingerprint of one page of templates, without loading the items.
+        Covers the page's (id, version, updated_at) rows plus the item rows and the
+        library rows they embed. Every item edit bumps the template's version.
+        """
+        page = db.execute(
+            select(template_model.id, template_model.version, template_model.updated_at)
+            .where(template_model.trainer_id == trainer_id, template_model.deleted_at.is_(None))
+            .order_by(template_model.updated_at.desc())
+            .offset(skip)
+            .limit(limit)
+        ).all()
+        if not page:
+            return ()
+        items = db.execute(
+            select(func.count(item_model.id), func.max(item_model.id), func.max(library_model.updated_at))
+            .join(library_model, library_model.id == library_fk)
+            .where(item_model.template_id.in_([row.id for row in page]))
+        ).one()
+        return (tuple(tuple(row) for row in page), tuple(items))
+
+    def _template_version(self, db: Session, template_model, *, template_id: uuid.UUID, trainer_id: uuid.UUID) -> Optional[int]:
+        return db.execute(
+            select(template_model.version).where(
+                template_model.id == template_id,
+                template_model.trainer_id == trainer_id,
+                template_model.deleted_at.is_(None),
+            )
+        ).scalar()
+
+    def _bump_versions(self, db: Session, template_model, item_model, library_fk, library_id: uuid.UUID) -> None:
+        # updated_at is kept as is: a library edit shouldn't reorder the trainer's template lists.
+        db.execute(
+            update(template_model)
+            .where(template_model.id.in_(select(item_model.template_id).where(library_fk == library_id)))
+            .values(version=template_model.version + 1, updated_at=template_model.updated_at)
+        )
+
+    def bump_versions_using_exercise(self, db: Session, *, exercise_id: uuid.UUID) -> None:
+        """Bumps every workout template embedding this exercise, since its snapshot content changed."""
+        self._bump_versions(db, WorkoutPlanTemplate, WorkoutTemplateItem, WorkoutTemplateItem.exercise_id, exercise_id)
+
+    def bump_versions_using_food_item(self, db: Session, *, food_item_id: uuid.UUID) -> None:
+        """Bumps every diet template embedding this food item, since its snapshot content changed."""
+        self._bump_versions(db, DietPlanTemplate, DietTemplateItem, DietTemplateItem.food_item_id, food_item_id)
 
     # --- Workout Plan Template Methods ---
     def create_workout_template(self, db: Session, *, obj_in: WorkoutPlanTemplateCreate, trainer_id: uuid.UUID) -> WorkoutPlanTemplate:
         db_template = WorkoutPlanTemplate(name=obj_in.name, description=obj_in.description, trainer_id=trainer_id)
         db.add(db_template)
         db.flush()
-        for item_in in obj_in.items:
-            dump = item_in.model_dump(exclude={"targets", "target_sets", "target_reps", "rest_period_seconds", "notes"})
-            sets_val = (item_in.targets.sets if item_in.targets else item_in.target_sets) or ""
-            reps_val = (item_in.targets.reps if item_in.targets else item_in.target_reps) or ""
-            dump["target_sets"] = sets_val
-            dump["target_reps"] = reps_val
-            dump["rest_period_seconds"] = (
-                item_in.targets.rest_period_seconds if item_in.targets else item_in.rest_period_seconds
-            )
-            dump["notes"] = item_in.targets.notes if item_in.targets else item_in.notes
-            db.add(WorkoutTemplateItem(template_id=db_template.id, **dump))
+        self._build_workout_items(db, template=db_template, items_in=obj_in.items)
         db.commit()
         db.refresh(db_template)
         return db_template
@@ -55,6 +327,10 @@ class TemplateService:
     def get_workout_template(self, db: Session, *, template_id: uuid.UUID, trainer_id: uuid.UUID) -> Optional[WorkoutPlanTemplate]:
         return db.query(WorkoutPlanTemplate).options(joinedload(WorkoutPlanTemplate.items).joinedload(WorkoutTemplateItem.exercise)).filter(WorkoutPlanTemplate.id == template_id, WorkoutPlanTemplate.trainer_id == trainer_id, WorkoutPlanTemplate.deleted_at.is_(None)).first()
     
+    def get_workout_template_version(self, db: Session, *, template_id: uuid.UUID, trainer_id: uuid.UUID) -> Optional[int]:
+        """The template's current version, without loading its items. None if not found."""
+        return self._template_version(db, WorkoutPlanTemplate, template_id=template_id, trainer_id=trainer_id)
+
     def get_workout_templates(self, db: Session, *, trainer_id: uuid.UUID, skip: int, limit: int) -> List[WorkoutPlanTemplate]:
         """Retrieves a paginated list of workout templates for a specific trainer."""
         return db.query(WorkoutPlanTemplate).filter(
@@ -62,24 +338,30 @@ class TemplateService:
             WorkoutPlanTemplate.deleted_at.is_(None)
         ).order_by(WorkoutPlanTemplate.updated_at.desc()).offset(skip).limit(limit).all()
     
+    def get_workout_templates_version(self, db: Session, *, trainer_id: uuid.UUID, skip: int, limit: int) -> tuple:
+        return self._templates_version(
+            db, WorkoutPlanTemplate, WorkoutTemplateItem, ExerciseLibrary, WorkoutTemplateItem.exercise_id,
+            trainer_id=trainer_id, skip=skip, limit=limit,
+        )
+
     def update_workout_template(self, db: Session, *, template: WorkoutPlanTemplate, obj_in: WorkoutPlanTemplateUpdate) -> WorkoutPlanTemplate:
-        template.name = obj_in.name
-        template.description = obj_in.description
-        db.query(WorkoutTemplateItem).filter(WorkoutTemplateItem.template_id == template.id).delete()
-        for item_in in obj_in.items:
-            dump = item_in.model_dump(exclude={"targets", "target_sets", "target_reps", "rest_period_seconds", "notes"})
-            sets_val = (item_in.targets.sets if item_in.targets else item_in.target_sets) or ""
-            reps_val = (item_in.targets.reps if item_in.targets else item_in.target_reps) or ""
-            dump["target_sets"] = sets_val
-            dump["target_reps"] = reps_val
-            dump["rest_period_seconds"] = (
-                item_in.targets.rest_period_seconds if item_in.targets else item_in.rest_period_seconds
-            )
-            dump["notes"] = item_in.targets.notes if item_in.targets else item_in.notes
-            db.add(WorkoutTemplateItem(template_id=template.id, **dump))
-        db.commit()
-        db.refresh(template)
-        return template
+        """Replaces the template's contents with obj_in; items not listed by item_id are removed."""
+        kept = {item_in.item_id for item_in in obj_in.items}
+        return self._apply_workout_changes(
+            db, template=template,
+            fields={"name": obj_in.name, "description": obj_in.description},
+            items_in=obj_in.items,
+            deleted_ids=[item.id for item in template.items if item.id not in kept],
+        )
+
+    def patch_workout_template(self, db: Session, *, template: WorkoutPlanTemplate, obj_in: WorkoutPlanTemplatePatch) -> WorkoutPlanTemplate:
+        """Applies only the changed fields and items; untouched items are left as they are."""
+        return self._apply_workout_changes(
+            db, template=template,
+            fields=self._patched_fields(obj_in),
+            items_in=obj_in.items,
+            deleted_ids=obj_in.deleted_item_ids,
+        )
 
     def delete_workout_template(self, db: Session, *, template: WorkoutPlanTemplate) -> None:
         template.deleted_at = datetime.utcnow()
@@ -91,20 +373,7 @@ class TemplateService:
         db_template = DietPlanTemplate(name=obj_in.name, description=obj_in.description, trainer_id=trainer_id)
         db.add(db_template)
         db.flush()
-        for item_in in obj_in.items:
-            food_item = db.query(FoodItemLibrary).filter(FoodItemLibrary.id == item_in.food_item_id).first()
-            if not food_item:
-                raise HTTPException(status_code=404, detail=f"Food item with id {item_in.food_item_id} not found.")
-            
-            db.add(DietTemplateItem(
-                template_id=db_template.id,
-                food_item_id=item_in.food_item_id,
-                meal_name=item_in.meal_name,
-                display_order=item_in.display_order,
-                serving_size=item_in.serving.size,
-                serving_unit=item_in.serving.unit,
-            ))
-        
+        self._build_diet_items(db, template=db_template, items_in=obj_in.items)
         db.commit()
         db.refresh(db_template)
         return db_template
@@ -112,6 +381,10 @@ class TemplateService:
     def get_diet_template(self, db: Session, *, template_id: uuid.UUID, trainer_id: uuid.UUID) -> Optional[DietPlanTemplate]:
         return db.query(DietPlanTemplate).options(joinedload(DietPlanTemplate.items).joinedload(DietTemplateItem.food_item)).filter(DietPlanTemplate.id == template_id, DietPlanTemplate.trainer_id == trainer_id, DietPlanTemplate.deleted_at.is_(None)).first()
     
+    def get_diet_template_version(self, db: Session, *, template_id: uuid.UUID, trainer_id: uuid.UUID) -> Optional[int]:
+        """The template's current version, without loading its items. None if not found."""
+        return self._template_version(db, DietPlanTemplate, template_id=template_id, trainer_id=trainer_id)
+
     def get_diet_templates(self, db: Session, *, trainer_id: uuid.UUID, skip: int, limit: int) -> List[DietPlanTemplate]:
         """Retrieves a paginated list of diet templates for a specific trainer."""
         return db.query(DietPlanTemplate).filter(
@@ -119,27 +392,30 @@ class TemplateService:
             DietPlanTemplate.deleted_at.is_(None)
         ).order_by(DietPlanTemplate.updated_at.desc()).offset(skip).limit(limit).all()
     
+    def get_diet_templates_version(self, db: Session, *, trainer_id: uuid.UUID, skip: int, limit: int) -> tuple:
+        return self._templates_version(
+            db, DietPlanTemplate, DietTemplateItem, FoodItemLibrary, DietTemplateItem.food_item_id,
+            trainer_id=trainer_id, skip=skip, limit=limit,
+        )
+
     def update_diet_template(self, db: Session, *, template: DietPlanTemplate, obj_in: DietPlanTemplateUpdate) -> DietPlanTemplate:
-        template.name = obj_in.name
-        template.description = obj_in.description
-        db.query(DietTemplateItem).filter(DietTemplateItem.template_id == template.id).delete()
-        for item_in in obj_in.items:
-            food_item = db.query(FoodItemLibrary).filter(FoodItemLibrary.id == item_in.food_item_id).first()
-            if not food_item:
-                raise HTTPException(status_code=404, detail=f"Food item with id {item_in.food_item_id} not found.")
-            
-            db.add(DietTemplateItem(
-                template_id=template.id,
-                food_item_id=item_in.food_item_id,
-                meal_name=item_in.meal_name,
-                display_order=item_in.display_order,
-                serving_size=item_in.serving.size,
-                serving_unit=item_in.serving.unit,
-            ))
-            
-        db.commit()
-        db.refresh(template)
-        return template
+        """Replaces the template's contents with obj_in; items not listed by item_id are removed."""
+        kept = {item_in.item_id for item_in in obj_in.items}
+        return self._apply_diet_changes(
+            db, template=template,
+            fields={"name": obj_in.name, "description": obj_in.description},
+            items_in=obj_in.items,
+            deleted_ids=[item.id for item in template.items if item.id not in kept],
+        )
+
+    def patch_diet_template(self, db: Session, *, template: DietPlanTemplate, obj_in: DietPlanTemplatePatch) -> DietPlanTemplate:
+        """Applies only the changed fields and items; untouched items are left as they are."""
+        return self._apply_diet_changes(
+            db, template=template,
+            fields=self._patched_fields(obj_in),
+            items_in=obj_in.items,
+            deleted_ids=obj_in.deleted_item_ids,
+        )
 
     def delete_diet_template(self, db: Session, *, template: DietPlanTemplate) -> None:
         template.deleted_at = datetime.utcnow()
@@ -174,6 +450,8 @@ class TemplateService:
 
     def create_diet_plan_snapshot(self, *, template: DietPlanTemplate) -> dict:
         """Builds a rich JSON snapshot from a diet template's relational items."""
+        items = list(template.items)
+        nutrition_rows = self._items_nutrition(items)
         return {
             "name": template.name,
             "description": template.description,
@@ -192,13 +470,12 @@ class TemplateService:
                         "unit": item.serving_unit or "g"
                     },
                     "notes": item.notes,
-                    "calculatedNutrition": self._calculate_nutrition(
-                        food_item=item.food_item,
-                        serving_size=float(item.serving_size or 0),
-                        serving_unit=item.serving_unit or "g"
-                    )
-                } for item in template.items
-            ]
+                    "calculatedNutrition": nutrition
+                } for item, nutrition in zip(items, nutrition_rows)
+            ],
+            "nutritionTotals": template.nutrition_totals or summarize_nutrition(
+                (item.meal_name, nutrition) for item, nutrition in zip(items, nutrition_rows)
+            ),
         }
 
 template_service = TemplateService()
\ No newline at end of file
@@ -1,28 +1,68 @@
 # app/services/trainee_service.py
 import uuid
-from datetime import date, timedelta
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Optional
 from fastapi import HTTPException, status
-from app.domain.authorization.client_access import get_client_for_viewer
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import union_all, select, literal_column
+from app.domain.authorization.client_access import get_client_for_viewer, get_client_for_viewer_async
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.plan import AssignedWorkoutPlan, AssignedDietPlan
-from app.models.log import WorkoutLog, DietLog
+from app.models.log import DietLog
 from app.schemas.trainee import TraineePlans
 from app.models.client import Client
 from app.core.auth_context import ClientContext
 from app.domain.client_guards import assert_client_allows_action
+from app.domain import streaks
+from app.services.streak_service import streak_service
 
 class TraineeService:
-    def get_trainee_dashboard(self, db: Session, *, client_id: uuid.UUID, current_user) -> dict:
-        today = date.today()
-        client = get_client_for_viewer(db, client_id=client_id, current_user=current_user)
-        assert_client_allows_action(client, "view_client_dashboard")
-        # 2. Get today's workout
-        assigned_workout = db.query(AssignedWorkoutPlan).filter(
+    # --- Query building blocks shared by the sync and async read paths ---
+
+    def _latest_workout_stmt(self, client_id: uuid.UUID, today: date):
+        return select(AssignedWorkoutPlan).where(
             AssignedWorkoutPlan.client_id == client_id,
             AssignedWorkoutPlan.assigned_at <= today
-        ).order_by(AssignedWorkoutPlan.assigned_at.desc()).first()
-        
+        ).order_by(AssignedWorkoutPlan.assigned_at.desc()).limit(1)
+
+    def _latest_diet_stmt(self, client_id: uuid.UUID, today: date):
+        return select(AssignedDietPlan).where(
+            AssignedDietPlan.client_id == client_id,
+            AssignedDietPlan.assigned_at <= today
+        ).order_by(AssignedDietPlan.assigned_at.desc()).limit(1)
+
+    def _followed_meals_today_stmt(self, client_id: uuid.UUID, assigned_diet_id: uuid.UUID, today: date):
+        # The UTC day, like streaks.activity_day, not the DB session's time zone.
+        day_start = datetime.combine(today, time.min, tzinfo=timezone.utc)
+        return select(func.count()).select_from(DietLog).where(
+            DietLog.client_id == client_id,
+            DietLog.assigned_plan_id == assigned_diet_id,
+            DietLog.logged_at >= day_start,
+            DietLog.logged_at < day_start + timedelta(days=1),
+            DietLog.status == 'Followed'
+        )
+
+    def _latest_plan_stmt(self, model, client_id: uuid.UUID):
+        return select(model).where(
+            model.client_id == client_id,
+            model.deleted_at.is_(None)
+        ).order_by(model.assigned_at.desc()).limit(1)
+
+    def _planned_meal_count(self, assigned_diet: Optional[AssignedDietPlan]) -> int:
+        if not assigned_diet:
+            return 0
+        return sum([len(meal.get("items", [])) for meal in assigned_diet.plan_details.get("meals", [])])
+
+    def _build_dashboard(
+        self,
+        *,
+        today: date,
+        client: Client,
+        assigned_workout: Optional[AssignedWorkoutPlan],
+        total_meals_planned: int,
+        logged_meals_today: int,
+        current_streak_days: int,
+    ) -> dict:
         # Basic logic: find if today's day name exists in the plan
         todays_workout_details = None
         is_rest_day = True
@@ -33,57 +73,15 @@ class TraineeService:
                     todays_workout_details = item
                     is_rest_day = False
                     break
-        
-        # 2. Calculate diet compliance
-        assigned_diet = db.query(AssignedDietPlan).filter(
-            AssignedDietPlan.client_id == client_id,
-            AssignedDietPlan.assigned_at <= today
-        ).order_by(AssignedDietPlan.assigned_at.desc()).first()
-        
-        diet_compliance_percent = 0.0
-        if assigned_diet:
-            total_meals_planned = sum([len(meal.get("items", [])) for meal in assigned_diet.plan_details.get("meals", [])])
-            if total_meals_planned > 0:
-                logged_meals_today = db.query(DietLog).filter(
-                    DietLog.client_id == client_id,
-                    DietLog.assigned_plan_id == assigned_diet.id,
-                    DietLog.logged_at >= today,
-                    DietLog.logged_at < today + timedelta(days=1),
-                    DietLog.status == 'Followed'
-                ).count()
-                diet_compliance_percent = (logged_meals_today / total_meals_planned) * 100
-
-        # --- 3. OPTIMIZED Streak Calculation ---
-        # Fetch all unique log dates for the client in a single query.
-        workout_log_dates = select(WorkoutLog.logged_at.cast(date)).filter(WorkoutLog.client_id == client_id)
-        diet_log_dates = select(DietLog.logged_at.cast(date)).filter(DietLog.client_id == client_id)
-        
-        all_log_dates_query = union_all(workout_log_dates, diet_log_dates).alias("all_logs")
-        unique_log_dates_stmt = select(all_log_dates_query.c.logged_at).distinct()
-        
-        result = db.execute(unique_log_dates_stmt).fetchall()
-        unique_log_dates = {row[0] for row in result}
-
-        # Calculate the streak in-memory (much faster).
-        current_streak_days = 0
-        for i in range(365 * 5): # Check up to 5 years back
-            check_date = today - timedelta(days=i)
-            if check_date in unique_log_dates:
-                current_streak_days += 1
-            else:
-                break
-        client_record = db.query(Client).options(joinedload(Client.client_user)).filter(Client.id == client_id).first()
-        is_fee_due = False
-        payment_status = "unpaid" # Default value
-        subscription_due_date = None
 
-        if client_record:
-            payment_status = client_record.payment_status
-            subscription_due_date = client_record.subscription_due_date
+        diet_compliance_percent = 0.0
+        if total_meals_planned > 0:
+            diet_compliance_percent = (logged_meals_today / total_meals_planned) * 100
 
-            if client_record.subscription_due_date:
-                if date.today() >= client_record.subscription_due_date.date() and not client_record.subscription_paid_status:
-                    is_fee_due = True
+        is_fee_due = False
+        if client.subscription_due_date:
+            if today >= client.subscription_due_date.date() and not client.subscription_paid_status:
+                is_fee_due = True
 
         return {
             "assigned_workout": todays_workout_details,
@@ -91,11 +89,62 @@ class TraineeService:
             "diet_compliance_percent": round(diet_compliance_percent, 2),
             "current_streak_days": current_streak_days,
             "is_fee_due": is_fee_due,
-            "payment_status": payment_status,
-            "subscription_due_date": subscription_due_date
+            "payment_status": client.payment_status,
+            "subscription_due_date": client.subscription_due_date
         }
-    
-        
+
+    def get_trainee_dashboard(self, db: Session, *, client_id: uuid.UUID, current_user) -> dict:
+        today = streaks.today()
+        client = get_client_for_viewer(db, client_id=client_id, current_user=current_user)
+        assert_client_allows_action(client, "view_client_dashboard")
+
+        # 1. Get today's workout
+        assigned_workout = db.scalars(self._latest_workout_stmt(client_id, today)).first()
+
+        # 2. Calculate diet compliance
+        assigned_diet = db.scalars(self._latest_diet_stmt(client_id, today)).first()
+        total_meals_planned = self._planned_meal_count(assigned_diet)
+        logged_meals_today = 0
+        if total_meals_planned > 0:
+            logged_meals_today = db.scalar(self._followed_meals_today_stmt(client_id, assigned_diet.id, today))
+
+        # 3. Streak: persisted per-client state, maintained by the log service
+        current_streak_days = streak_service.get_current_streak_days(db, client_id=client_id, today=today)
+
+        return self._build_dashboard(
+            today=today,
+            client=client,
+            assigned_workout=assigned_workout,
+            total_meals_planned=total_meals_planned,
+            logged_meals_today=logged_meals_today,
+            current_streak_days=current_streak_days,
+        )
+
+    async def get_trainee_dashboard_async(self, db: AsyncSession, *, client_id: uuid.UUID, current_user) -> dict:
+        """AsyncSession counterpart of get_trainee_dashboard."""
+        today = streaks.today()
+        client = await get_client_for_viewer_async(db, client_id=client_id, current_user=current_user)
+        assert_client_allows_action(client, "view_client_dashboard")
+
+        assigned_workout = (await db.scalars(self._latest_workout_stmt(client_id, today))).first()
+
+        assigned_diet = (await db.scalars(self._latest_diet_stmt(client_id, today))).first()
+        total_meals_planned = self._planned_meal_count(assigned_diet)
+        logged_meals_today = 0
+        if total_meals_planned > 0:
+            logged_meals_today = await db.scalar(self._followed_meals_today_stmt(client_id, assigned_diet.id, today))
+
+        current_streak_days = await streak_service.get_current_streak_days_async(db, client_id=client_id, today=today)
+
+        return self._build_dashboard(
+            today=today,
+            client=client,
+            assigned_workout=assigned_workout,
+            total_meals_planned=total_meals_planned,
+            logged_meals_today=logged_meals_today,
+            current_streak_days=current_streak_days,
+        )
+
     def get_trainee_plans(self, db: Session, *, client_id: uuid.UUID, current_user) -> TraineePlans:
         """
         Retrieves the most recently assigned workout and diet plans for a trainee.
@@ -103,15 +152,21 @@ class TraineeService:
         client = get_client_for_viewer(db, client_id=client_id, current_user=current_user)
         assert_client_allows_action(client, "view_assigned_plans")
 
-        latest_workout_plan = db.query(AssignedWorkoutPlan).filter(
-            AssignedWorkoutPlan.client_id == client_id,
-            AssignedWorkoutPlan.deleted_at.is_(None)
-        ).order_by(AssignedWorkoutPlan.assigned_at.desc()).first()
+        latest_workout_plan = db.scalars(self._latest_plan_stmt(AssignedWorkoutPlan, client_id)).first()
+        latest_diet_plan = db.scalars(self._latest_plan_stmt(AssignedDietPlan, client_id)).first()
 
-        latest_diet_plan = db.query(AssignedDietPlan).filter(
-            AssignedDietPlan.client_id == client_id,
-            AssignedDietPlan.deleted_at.is_(None)
-        ).order_by(AssignedDietPlan.assigned_at.desc()).first()
+        return TraineePlans(
+            workout_plan=latest_workout_plan,
+            diet_plan=latest_diet_plan
+        )
+
+    async def get_trainee_plans_async(self, db: AsyncSession, *, client_id: uuid.UUID, current_user) -> TraineePlans:
+        """AsyncSession counterpart of get_trainee_plans."""
+        client = await get_client_for_viewer_async(db, client_id=client_id, current_user=current_user)
+        assert_client_allows_action(client, "view_assigned_plans")
+
+        latest_workout_plan = (await db.scalars(self._latest_plan_stmt(AssignedWorkoutPlan, client_id))).first()
+        latest_diet_plan = (await db.scalars(self._latest_plan_stmt(AssignedDietPlan, client_id))).first()
 
         return TraineePlans(
             workout_plan=latest_workout_plan,
@@ -126,7 +181,8 @@ class TraineeService:
         if not current_client.client_profile:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Client profile not found for this user.")
 
-        client = current_client.client_profile
+        # The context's profile may be a detached snapshot from the auth cache.
+        client = db.get(Client, current_client.client_profile.id)
         client.payment_status = "pending"
         db.add(client)
         db.commit()
@@ -1,32 +1,34 @@
 # app/services/trainer_service.py
+# Maintains and serves the per-trainer summary stats (see the trainer_stats table).
+
 import uuid
+from datetime import date
+from typing import Optional
+from sqlalchemy import case, func, literal, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 from app.models.client import Client
-from datetime import date
-from dateutil.relativedelta import relativedelta
+from app.models.user import User
+from app.models.trainer_stats import TrainerStats
 
 class TrainerService:
     def get_trainer_stats(self, db: Session, *, trainer_id: uuid.UUID) -> dict:
-        today = date.today()
-        start_of_current_month = today.replace(day=1)
+        """Primary-key lookup of the trainer's stats; no counting over clients."""
+        month = date.today().replace(day=1)
+        row = db.execute(
+            select(
+                TrainerStats.active_clients,
+                TrainerStats.active_at_month_start,
+                TrainerStats.snapshot_month,
+            ).where(TrainerStats.trainer_user_id == trainer_id)
+        ).first()
+        if not row:
+            return {"active_clients": 0, "growth_percentage": 0.0}
+
+        current_active_clients = row.active_clients
+        # Nothing has touched the row since an earlier month, so the count is unchanged since then.
+        clients_at_start_of_month = row.active_at_month_start if row.snapshot_month >= month else row.active_clients
 
-        current_active_clients = (
-            db.query(Client)
-            .filter(Client.trainer_user_id == trainer_id, Client.client_status == 'active', Client.deleted_at.is_(None))
-            .count()
-        )
-        
-        clients_at_start_of_month = (
-            db.query(Client)
-            .filter(
-                Client.trainer_user_id == trainer_id, 
-                Client.status == 'active', 
-                Client.created_at < start_of_current_month,
-                Client.deleted_at.is_(None)
-            )
-            .count()
-        )
-        
         growth_percentage = 0.0
         if clients_at_start_of_month > 0:
             growth = current_active_clients - clients_at_start_of_month
@@ -37,4 +39,77 @@ class TrainerService:
             "growth_percentage": round(growth_percentage, 2)
         }
 
-trainer_service = TrainerService()
\ No newline at end of file
+    def record_status_change(self, db: Session, *, trainer_id: uuid.UUID, old_status: Optional[str], new_status: str) -> None:
+        """
+        Applies a client status transition to the trainer's stats.
+        Must be called inside the transaction that changes the client, before commit.
+        """
+        delta = (new_status == "active") - (old_status == "active")
+        if delta == 0:
+            return
+
+        month = date.today().replace(day=1)
+        db.execute(
+            pg_insert(TrainerStats)
+            .values(trainer_user_id=trainer_id, snapshot_month=month)
+            .on_conflict_do_nothing(index_elements=[TrainerStats.trainer_user_id])
+        )
+        # A single UPDATE so concurrent transitions cannot lose increments. SET
+        # expressions see the old row, so a month roll snapshots the pre-change count.
+        is_new_month = TrainerStats.snapshot_month < month
+        db.execute(
+            update(TrainerStats)
+            .where(TrainerStats.trainer_user_id == trainer_id)
+            .values(
+                active_at_month_start=case(
+                    (is_new_month, TrainerStats.active_clients),
+                    else_=TrainerStats.active_at_month_start,
+                ),
+                snapshot_month=month,
+                active_clients=TrainerStats.active_clients + delta,
+            )
+        )
+
+    def reconcile_stats(self, db: Session, *, trainer_id: Optional[uuid.UUID] = None) -> int:
+        """
+        Recounts active clients from the clients table and corrects any drift
+        in trainer_stats, for one trainer or for all of them. Returns the number of rows written.
+        """
+        month = date.today().replace(day=1)
+        active = (Client.client_status == "active") & Client.deleted_at.is_(None)
+        counts = (
+            select(
+                User.id.label("trainer_user_id"),
+                func.count(Client.id).filter(active).label("active_clients"),
+                # Best available estimate for trainers without a row yet.
+                func.count(Client.id).filter(active, Client.created_at < month).label("active_at_month_start"),
+                literal(month).label("snapshot_month"),
+            )
+            .outerjoin(Client, Client.trainer_user_id == User.id)
+            .where(User.user_role == "trainer")
+            .group_by(User.id)
+        )
+        if trainer_id:
+            counts = counts.where(User.id == trainer_id)
+
+        stmt = pg_insert(TrainerStats).from_select(
+            ["trainer_user_id", "active_clients", "active_at_month_start", "snapshot_month"], counts
+        )
+        is_new_month = TrainerStats.snapshot_month < stmt.excluded.snapshot_month
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[TrainerStats.trainer_user_id],
+            set_={
+                "active_clients": stmt.excluded.active_clients,
+                "active_at_month_start": case(
+                    (is_new_month, TrainerStats.active_clients),
+                    else_=TrainerStats.active_at_month_start,
+                ),
+                "snapshot_month": stmt.excluded.snapshot_month,
+                "updated_at": func.now(),
+            },
+        )
+        result = db.execute(stmt)
+        db.commit()
+        return result.rowcount
+
+trainer_service = TrainerService()
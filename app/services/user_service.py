@@ -1,22 +1,30 @@
 # app/services/user_service.py
 from sqlalchemy.orm import Session, joinedload
 from fastapi import HTTPException, status
-from app.core.security import get_password_hash, verify_password
+from app.core.password_pool import password_pool
 from app.models.user import User
 from app.schemas.user import UserCreate, UserPasswordUpdate, UserEmailUpdate
 from app.schemas.user import UserCreate, UserPasswordUpdate, UserEmailUpdate, UserUpdate
+from app.cache.auth_cache import invalidate_cached_user, revoke_tokens
+from app.services.refresh_token_service import refresh_token_service
 
 class UserService:
     # --- THIS METHOD WAS MISSING ---
-    def get_user_by_email(self, db: Session, *, email: str) -> User | None:
+    def get_user_by_email(self, db: Session, *, email: str, read_primary: bool = False) -> User | None:
+        """read_primary: skip a read replica for this lookup (see RoutingSession)."""
         return (
         db.query(User)
         .options(joinedload(User.client_profile))
         .filter(User.email == email, User.deleted_at.is_(None))
+        .execution_options(read_primary=read_primary)
         .first()
     )
+    def _persistent(self, db: Session, user: User) -> User:
+        # The authenticated user may be rebuilt from the auth cache and not bound to this session.
+        return user if user in db else db.get(User, user.id)
+
     def create_user(self, db: Session, *, obj_in: UserCreate) -> User:
-        hashed_password = get_password_hash(obj_in.password)
+        hashed_password = password_pool.hash(obj_in.password)
         db_obj = User(
             email=obj_in.email,
             hashed_password=hashed_password,
@@ -29,33 +37,44 @@ class UserService:
         return db_obj
 
     def update_password(self, db: Session, *, user: User, obj_in: UserPasswordUpdate) -> User:
-        if not verify_password(obj_in.current_password, user.hashed_password):
+        user = self._persistent(db, user)
+        if not password_pool.verify(obj_in.current_password, user.hashed_password):
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Incorrect current password")
         
-        user.hashed_password = get_password_hash(obj_in.new_password)
+        user.hashed_password = password_pool.hash(obj_in.new_password)
         db.add(user)
+        # Sessions started with the old password end: no more refreshes, and
+        # access tokens issued until now stop working.
+        refresh_token_service.revoke_all(db, user_id=user.id)
         db.commit()
         db.refresh(user)
+        invalidate_cached_user(user.email)
+        revoke_tokens(user.email)
         return user
 
     def update_email(self, db: Session, *, user: User, obj_in: UserEmailUpdate) -> User:
-        if not verify_password(obj_in.password, user.hashed_password):
+        user = self._persistent(db, user)
+        if not password_pool.verify(obj_in.password, user.hashed_password):
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Incorrect password")
         
         existing_user = self.get_user_by_email(db, email=obj_in.new_email)
         if existing_user and existing_user.id != user.id:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already in use")
             
+        old_email = user.email
         user.email = obj_in.new_email
         db.add(user)
         db.commit()
         db.refresh(user)
+        invalidate_cached_user(old_email, user.email)
         return user
     
     def update_user_profile(self, db: Session, *, user: User, obj_in: UserUpdate) -> User:
         """
         Updates a user's profile information (full_name, profile_photo_url).
         """
+        user = self._persistent(db, user)
+        old_email = user.email
         update_data = obj_in.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(user, field, value)
@@ -63,6 +82,8 @@ class UserService:
         db.add(user)
         db.commit()
         db.refresh(user)
+        # The cached snapshot carries full_name/profile_photo_url as well.
+        invalidate_cached_user(old_email, user.email)
         return user
 
 user_service = UserService()
\ No newline at end of file
@@ -2,6 +2,7 @@
 # API integration tests for plan assignment endpoints.
 
 import pytest
+import uuid
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
@@ -117,6 +118,55 @@ class TestAssignDietPlan:
         assert "planDetails" in data
 
 
+class TestBulkAssignPlans:
+    """Tests for assigning one template to many clients."""
+
+    def _paused_client(self, test_db: Session, trainer: User) -> Client:
+        paused = Client(trainer_user_id=trainer.id, client_status="paused", invited_full_name="Paused", invited_email="paused@test.com")
+        test_db.add(paused)
+        test_db.commit()
+        return paused
+
+    def test_bulk_assign_reports_per_client_outcomes(self, client: TestClient, test_db: Session, test_trainer: User, trainer_token: str, test_client_profile: Client, test_exercise: ExerciseLibrary):
+        """Eligible clients are assigned; paused and unknown clients are rejected individually."""
+        template_id = client.post(
+            "/api/v1/templates/workout",
+            headers={"Authorization": f"Bearer {trainer_token}"},
+            json={"name": "Cohort Program", "items": [{"exercise_id": str(test_exercise.id), "day_name": "Monday", "display_order": 1}]},
+        ).json()["id"]
+        paused = self._paused_client(test_db, test_trainer)
+        unknown = uuid.uuid4()
+
+        response = client.post(
+            "/api/v1/assigned-plans/workout/bulk",
+            headers={"Authorization": f"Bearer {trainer_token}"},
+            json={"sourceTemplateId": template_id, "clientIds": [str(test_client_profile.id), str(paused.id), str(unknown)]},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["assigned"], data["rejected"]) == (1, 2)
+        assert [result["status"] for result in data["results"]] == ["assigned", "rejected", "rejected"]
+        assert data["results"][2]["error"] == "Client not found"
+
+        plans = client.get(
+            "/api/v1/assigned-plans/workout",
+            headers={"Authorization": f"Bearer {trainer_token}"},
+            params={"client_id": str(test_client_profile.id)},
+        ).json()
+        assert [plan["id"] for plan in plans] == [data["results"][0]["id"]]
+        assert plans[0]["planDetails"]["name"] == "Cohort Program"
+
+    def test_bulk_assign_unknown_template_returns_404(self, client: TestClient, trainer_token: str, test_client_profile: Client):
+        """A template the trainer doesn't own fails the whole request."""
+        response = client.post(
+            "/api/v1/assigned-plans/diet/bulk",
+            headers={"Authorization": f"Bearer {trainer_token}"},
+            json={"sourceTemplateId": str(uuid.uuid4()), "clientIds": [str(test_client_profile.id)]},
+        )
+        assert response.status_code == 404
+
+
 class TestListAssignedPlans:
     """Tests for listing assigned plans."""
     
@@ -0,0 +1,177 @@
+# tests/api/test_async_reads.py
+# API tests for the read endpoints served through the AsyncSession (DB_ASYNC_ENABLED=1).
+
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+from app.core.database import Base, RoutingSession, get_async_db, to_async_url
+from app.main import app
+from app.models.client import Client
+from app.models.template import ExerciseLibrary, FoodItemLibrary
+from app.models.user import User
+from tests.conftest import TEST_DATABASE_URL, TestingSessionLocal, engine
+
+
+@pytest.fixture
+def test_db():
+    """
+    A session that really commits: asyncpg connects separately and cannot see the
+    rolled-back outer transaction of the default fixture. Tables are emptied afterwards.
+    """
+    session = TestingSessionLocal()
+    yield session
+    session.close()
+    tables = ", ".join(f'"{table.name}"' for table in Base.metadata.sorted_tables)
+    with engine.begin() as conn:
+        conn.execute(text(f"TRUNCATE {tables} CASCADE"))
+
+
+@pytest.fixture
+def async_sessions(client: TestClient, monkeypatch) -> list:
+    """Turns DB_ASYNC_ENABLED on and records the AsyncSessions the read endpoints open."""
+    monkeypatch.setattr(settings, "DB_ASYNC_ENABLED", True)
+    session_factory = async_sessionmaker(
+        create_async_engine(to_async_url(TEST_DATABASE_URL), poolclass=NullPool),
+        sync_session_class=RoutingSession,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+    sessions = []
+
+    async def override_get_async_db():
+        async with session_factory() as db:
+            sessions.append(db)
+            yield db
+
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    return sessions
+
+
+@pytest.fixture
+def logged_activity(client: TestClient, trainer_token: str, client_token: str, test_client_profile: Client, test_exercise: ExerciseLibrary, test_food_item: FoodItemLibrary) -> Client:
+    """Assigned plans plus one workout log, one diet log and one check-in, written through the sync API."""
+    trainer_headers = {"Authorization": f"Bearer {trainer_token}"}
+    client_headers = {"Authorization": f"Bearer {client_token}"}
+    workout_template = client.post(
+        "/api/v1/templates/workout",
+        headers=trainer_headers,
+        json={
+            "name": "Strength Program",
+            "items": [{"exercise_id": str(test_exercise.id), "day_name": "Monday", "target_sets": "4", "target_reps": "8", "display_order": 1}],
+        },
+    ).json()
+    diet_template = client.post(
+        "/api/v1/templates/diet",
+        headers=trainer_headers,
+        json={
+            "name": "High Protein",
+            "items": [{"food_item_id": str(test_food_item.id), "meal_name": "Breakfast", "serving": {"size": 150, "unit": "g"}, "display_order": 1}],
+        },
+    ).json()
+    workout_plan = client.post(
+        "/api/v1/assigned-plans/workout",
+        headers=trainer_headers,
+        json={"client_id": str(test_client_profile.id), "source_template_id": workout_template["id"]},
+    ).json()
+    diet_plan = client.post(
+        "/api/v1/assigned-plans/diet",
+        headers=trainer_headers,
+        json={"client_id": str(test_client_profile.id), "source_template_id": diet_template["id"]},
+    ).json()
+
+    assert client.post(
+        "/api/v1/logs/workout",
+        headers=client_headers,
+        json={"assigned_plan_id": workout_plan["id"], "performance_data": {"sets_completed": 4, "reps_completed": "8,8,8,8"}},
+    ).status_code == 201
+    assert client.post(
+        "/api/v1/logs/diet",
+        headers=client_headers,
+        json={"assigned_plan_id": diet_plan["id"], "meal_name": "Breakfast", "status": "Followed"},
+    ).status_code == 201
+    assert client.post("/api/v1/checkins/", headers=client_headers, json={"weight_kg": 80.5}).status_code == 201
+    return test_client_profile
+
+
+class TestAsyncReads:
+    """Tests for the read endpoints with DB_ASYNC_ENABLED on."""
+
+    def test_logs_and_checkins(self, client: TestClient, trainer_token: str, logged_activity: Client, async_sessions: list):
+        """Lists and cursor pages of logs and check-ins come from the async session."""
+        headers = {"Authorization": f"Bearer {trainer_token}"}
+        params = {"client_id": str(logged_activity.id)}
+
+        for path in ("/api/v1/logs/workout", "/api/v1/logs/diet", "/api/v1/checkins/"):
+            response = client.get(path, params=params, headers=headers)
+            assert response.status_code == 200, path
+            assert len(response.json()) == 1, path
+        for path in ("/api/v1/logs/workout/page", "/api/v1/logs/diet/page", "/api/v1/checkins/page"):
+            response = client.get(path, params=params, headers=headers)
+            assert response.status_code == 200, path
+            assert len(response.json()["items"]) == 1, path
+            assert response.json()["nextCursor"] is None, path
+
+        series = client.get("/api/v1/checkins/series", params=params, headers=headers)
+        assert series.status_code == 200
+        weight = next(metric for metric in series.json()["series"] if metric["metric"] == "weight_kg")
+        assert len(weight["points"]) == 1
+
+        assert len(async_sessions) == 7
+
+    def test_activity_feeds(self, client: TestClient, trainer_token: str, logged_activity: Client, async_sessions: list):
+        """The client feed, its cursor page and the trainer feed come from the async session."""
+        headers = {"Authorization": f"Bearer {trainer_token}"}
+
+        feed = client.get(f"/api/v1/clients/{logged_activity.id}/activity-feed", headers=headers)
+        assert feed.status_code == 200
+        assert len(feed.json()) == 3
+
+        page = client.get(f"/api/v1/clients/{logged_activity.id}/activity-feed/page", params={"limit": 2}, headers=headers)
+        assert page.status_code == 200
+        assert len(page.json()["items"]) == 2
+        assert page.json()["nextCursor"]
+
+        trainer_feed = client.get("/api/v1/trainers/me/activity-feed", headers=headers)
+        assert trainer_feed.status_code == 200
+        assert [item["clientId"] for item in trainer_feed.json()["items"]] == [str(logged_activity.id)] * 3
+
+        assert len(async_sessions) == 3
+
+    def test_trainee_dashboard_and_plans(self, client: TestClient, trainer_token: str, client_token: str, logged_activity: Client, async_sessions: list):
+        """The trainee dashboard (own and trainer's view) and plans come from the async session."""
+        mine = client.get("/api/v1/trainees/me/today", headers={"Authorization": f"Bearer {client_token}"})
+        assert mine.status_code == 200
+        assert mine.json()["currentStreakDays"] == 1
+
+        headers = {"Authorization": f"Bearer {trainer_token}"}
+        today = client.get(f"/api/v1/trainees/{logged_activity.id}/today", headers=headers)
+        assert today.status_code == 200
+        assert today.json() == mine.json()
+
+        plans = client.get(f"/api/v1/trainees/{logged_activity.id}/plans", headers=headers)
+        assert plans.status_code == 200
+        assert plans.json()["workoutPlan"] is not None
+        assert plans.json()["dietPlan"] is not None
+
+        assert len(async_sessions) == 3
+
+    def test_other_trainers_client_is_not_found(self, client: TestClient, test_db: Session, trainer_token: str, async_sessions: list):
+        """The async client lookup raises the same 404 as the sync one."""
+        other_trainer = User(id=uuid.uuid4(), email="other@test.com", hashed_password="x", full_name="Other Trainer", user_role="trainer")
+        test_db.add(other_trainer)
+        test_db.flush()
+        other_client = Client(id=uuid.uuid4(), trainer_user_id=other_trainer.id, client_status="invited", invited_full_name="Other Client", invited_email="other-client@test.com")
+        test_db.add(other_client)
+        test_db.commit()
+
+        response = client.get(f"/api/v1/clients/{other_client.id}/activity-feed", headers={"Authorization": f"Bearer {trainer_token}"})
+
+        assert response.status_code == 404
+        assert len(async_sessions) == 1
@@ -5,6 +5,7 @@ import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
+from app.core.password_pool import password_pool
 from app.models.user import User
 
 
@@ -50,6 +51,69 @@ class TestLogin:
         
         assert response.status_code == 401
 
+    def test_login_returns_503_when_password_pool_is_full(self, client: TestClient, test_trainer: User, monkeypatch):
+        """A saturated bcrypt pool turns logins away with a retryable 503."""
+        monkeypatch.setattr(password_pool, "workers", 1)
+        monkeypatch.setattr(password_pool, "_in_flight", 1 + password_pool.max_queue)
+
+        response = client.post(
+            "/api/v1/auth/token",
+            data={"username": "trainer@test.com", "password": "password123"}
+        )
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+
+
+
+class TestRefreshTokens:
+    """Tests for POST /auth/refresh."""
+
+    def _login(self, client: TestClient) -> dict:
+        response = client.post("/api/v1/auth/token", data={"username": "trainer@test.com", "password": "password123"})
+        assert response.status_code == 200
+        return response.json()
+
+    def test_refresh_issues_new_tokens(self, client: TestClient, test_trainer: User):
+        """A refresh token buys a working access token and a different refresh token."""
+        tokens = self._login(client)
+
+        response = client.post("/api/v1/auth/refresh", json={"refreshToken": tokens["refreshToken"]})
+
+        assert response.status_code == 200
+        refreshed = response.json()
+        assert refreshed["refreshToken"] != tokens["refreshToken"]
+        me = client.get("/api/v1/auth/users/me", headers={"Authorization": f"Bearer {refreshed['accessToken']}"})
+        assert me.json()["email"] == "trainer@test.com"
+
+    def test_reused_refresh_token_revokes_its_family(self, client: TestClient, test_trainer: User):
+        """Presenting a rotated token again fails and also kills the token that replaced it."""
+        first = self._login(client)["refreshToken"]
+        second = client.post("/api/v1/auth/refresh", json={"refreshToken": first}).json()["refreshToken"]
+
+        assert client.post("/api/v1/auth/refresh", json={"refreshToken": first}).status_code == 401
+        assert client.post("/api/v1/auth/refresh", json={"refreshToken": second}).status_code == 401
+
+    def test_unknown_refresh_token_fails(self, client: TestClient):
+        """Made-up refresh tokens are rejected."""
+        response = client.post("/api/v1/auth/refresh", json={"refreshToken": "not-a-token"})
+
+        assert response.status_code == 401
+
+    def test_password_change_revokes_refresh_tokens(self, client: TestClient, test_trainer: User):
+        """Changing the password ends every refreshable session."""
+        tokens = self._login(client)
+        response = client.put(
+            "/api/v1/users/me/password",
+            headers={"Authorization": f"Bearer {tokens['accessToken']}"},
+            json={"currentPassword": "password123", "newPassword": "new-password-456"},
+        )
+        assert response.status_code == 200
+
+        response = client.post("/api/v1/auth/refresh", json={"refreshToken": tokens["refreshToken"]})
+
+        assert response.status_code == 401
+
 
 class TestProtectedRoutes:
     """Tests for authentication requirement on protected routes."""
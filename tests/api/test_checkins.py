@@ -90,6 +90,45 @@ class TestListCheckins:
         data = response.json()
         assert len(data) >= 1
 
+    def test_cursor_pages_cover_all_checkins_once(self, client: TestClient, test_client_user: User, client_token: str, test_client_profile: Client):
+        """Cursor pages should walk every check-in exactly once, ending with a null cursor."""
+        for i in range(3):
+            client.post(
+                "/api/v1/checkins/",
+                headers={"Authorization": f"Bearer {client_token}"},
+                json={"weight_kg": 75.0 + i, "notes": f"Check-in {i}"}
+            )
+        
+        first = client.get(
+            f"/api/v1/checkins/page?client_id={test_client_profile.id}&limit=2",
+            headers={"Authorization": f"Bearer {client_token}"}
+        )
+        assert first.status_code == 200
+        first_data = first.json()
+        assert len(first_data["items"]) == 2
+        assert first_data["nextCursor"] is not None
+        
+        second = client.get(
+            f"/api/v1/checkins/page?client_id={test_client_profile.id}&limit=2&cursor={first_data['nextCursor']}",
+            headers={"Authorization": f"Bearer {client_token}"}
+        )
+        assert second.status_code == 200
+        second_data = second.json()
+        assert len(second_data["items"]) == 1
+        assert second_data["nextCursor"] is None
+        
+        ids = [item["id"] for item in first_data["items"] + second_data["items"]]
+        assert len(set(ids)) == 3
+    
+    def test_invalid_cursor_is_rejected(self, client: TestClient, client_token: str, test_client_profile: Client):
+        """A malformed cursor should produce a 400, not a server error."""
+        response = client.get(
+            f"/api/v1/checkins/page?client_id={test_client_profile.id}&cursor=not-a-cursor",
+            headers={"Authorization": f"Bearer {client_token}"}
+        )
+        
+        assert response.status_code == 400
+
 
 class TestCheckinOwnership:
     """Tests for check-in ownership enforcement."""
@@ -152,4 +191,54 @@ class TestCheckinDateFiltering:
         
         assert response.status_code == 200
         data = response.json()
-        assert isinstance(data, list)
\ No newline at end of file
+        assert isinstance(data, list)
+
+class TestCheckinSeries:
+    """Tests for the downsampled progress series."""
+
+    def test_series_aggregates_checkins_per_bucket(self, client: TestClient, client_token: str, test_client_profile: Client):
+        """Each check-in lands in the rollups; one bucket summarizes all check-ins in it."""
+        headers = {"Authorization": f"Bearer {client_token}"}
+        for weight, waist in [(80.0, 90), (78.0, 88.5), (79.0, None)]:
+            measurements = {"waist_cm": waist, "note": "tape"} if waist is not None else None
+            client.post("/api/v1/checkins/", headers=headers, json={"weight_kg": weight, "measurements": measurements})
+
+        response = client.get(
+            "/api/v1/checkins/series",
+            params={"client_id": str(test_client_profile.id), "granularity": "month"},
+            headers=headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["granularity"] == "month"
+        series = {s["metric"]: s["points"] for s in data["series"]}
+        assert set(series) == {"measurements.waist_cm", "weight_kg"}
+        (weight,) = series["weight_kg"]
+        assert (weight["count"], weight["min"], weight["max"], weight["avg"], weight["last"]) == (3, 78.0, 80.0, 79.0, 79.0)
+        (waist,) = series["measurements.waist_cm"]
+        assert (waist["count"], waist["last"]) == (2, 88.5)
+
+    def test_metric_filter(self, client: TestClient, client_token: str, test_client_profile: Client):
+        """Repeated metric params limit which series are returned."""
+        headers = {"Authorization": f"Bearer {client_token}"}
+        client.post("/api/v1/checkins/", headers=headers, json={"weight_kg": 75.0, "measurements": {"hip_cm": 95}})
+
+        response = client.get(
+            "/api/v1/checkins/series",
+            params={"client_id": str(test_client_profile.id), "granularity": "day", "metric": "measurements.hip_cm"},
+            headers=headers,
+        )
+
+        assert response.status_code == 200
+        assert [s["metric"] for s in response.json()["series"]] == ["measurements.hip_cm"]
+
+    def test_unknown_granularity_is_rejected(self, client: TestClient, client_token: str, test_client_profile: Client):
+        """Only day, week and month buckets exist."""
+        response = client.get(
+            "/api/v1/checkins/series",
+            params={"client_id": str(test_client_profile.id), "granularity": "hour"},
+            headers={"Authorization": f"Bearer {client_token}"},
+        )
+
+        assert response.status_code == 422
@@ -86,6 +86,18 @@ class TestListClients:
         for client_data in data:
             assert client_data["clientStatus"] == "active"
 
+    def test_fast_json_list_matches_default_serialization(self, client: TestClient, monkeypatch, test_trainer: User, trainer_token: str, test_client_profile: Client):
+        """FAST_JSON_RESPONSES should not change a single byte of the client list."""
+        from app.core.config import settings
+
+        headers = {"Authorization": f"Bearer {trainer_token}"}
+        default = client.get("/api/v1/clients/", headers=headers)
+        monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", True)
+        fast = client.get("/api/v1/clients/", headers=headers)
+
+        assert fast.status_code == 200
+        assert fast.content == default.content
+
 
 class TestGetClient:
     """Tests for retrieving individual client details."""
@@ -258,3 +258,92 @@ class TestFoodItemLibrary:
         )
         
         assert response.status_code == 204
+
+
+class TestFoodItemSearch:
+    """Tests for the ranked food item search endpoint."""
+
+    def _create(self, client: TestClient, token: str, name: str):
+        response = client.post(
+            "/api/v1/library/food-items",
+            headers={"Authorization": f"Bearer {token}"},
+            json={"name": name, "base_unit_type": "MASS", "calories_per_100g": 100},
+        )
+        assert response.status_code == 201
+        return response.json()
+
+    def test_prefix_matches_rank_first(self, client: TestClient, trainer_token: str):
+        """Names starting with the query should come before substring matches."""
+        self._create(client, trainer_token, "Roast Chicken")
+        self._create(client, trainer_token, "Chicken Breast")
+        self._create(client, trainer_token, "Brown Rice")
+
+        response = client.get(
+            "/api/v1/library/food-items/search?q=chicken",
+            headers={"Authorization": f"Bearer {trainer_token}"},
+        )
+
+        assert response.status_code == 200
+        names = [item["name"] for item in response.json()["items"]]
+        assert names == ["Chicken Breast", "Roast Chicken"]
+
+    def test_fuzzy_match_tolerates_typos(self, client: TestClient, trainer_token: str):
+        """A misspelled query should still find the item."""
+        self._create(client, trainer_token, "Chicken Breast")
+
+        response = client.get(
+            "/api/v1/library/food-items/search?q=chiken",
+            headers={"Authorization": f"Bearer {trainer_token}"},
+        )
+
+        assert [item["name"] for item in response.json()["items"]] == ["Chicken Breast"]
+
+    def test_cursor_walks_all_results(self, client: TestClient, trainer_token: str):
+        """Following nextCursor should return every match exactly once."""
+        for i in range(5):
+            self._create(client, trainer_token, f"Oats {i}")
+
+        seen, cursor = [], None
+        while True:
+            url = "/api/v1/library/food-items/search?q=oats&limit=2"
+            if cursor:
+                url += f"&cursor={cursor}"
+            page = client.get(url, headers={"Authorization": f"Bearer {trainer_token}"}).json()
+            seen += [item["name"] for item in page["items"]]
+            cursor = page["nextCursor"]
+            if not cursor:
+                break
+
+        assert seen == [f"Oats {i}" for i in range(5)]
+
+    def test_other_trainers_private_items_are_hidden(self, client: TestClient, test_db: Session, trainer_token: str):
+        """Private items of other trainers should not be searchable."""
+        import uuid
+        from app.core.security import get_password_hash, create_access_token
+
+        other_trainer = User(
+            id=uuid.uuid4(),
+            email="other@trainer.com",
+            hashed_password=get_password_hash("password123"),
+            full_name="Other Trainer",
+            user_role="trainer"
+        )
+        test_db.add(other_trainer)
+        test_db.commit()
+        self._create(client, create_access_token(subject=other_trainer.email), "Secret Smoothie")
+
+        response = client.get(
+            "/api/v1/library/food-items/search?q=smoothie",
+            headers={"Authorization": f"Bearer {trainer_token}"},
+        )
+
+        assert response.json()["items"] == []
+
+    def test_invalid_cursor_returns_400(self, client: TestClient, trainer_token: str):
+        """A malformed cursor should be rejected."""
+        response = client.get(
+            "/api/v1/library/food-items/search?q=oats&cursor=garbage",
+            headers={"Authorization": f"Bearer {trainer_token}"},
+        )
+
+        assert response.status_code == 400
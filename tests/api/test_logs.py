@@ -1,12 +1,15 @@
 # tests/api/test_logs.py
 # API integration tests for workout and diet logging endpoints.
 
+from datetime import date
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
 from app.models.user import User
 from app.models.client import Client
+from app.models.streak import ClientStreak
 from app.models.template import ExerciseLibrary, FoodItemLibrary
 
 
@@ -204,3 +207,125 @@ class TestListLogs:
         )
         
         assert response.status_code == 200
+
+
+class TestBatchLogging:
+    """Tests for POST /logs/batch."""
+
+    def _assign_plans(self, client: TestClient, trainer_token: str, test_client_profile: Client, test_exercise: ExerciseLibrary, test_food_item: FoodItemLibrary):
+        headers = {"Authorization": f"Bearer {trainer_token}"}
+        workout_template = client.post(
+            "/api/v1/templates/workout",
+            headers=headers,
+            json={
+                "name": "Strength Program",
+                "items": [{"exercise_id": str(test_exercise.id), "day_name": "Monday", "target_sets": "4", "target_reps": "8", "display_order": 1}],
+            },
+        ).json()
+        diet_template = client.post(
+            "/api/v1/templates/diet",
+            headers=headers,
+            json={
+                "name": "High Protein",
+                "items": [{"food_item_id": str(test_food_item.id), "meal_name": "Breakfast", "serving": {"size": 150, "unit": "g"}, "display_order": 1}],
+            },
+        ).json()
+        workout_plan = client.post(
+            "/api/v1/assigned-plans/workout",
+            headers=headers,
+            json={"client_id": str(test_client_profile.id), "source_template_id": workout_template["id"]},
+        ).json()
+        diet_plan = client.post(
+            "/api/v1/assigned-plans/diet",
+            headers=headers,
+            json={"client_id": str(test_client_profile.id), "source_template_id": diet_template["id"]},
+        ).json()
+        return workout_plan["id"], diet_plan["id"]
+
+    def test_client_uploads_mixed_batch(self, client: TestClient, trainer_token: str, client_token: str, test_client_profile: Client, test_exercise: ExerciseLibrary, test_food_item: FoodItemLibrary):
+        """Valid workout and diet items should all be created, in request order."""
+        workout_plan_id, diet_plan_id = self._assign_plans(client, trainer_token, test_client_profile, test_exercise, test_food_item)
+
+        response = client.post(
+            "/api/v1/logs/batch",
+            headers={"Authorization": f"Bearer {client_token}"},
+            json={
+                "items": [
+                    {"kind": "workout", "assignedPlanId": workout_plan_id, "performanceData": {"sets_completed": 4}, "loggedAt": "2024-01-05T07:00:00Z"},
+                    {"kind": "diet", "assignedPlanId": diet_plan_id, "mealName": "Breakfast", "status": "Followed"},
+                    {"kind": "workout", "assignedPlanId": workout_plan_id, "performanceData": {"sets_completed": 3}},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["created"] == 3
+        assert data["rejected"] == 0
+        assert [r["index"] for r in data["results"]] == [0, 1, 2]
+        assert all(r["status"] == "created" and r["id"] for r in data["results"])
+
+        logs = client.get(
+            f"/api/v1/logs/workout?client_id={test_client_profile.id}",
+            headers={"Authorization": f"Bearer {client_token}"},
+        ).json()
+        assert len(logs) == 2
+        assert logs[-1]["loggedAt"].startswith("2024-01-05")
+
+    def test_invalid_items_are_rejected_individually(self, client: TestClient, trainer_token: str, client_token: str, test_client_profile: Client, test_exercise: ExerciseLibrary, test_food_item: FoodItemLibrary):
+        """Unknown plans and invalid statuses should be reported per item without failing the batch."""
+        workout_plan_id, diet_plan_id = self._assign_plans(client, trainer_token, test_client_profile, test_exercise, test_food_item)
+
+        response = client.post(
+            "/api/v1/logs/batch",
+            headers={"Authorization": f"Bearer {client_token}"},
+            json={
+                "items": [
+                    {"kind": "workout", "assignedPlanId": diet_plan_id, "performanceData": {}},
+                    {"kind": "diet", "assignedPlanId": diet_plan_id, "mealName": "Lunch", "status": "Eaten"},
+                    {"kind": "diet", "assignedPlanId": diet_plan_id, "mealName": "Dinner", "status": "Skipped"},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["created"] == 1
+        assert data["rejected"] == 2
+        assert [r["status"] for r in data["results"]] == ["rejected", "rejected", "created"]
+        assert data["results"][0]["error"]
+        assert data["results"][2]["id"]
+
+    def test_backdated_items_count_towards_their_utc_day(self, client: TestClient, test_db: Session, trainer_token: str, client_token: str, test_client_profile: Client, test_exercise: ExerciseLibrary, test_food_item: FoodItemLibrary):
+        """Replayed logs advance the streak on the same UTC day the rebuild job would use."""
+        workout_plan_id, _ = self._assign_plans(client, trainer_token, test_client_profile, test_exercise, test_food_item)
+
+        response = client.post(
+            "/api/v1/logs/batch",
+            headers={"Authorization": f"Bearer {client_token}"},
+            json={"items": [{"kind": "workout", "assignedPlanId": workout_plan_id, "performanceData": {}, "loggedAt": "2024-01-05T22:30:00-05:00"}]},
+        )
+
+        assert response.status_code == 200
+        streak = test_db.query(ClientStreak).filter(ClientStreak.client_id == test_client_profile.id).one()
+        assert streak.last_active_date == date(2024, 1, 6)
+
+    def test_trainer_cannot_upload_batch(self, client: TestClient, trainer_token: str):
+        """Trainers should not be able to use the client batch endpoint."""
+        response = client.post(
+            "/api/v1/logs/batch",
+            headers={"Authorization": f"Bearer {trainer_token}"},
+            json={"items": [{"kind": "diet", "assignedPlanId": "00000000-0000-0000-0000-000000000000", "mealName": "Lunch", "status": "Followed"}]},
+        )
+
+        assert response.status_code == 403
+
+    def test_empty_batch_is_rejected(self, client: TestClient, client_token: str, test_client_profile: Client):
+        """An empty batch should fail validation."""
+        response = client.post(
+            "/api/v1/logs/batch",
+            headers={"Authorization": f"Bearer {client_token}"},
+            json={"items": []},
+        )
+
+        assert response.status_code == 422
@@ -327,3 +327,42 @@ class TestTemplateOwnership:
         )
         
         assert response.status_code == 404
+
+
+class TestConditionalTemplateList:
+    """Tests for ETag handling on the template list endpoints."""
+
+    def _create_diet_template(self, client: TestClient, trainer_token: str, test_food_item: FoodItemLibrary, name: str):
+        return client.post(
+            "/api/v1/templates/diet",
+            headers={"Authorization": f"Bearer {trainer_token}"},
+            json={
+                "name": name,
+                "items": [{"food_item_id": str(test_food_item.id), "meal_name": "Breakfast", "serving": {"size": 100, "unit": "g"}, "display_order": 1}],
+            },
+        ).json()
+
+    def test_unchanged_list_returns_304(self, client: TestClient, trainer_token: str, test_food_item: FoodItemLibrary):
+        """Repeating the request with the ETag should answer 304 with no body."""
+        self._create_diet_template(client, trainer_token, test_food_item, "Cut")
+        headers = {"Authorization": f"Bearer {trainer_token}"}
+
+        first = client.get("/api/v1/templates/diet", headers=headers)
+        second = client.get("/api/v1/templates/diet", headers={**headers, "If-None-Match": first.headers["ETag"]})
+
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert second.content == b""
+
+    def test_new_template_invalidates_etag(self, client: TestClient, trainer_token: str, test_food_item: FoodItemLibrary):
+        """Creating a template should change the list ETag."""
+        self._create_diet_template(client, trainer_token, test_food_item, "Cut")
+        headers = {"Authorization": f"Bearer {trainer_token}"}
+        etag = client.get("/api/v1/templates/diet", headers=headers).headers["ETag"]
+
+        self._create_diet_template(client, trainer_token, test_food_item, "Bulk")
+
+        response = client.get("/api/v1/templates/diet", headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert len(response.json()) == 2
+        assert response.headers["ETag"] != etag
@@ -0,0 +1,134 @@
+# tests/api/test_trainers.py
+# API integration tests for the trainer-wide endpoints.
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.security import get_password_hash
+from app.models.activity import ActivityFeed
+from app.models.client import Client
+from app.models.user import User
+from app.services.activity_feed_service import activity_feed_service
+
+
+def add_client(db: Session, trainer: User, status: str = "active", deleted: bool = False) -> Client:
+    client = Client(
+        id=uuid.uuid4(),
+        trainer_user_id=trainer.id,
+        client_status=status,
+        invited_full_name="Roster Client",
+        invited_email=f"{uuid.uuid4().hex[:8]}@test.com",
+        deleted_at=datetime.now(timezone.utc) if deleted else None,
+    )
+    db.add(client)
+    db.flush()
+    return client
+
+
+@pytest.fixture
+def roster_feed(test_db: Session, test_trainer: User):
+    """Two live clients and one deleted client of the trainer, plus another trainer's client, each with events."""
+    other_trainer = User(
+        id=uuid.uuid4(),
+        email="other_trainer@test.com",
+        hashed_password=get_password_hash("password123"),
+        full_name="Other Trainer",
+        user_role="trainer",
+    )
+    test_db.add(other_trainer)
+    test_db.flush()
+
+    first, second = add_client(test_db, test_trainer), add_client(test_db, test_trainer, status="paused")
+    deleted = add_client(test_db, test_trainer, deleted=True)
+    foreign = add_client(test_db, other_trainer)
+
+    start = datetime(2026, 5, 1, 8, 0, tzinfo=timezone.utc)
+    events = []
+    for minute, client, event_type in [
+        (0, first, "WORKOUT_LOGGED"),
+        (1, second, "DIET_LOGGED"),
+        (2, first, "CHECKIN_SUBMITTED"),
+        (3, second, "WORKOUT_LOGGED"),
+        (4, deleted, "WORKOUT_LOGGED"),
+        (5, foreign, "WORKOUT_LOGGED"),
+        (6, first, "DIET_LOGGED"),
+    ]:
+        event = ActivityFeed(
+            client_id=client.id,
+            event_type=event_type,
+            event_timestamp=start + timedelta(minutes=minute),
+            event_metadata={"minute": minute},
+        )
+        test_db.add(event)
+        events.append(event)
+    test_db.commit()
+    return {"first": first, "second": second}
+
+
+class TestTrainerActivityFeed:
+    """Tests for GET /trainers/me/activity-feed."""
+
+    def test_merges_live_clients_newest_first(self, client: TestClient, trainer_token: str, roster_feed):
+        """Events of every live client come back in one stream; deleted and foreign clients are left out."""
+        response = client.get("/api/v1/trainers/me/activity-feed", headers={"Authorization": f"Bearer {trainer_token}"})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["eventMetadata"]["minute"] for item in data["items"]] == [6, 3, 2, 1, 0]
+        assert data["items"][0]["clientId"] == str(roster_feed["first"].id)
+        assert data["nextCursor"] is None
+
+    def test_event_type_filter(self, client: TestClient, trainer_token: str, roster_feed):
+        """Repeated event_type params select several types; duplicates do not duplicate events."""
+        response = client.get(
+            "/api/v1/trainers/me/activity-feed",
+            params=[("event_type", "DIET_LOGGED"), ("event_type", "CHECKIN_SUBMITTED"), ("event_type", "DIET_LOGGED")],
+            headers={"Authorization": f"Bearer {trainer_token}"},
+        )
+
+        assert response.status_code == 200
+        assert [item["eventMetadata"]["minute"] for item in response.json()["items"]] == [6, 2, 1]
+
+    def test_cursor_pages_cover_the_stream_once(self, client: TestClient, trainer_token: str, roster_feed):
+        """Walking the cursor returns every event exactly once, in order."""
+        headers = {"Authorization": f"Bearer {trainer_token}"}
+        minutes, cursor = [], None
+        while True:
+            params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+            data = client.get("/api/v1/trainers/me/activity-feed", params=params, headers=headers).json()
+            minutes += [item["eventMetadata"]["minute"] for item in data["items"]]
+            cursor = data["nextCursor"]
+            if not cursor:
+                break
+
+        assert minutes == [6, 3, 2, 1, 0]
+
+    def test_requires_trainer_role(self, client: TestClient, client_token: str, test_client_profile: Client):
+        """Clients cannot read the trainer feed."""
+        response = client.get("/api/v1/trainers/me/activity-feed", headers={"Authorization": f"Bearer {client_token}"})
+
+        assert response.status_code == 403
+
+
+class TestTrainerActivityStream:
+    """Tests for the replay behind GET /trainers/me/activity-stream."""
+
+    def test_replay_after_last_event_id(self, test_db: Session, test_trainer: User, roster_feed):
+        """Resuming returns only newer events of live clients, oldest first."""
+        events = activity_feed_service.get_trainer_activity_since(test_db, trainer_id=test_trainer.id, after_id=0, limit=10)
+        assert [event.event_metadata["minute"] for event in events] == [0, 1, 2, 3, 6]
+
+        resumed = activity_feed_service.get_trainer_activity_since(
+            test_db, trainer_id=test_trainer.id, after_id=events[2].id, limit=1
+        )
+        assert [event.event_metadata["minute"] for event in resumed] == [3]
+
+    def test_requires_trainer_role(self, client: TestClient, client_token: str, test_client_profile: Client):
+        """Clients cannot open the trainer stream."""
+        response = client.get("/api/v1/trainers/me/activity-stream", headers={"Authorization": f"Bearer {client_token}"})
+
+        assert response.status_code == 403
@@ -0,0 +1 @@
+"""Benchmark scripts package (run by hand against a seeded database)."""
@@ -0,0 +1,144 @@
+"""
+Compares requests/sec of the read-heavy endpoints between the sync (threadpool)
+and async (AsyncSession) database stacks.
+
+Needs a database seeded with tests/scripts/seed_dev_db.py. For each mode the
+script starts a uvicorn worker with DB_ASYNC_ENABLED set accordingly, drives it
+with concurrent httpx requests for a fixed duration, and prints a JSON report.
+
+    python -m tests.benchmarks.bench_db_modes --concurrency 64 --duration 20
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+# ---------- PROJECT ROOT FIX ----------
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from app.core.database import SessionLocal
+from app.models.user import User
+from app.models.client import Client
+
+API = "/api/v1"
+
+
+def pick_seeded_client():
+    """Returns (client_email, client_id, trainer_email) for an active seeded client."""
+    db = SessionLocal()
+    try:
+        row = (
+            db.query(User.email, Client.id, Client.trainer_user_id)
+            .join(Client, Client.client_user_id == User.id)
+            .filter(Client.client_status == "active", Client.deleted_at.is_(None))
+            .first()
+        )
+        if not row:
+            raise SystemExit("No active client found. Seed the database first.")
+        trainer_email = db.query(User.email).filter(User.id == row.trainer_user_id).scalar()
+        return row.email, row.id, trainer_email
+    finally:
+        db.close()
+
+
+def start_server(port: int, async_enabled: bool) -> subprocess.Popen:
+    env = dict(os.environ, DB_ASYNC_ENABLED="1" if async_enabled else "0")
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=PROJECT_ROOT,
+        env=env,
+    )
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health").status_code == 200:
+                return proc
+        except httpx.TransportError:
+            time.sleep(0.2)
+    proc.terminate()
+    raise SystemExit(f"Server on port {port} did not start")
+
+
+async def login(http: httpx.AsyncClient, email: str, password: str) -> dict:
+    resp = await http.post(f"{API}/auth/token", data={"username": email, "password": password})
+    resp.raise_for_status()
+    return {"Authorization": f"Bearer {resp.json()['accessToken']}"}
+
+
+async def drive(base_url: str, concurrency: int, duration: float, seeded) -> dict:
+    client_email, client_id, trainer_email = seeded
+    async with httpx.AsyncClient(base_url=base_url, timeout=30) as http:
+        client_headers = await login(http, client_email, "client_password")
+        trainer_headers = await login(http, trainer_email, "trainer_password")
+
+        requests = [
+            (f"{API}/logs/workout?client_id={client_id}", client_headers),
+            (f"{API}/logs/diet?client_id={client_id}", client_headers),
+            (f"{API}/checkins/?client_id={client_id}", client_headers),
+            (f"{API}/trainees/me/today", client_headers),
+            (f"{API}/clients/{client_id}/activity-feed", trainer_headers),
+        ]
+        latencies = []
+        errors = 0
+        stop_at = time.perf_counter() + duration
+
+        async def worker(offset: int):
+            nonlocal errors
+            i = offset
+            while time.perf_counter() < stop_at:
+                url, headers = requests[i % len(requests)]
+                i += 1
+                started = time.perf_counter()
+                resp = await http.get(url, headers=headers)
+                latencies.append(time.perf_counter() - started)
+                if resp.status_code != 200:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(n) for n in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "requests_per_sec": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=15.0)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    seeded = pick_seeded_client()
+    report = {"concurrency": args.concurrency, "duration_s": args.duration, "modes": {}}
+
+    for mode, async_enabled in (("sync", False), ("async", True)):
+        proc = start_server(args.port, async_enabled)
+        try:
+            report["modes"][mode] = asyncio.run(
+                drive(f"http://127.0.0.1:{args.port}", args.concurrency, args.duration, seeded)
+            )
+        finally:
+            proc.terminate()
+            proc.wait()
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
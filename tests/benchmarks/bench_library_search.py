@@ -0,0 +1,121 @@
+"""
+Measures food library search latency as the library grows to 100k items.
+
+Generates synthetic private food items for one seeded trainer in steps
+(1k, 10k, 100k by default). After each step it times a fixed set of queries
+(prefix, substring, typo) through LibraryService.search_food_items, first page
+and second page, and prints a JSON report. With the trigram index, p50/p95
+should stay roughly flat across sizes. The generated rows are deleted at the end.
+
+    python -m tests.benchmarks.bench_library_search --sizes 1000 10000 100000
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+
+# ---------- PROJECT ROOT FIX ----------
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from sqlalchemy import delete, insert
+
+from app.core.database import SessionLocal
+import app.main  # noqa: F401  (registers every mapper)
+from app.models.user import User
+from app.models.template import FoodItemLibrary
+from app.services.library_service import library_service
+
+NAME_PREFIX = "bench"
+WORDS = [
+    "chicken", "beef", "salmon", "tuna", "rice", "oats", "quinoa", "lentil", "yogurt", "cheese",
+    "almond", "walnut", "banana", "apple", "spinach", "broccoli", "potato", "pasta", "tofu", "egg",
+    "grilled", "roasted", "smoked", "raw", "baked", "steamed", "brown", "whole", "greek", "wild",
+]
+QUERIES = ["chicken", "gree", "brocoli", "smoked salmon", "oat"]
+
+
+def pick_trainer_id(db) -> uuid.UUID:
+    trainer_id = db.query(User.id).filter(User.user_role == "trainer", User.deleted_at.is_(None)).limit(1).scalar()
+    if not trainer_id:
+        raise SystemExit("No trainer found. Seed the database first.")
+    return trainer_id
+
+
+def insert_items(db, trainer_id: uuid.UUID, start: int, stop: int, rng: random.Random):
+    batch = []
+    for i in range(start, stop):
+        name = " ".join(rng.sample(WORDS, 3))
+        batch.append({
+            "id": uuid.uuid4(),
+            "name": f"{NAME_PREFIX} {name} {i}",
+            "owner_trainer_id": trainer_id,
+            "is_verified": False,
+            "base_unit_type": "MASS",
+            "calories_per_100g": rng.randint(20, 900),
+        })
+        if len(batch) == 5000:
+            db.execute(insert(FoodItemLibrary), batch)
+            batch = []
+    if batch:
+        db.execute(insert(FoodItemLibrary), batch)
+    db.commit()
+
+
+def time_queries(db, trainer_id: uuid.UUID, repeats: int) -> dict:
+    latencies = []
+    for _ in range(repeats):
+        for q in QUERIES:
+            started = time.perf_counter()
+            page = library_service.search_food_items(db, trainer_id=trainer_id, q=q, limit=20)
+            if page["next_cursor"]:
+                library_service.search_food_items(db, trainer_id=trainer_id, q=q, cursor=page["next_cursor"], limit=20)
+            latencies.append((time.perf_counter() - started) / (2 if page["next_cursor"] else 1))
+    latencies.sort()
+    return {
+        "queries": len(latencies),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    db = SessionLocal()
+    trainer_id = pick_trainer_id(db)
+    report = {"queries": QUERIES, "sizes": {}}
+    try:
+        inserted = 0
+        for size in sorted(args.sizes):
+            insert_items(db, trainer_id, inserted, size, rng)
+            inserted = size
+            db.connection().exec_driver_sql("ANALYZE food_item_library")
+            report["sizes"][str(size)] = time_queries(db, trainer_id, args.repeats)
+    finally:
+        db.rollback()
+        db.execute(
+            delete(FoodItemLibrary).where(
+                FoodItemLibrary.owner_trainer_id == trainer_id,
+                FoodItemLibrary.name.like(f"{NAME_PREFIX} %"),
+            )
+        )
+        db.commit()
+        db.close()
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+"""
+Reproducible load test: seeds the local database at several scales and replays a
+mixed trainer / trainee workload against the API, reporting per-endpoint latency
+(p50/p95/p99) and requests/sec as a JSON artifact that can be diffed between commits.
+
+For each scale the script reseeds with tests/scripts/seed_dev_db.py (this TRUNCATES
+the database), starts a uvicorn server (or uses --base-url), logs in a pool of
+trainers and trainees, then sends a fixed, seed-determined schedule of requests
+from --concurrency concurrent workers. Seeding output goes to stderr; the report
+goes to stdout and, with --output, to a file.
+
+    python -m tests.benchmarks.bench_load --scales 1 3 10 --requests 5000 --output load.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import math
+import os
+import random
+import subprocess
+import sys
+import time
+
+import httpx
+from faker import Faker
+
+# ---------- PROJECT ROOT FIX ----------
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from app.core.database import SessionLocal
+from app.models.user import User
+from app.models.client import Client
+from app.models.template import WorkoutPlanTemplate, DietPlanTemplate
+from tests.scripts.seed_dev_db import seed
+
+API = "/api/v1"
+TRAINER_PASSWORD = "trainer_password"
+CLIENT_PASSWORD = "client_password"
+
+# (name, weight, role). Roughly what the mobile apps send: trainees mostly open
+# "today" and their logs, trainers mostly browse clients and templates.
+TRAFFIC_MIX = [
+    ("login", 2, "client"),
+    ("trainee_today", 20, "client"),
+    ("workout_logs", 10, "client"),
+    ("diet_logs", 10, "client"),
+    ("trainer_dashboard", 10, "trainer"),
+    ("client_list", 10, "trainer"),
+    ("client_overview", 8, "trainer"),
+    ("workout_templates", 8, "trainer"),
+    ("diet_template", 6, "trainer"),
+    ("assign_plan", 2, "trainer"),
+]
+
+
+def build_request(name: str, actor: dict, rng: random.Random) -> tuple:
+    """Returns (method, url, kwargs) for one scheduled request."""
+    headers = actor.get("headers")
+    if name == "login":
+        return "POST", f"{API}/auth/token", {"data": {"username": actor["email"], "password": CLIENT_PASSWORD}}
+    if name == "trainee_today":
+        return "GET", f"{API}/trainees/me/today", {"headers": headers}
+    if name == "workout_logs":
+        return "GET", f"{API}/logs/workout?client_id={actor['client_id']}", {"headers": headers}
+    if name == "diet_logs":
+        return "GET", f"{API}/logs/diet?client_id={actor['client_id']}", {"headers": headers}
+    if name == "trainer_dashboard":
+        return "GET", f"{API}/trainers/me/stats", {"headers": headers}
+    if name == "client_list":
+        return "GET", f"{API}/clients/?status=active", {"headers": headers}
+    if name == "client_overview":
+        return "GET", f"{API}/clients/{rng.choice(actor['client_ids'])}/overview", {"headers": headers}
+    if name == "workout_templates":
+        return "GET", f"{API}/templates/workout", {"headers": headers}
+    if name == "diet_template":
+        return "GET", f"{API}/templates/diet/{actor['diet_template_id']}", {"headers": headers}
+    if name == "assign_plan":
+        body = {"clientId": str(rng.choice(actor["client_ids"])), "sourceTemplateId": str(actor["workout_template_id"])}
+        return "POST", f"{API}/assigned-plans/workout", {"headers": headers, "json": body}
+    raise ValueError(f"Unknown request type: {name}")
+
+
+def reseed(scale: int, rng_seed: int):
+    """Deterministically reseeds the database; the seeder's progress output goes to stderr."""
+    random.seed(rng_seed)
+    Faker.seed(rng_seed)
+    with contextlib.redirect_stdout(sys.stderr):
+        seed(scale)
+
+
+def load_actors(max_actors: int) -> tuple[list[dict], list[dict]]:
+    """Seeded trainers (with their active clients and templates) and active trainees, in a stable order."""
+    db = SessionLocal()
+    try:
+        trainers = []
+        trainer_rows = (
+            db.query(User.id, User.email)
+            .filter(User.user_role == "trainer", User.deleted_at.is_(None))
+            .order_by(User.email)
+            .limit(max_actors)
+            .all()
+        )
+        for row in trainer_rows:
+            client_ids = [
+                client_id for (client_id,) in db.query(Client.id)
+                .filter(Client.trainer_user_id == row.id, Client.client_status == "active", Client.deleted_at.is_(None))
+                .order_by(Client.id)
+            ]
+            workout_template_id = db.query(WorkoutPlanTemplate.id).filter(WorkoutPlanTemplate.trainer_id == row.id).limit(1).scalar()
+            diet_template_id = db.query(DietPlanTemplate.id).filter(DietPlanTemplate.trainer_id == row.id).limit(1).scalar()
+            if client_ids and workout_template_id and diet_template_id:
+                trainers.append({
+                    "email": row.email,
+                    "client_ids": client_ids,
+                    "workout_template_id": workout_template_id,
+                    "diet_template_id": diet_template_id,
+                })
+
+        clients = [
+            {"email": email, "client_id": client_id}
+            for email, client_id in db.query(User.email, Client.id)
+            .join(Client, Client.client_user_id == User.id)
+            .filter(Client.client_status == "active", Client.deleted_at.is_(None))
+            .order_by(User.email)
+            .limit(max_actors)
+        ]
+        if not trainers or not clients:
+            raise SystemExit("Seeding produced no active trainers/clients to drive.")
+        return trainers, clients
+    finally:
+        db.close()
+
+
+def build_schedule(total: int, trainers: list, clients: list, rng: random.Random) -> list:
+    """A fixed list of (name, method, url, kwargs); the same --seed always yields the same schedule."""
+    names = [name for name, _, _ in TRAFFIC_MIX]
+    weights = [weight for _, weight, _ in TRAFFIC_MIX]
+    roles = {name: role for name, _, role in TRAFFIC_MIX}
+    schedule = []
+    for name in rng.choices(names, weights=weights, k=total):
+        actor = rng.choice(trainers if roles[name] == "trainer" else clients)
+        schedule.append((name, *build_request(name, actor, rng)))
+    return schedule
+
+
+def start_server(port: int, workers: int) -> subprocess.Popen:
+    proc = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--port", str(port), "--workers", str(workers), "--log-level", "warning",
+        ],
+        cwd=PROJECT_ROOT,
+    )
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health").status_code == 200:
+                return proc
+        except httpx.TransportError:
+            time.sleep(0.2)
+    proc.terminate()
+    raise SystemExit(f"Server on port {port} did not start")
+
+
+def percentile(sorted_values: list, pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    index = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies: list, errors: int, elapsed: float) -> dict:
+    latencies = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "requests_per_sec": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+    }
+
+
+async def login(http: httpx.AsyncClient, email: str, password: str) -> dict:
+    resp = await http.post(f"{API}/auth/token", data={"username": email, "password": password})
+    resp.raise_for_status()
+    return {"Authorization": f"Bearer {resp.json()['accessToken']}"}
+
+
+async def drive(base_url: str, concurrency: int, total: int, warmup: int, trainers: list, clients: list, rng_seed: int) -> dict:
+    async with httpx.AsyncClient(base_url=base_url, timeout=60) as http:
+        for actor in trainers:
+            actor["headers"] = await login(http, actor["email"], TRAINER_PASSWORD)
+        for actor in clients:
+            actor["headers"] = await login(http, actor["email"], CLIENT_PASSWORD)
+
+        rng = random.Random(rng_seed)
+        schedule = build_schedule(warmup + total, trainers, clients, rng)
+        results = {name: {"latencies": [], "errors": 0} for name, _, _ in TRAFFIC_MIX}
+
+        async def run(entries: list, record: bool):
+            queue = iter(entries)
+
+            async def worker():
+                # Workers share one iterator, so the order requests are issued in is fixed.
+                for name, method, url, kwargs in queue:
+                    started = time.perf_counter()
+                    resp = await http.request(method, url, **kwargs)
+                    took = time.perf_counter() - started
+                    if record:
+                        results[name]["latencies"].append(took)
+                        if resp.status_code >= 400:
+                            results[name]["errors"] += 1
+
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+        await run(schedule[:warmup], record=False)
+        started = time.perf_counter()
+        await run(schedule[warmup:], record=True)
+        elapsed = time.perf_counter() - started
+
+    all_latencies = [latency for r in results.values() for latency in r["latencies"]]
+    return {
+        "total": summarize(all_latencies, sum(r["errors"] for r in results.values()), elapsed),
+        "endpoints": {
+            name: summarize(r["latencies"], r["errors"], elapsed)
+            for name, r in results.items() if r["latencies"]
+        },
+    }
+
+
+def git_revision() -> dict:
+    def git(*args):
+        try:
+            return subprocess.check_output(["git", *args], cwd=PROJECT_ROOT, text=True, stderr=subprocess.DEVNULL).strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+    return {"commit": git("rev-parse", "HEAD"), "dirty": bool(git("status", "--porcelain", "--untracked-files=no"))}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 3, 10], help="Trainers to seed per run")
+    parser.add_argument("--requests", type=int, default=3000, help="Measured requests per scale")
+    parser.add_argument("--warmup", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--actors", type=int, default=20, help="Trainers and trainees logged in per scale")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--base-url", help="Drive an already running server instead of starting one")
+    parser.add_argument("--output", help="Also write the JSON report to this file")
+    args = parser.parse_args()
+
+    report = {
+        "git": git_revision(),
+        "seed": args.seed,
+        "requests": args.requests,
+        "warmup": args.warmup,
+        "concurrency": args.concurrency,
+        "mix": {name: weight for name, weight, _ in TRAFFIC_MIX},
+        "scales": {},
+    }
+
+    for scale in args.scales:
+        reseed(scale, args.seed)
+        trainers, clients = load_actors(args.actors)
+        proc = None if args.base_url else start_server(args.port, args.workers)
+        base_url = args.base_url or f"http://127.0.0.1:{args.port}"
+        try:
+            report["scales"][str(scale)] = asyncio.run(
+                drive(base_url, args.concurrency, args.requests, args.warmup, trainers, clients, args.seed)
+            )
+        finally:
+            if proc:
+                proc.terminate()
+                proc.wait()
+
+    output = json.dumps(report, indent=2, default=str)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Login storm test: checks that trainer dashboard latency stays flat while a burst
+of logins saturates bcrypt.
+
+Seeds the database once (this TRUNCATES it, see bench_load), starts a uvicorn
+server (or uses --base-url) and runs two phases of --duration seconds each:
+dashboard traffic alone from --concurrency workers, then the same traffic while
+--storm-concurrency workers send logins back to back. The report lists the
+dashboard's p50/p95/p99 in both phases, and how many logins succeeded or were
+turned away with a 503 by the bounded password pool.
+
+    python -m tests.benchmarks.bench_login_storm --duration 20 --storm-concurrency 64
+    PASSWORD_HASH_WORKERS=0 python -m tests.benchmarks.bench_login_storm   # inline bcrypt, for comparison
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+import httpx
+
+# ---------- PROJECT ROOT FIX ----------
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from tests.benchmarks.bench_load import (
+    CLIENT_PASSWORD,
+    TRAINER_PASSWORD,
+    build_request,
+    git_revision,
+    load_actors,
+    login,
+    reseed,
+    start_server,
+    summarize,
+)
+
+
+async def dashboard_traffic(http: httpx.AsyncClient, trainers: list, concurrency: int, deadline: float, rng: random.Random) -> dict:
+    latencies, errors = [], 0
+
+    async def worker(worker_rng: random.Random):
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            method, url, kwargs = build_request("trainer_dashboard", worker_rng.choice(trainers), worker_rng)
+            started = time.perf_counter()
+            resp = await http.request(method, url, **kwargs)
+            latencies.append(time.perf_counter() - started)
+            if resp.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(random.Random(rng.random())) for _ in range(concurrency)))
+    return summarize(latencies, errors, time.perf_counter() - started)
+
+
+async def login_storm(http: httpx.AsyncClient, clients: list, concurrency: int, deadline: float) -> dict:
+    counts = {"ok": 0, "rejected_503": 0, "other_errors": 0}
+
+    async def worker(offset: int):
+        index = offset
+        while time.perf_counter() < deadline:
+            actor = clients[index % len(clients)]
+            index += concurrency
+            resp = await http.post("/api/v1/auth/token", data={"username": actor["email"], "password": CLIENT_PASSWORD})
+            if resp.status_code == 200:
+                counts["ok"] += 1
+            elif resp.status_code == 503:
+                counts["rejected_503"] += 1
+            else:
+                counts["other_errors"] += 1
+
+    await asyncio.gather(*(worker(offset) for offset in range(concurrency)))
+    return counts
+
+
+async def drive(base_url: str, trainers: list, clients: list, args) -> dict:
+    rng = random.Random(args.seed)
+    async with httpx.AsyncClient(base_url=base_url, timeout=120) as http:
+        for actor in trainers:
+            actor["headers"] = await login(http, actor["email"], TRAINER_PASSWORD)
+
+        # Warm up connections, caches and the password pool's processes.
+        await dashboard_traffic(http, trainers, args.concurrency, time.perf_counter() + 2, rng)
+        await login_storm(http, clients, 2, time.perf_counter() + 1)
+
+        baseline = await dashboard_traffic(http, trainers, args.concurrency, time.perf_counter() + args.duration, rng)
+
+        deadline = time.perf_counter() + args.duration
+        during, logins = await asyncio.gather(
+            dashboard_traffic(http, trainers, args.concurrency, deadline, rng),
+            login_storm(http, clients, args.storm_concurrency, deadline),
+        )
+
+    return {
+        "dashboard_baseline": baseline,
+        "dashboard_during_storm": during,
+        "p95_ratio": round(during["p95_ms"] / baseline["p95_ms"], 2) if baseline["p95_ms"] else None,
+        "logins": logins,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=int, default=3, help="Trainers to seed")
+    parser.add_argument("--duration", type=float, default=15, help="Seconds per phase")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent dashboard workers")
+    parser.add_argument("--storm-concurrency", type=int, default=64, help="Concurrent login workers during the storm")
+    parser.add_argument("--actors", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--port", type=int, default=8767)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--base-url", help="Drive an already running server instead of starting one")
+    parser.add_argument("--output", help="Also write the JSON report to this file")
+    args = parser.parse_args()
+
+    reseed(args.scale, args.seed)
+    trainers, clients = load_actors(args.actors)
+    proc = None if args.base_url else start_server(args.port, args.workers)
+    base_url = args.base_url or f"http://127.0.0.1:{args.port}"
+    try:
+        results = asyncio.run(drive(base_url, trainers, clients, args))
+    finally:
+        if proc:
+            proc.terminate()
+            proc.wait()
+
+    report = {
+        "git": git_revision(),
+        "seed": args.seed,
+        "scale": args.scale,
+        "duration_s": args.duration,
+        "concurrency": args.concurrency,
+        "storm_concurrency": args.storm_concurrency,
+        "password_hash_workers": os.environ.get("PASSWORD_HASH_WORKERS", "default"),
+        **results,
+    }
+    output = json.dumps(report, indent=2, default=str)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Compares the scalar and the vectorized nutrition calculators on large plans.
+
+Generates a synthetic plan (10k servings by default, drawn from a pool of 500
+food items, across every known unit) and times calculate_nutrition in a loop against
+calculate_nutrition_many, plus the bare array pass (calculate_nutrition_batch)
+without the object-to-array conversion. Prints a JSON report of the best of
+--repeats runs. Needs no database.
+
+    python -m tests.benchmarks.bench_nutrition --items 10000 --foods 500
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+# ---------- PROJECT ROOT FIX ----------
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import numpy as np
+
+from app.core.units import (
+    UNIT_DICTIONARY,
+    FoodMacros,
+    calculate_nutrition,
+    calculate_nutrition_batch,
+    calculate_nutrition_many,
+    unit_indices,
+)
+
+
+def make_plan(n: int, pool_size: int, rng: random.Random):
+    pool = []
+    for _ in range(pool_size):
+        is_volume = rng.random() < 0.3
+        pool.append(SimpleNamespace(
+            base_unit_type="VOLUME" if is_volume else "MASS",
+            grams_per_ml=rng.uniform(0.8, 1.4) if is_volume else None,
+            calories_per_100g=rng.randint(10, 900),
+            protein_per_100g=rng.uniform(0, 40),
+            carbs_per_100g=rng.uniform(0, 80),
+            fat_per_100g=rng.uniform(0, 50),
+        ))
+    foods, sizes, units = [], [], []
+    for _ in range(n):
+        foods.append(rng.choice(pool))
+        sizes.append(rng.uniform(1, 400))
+        units.append(rng.choice(list(UNIT_DICTIONARY)))
+    return foods, sizes, units
+
+
+def best_of(repeats: int, fn) -> float:
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=10_000)
+    parser.add_argument("--foods", type=int, default=500)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    foods, sizes, units = make_plan(args.items, args.foods, random.Random(args.seed))
+    macros = FoodMacros.from_items(foods)
+    size_array = np.asarray(sizes, dtype=np.float64)
+    unit_array = unit_indices(units)
+
+    scalar = best_of(args.repeats, lambda: [calculate_nutrition(f, s, u) for f, s, u in zip(foods, sizes, units)])
+    many = best_of(args.repeats, lambda: calculate_nutrition_many(foods, sizes, units))
+    arrays = best_of(args.repeats, lambda: calculate_nutrition_batch(macros, size_array, unit_array))
+
+    print(json.dumps({
+        "items": args.items,
+        "foods": args.foods,
+        "scalar_ms": round(scalar * 1000, 3),
+        "batch_ms": round(many * 1000, 3),
+        "batch_arrays_only_ms": round(arrays * 1000, 3),
+        "speedup": round(scalar / many, 2),
+        "speedup_arrays_only": round(scalar / arrays, 2),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
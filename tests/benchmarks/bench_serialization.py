@@ -0,0 +1,162 @@
+"""
+Measures response serialization cost per 1,000 rows for the hot list endpoints.
+
+For each response model (clients, workout/diet logs, check-ins, workout/diet
+templates) it builds --rows synthetic ORM-like objects and times the default
+FastAPI path (validate through the response_model with from_attributes, then
+dump_json) against FastSerializer + orjson, checks the two outputs are byte for
+byte identical, and prints a JSON report of the best of --repeats runs,
+normalized to milliseconds per 1,000 rows. Needs no database.
+
+    python -m tests.benchmarks.bench_serialization --rows 1000 --repeats 10
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import List
+
+# ---------- PROJECT ROOT FIX ----------
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from pydantic import TypeAdapter
+
+from app.core.responses import FastSerializer, dumps
+from app.schemas.checkin import Checkin
+from app.schemas.client import Client
+from app.schemas.log import DietLog, WorkoutLog
+from app.schemas.template import DietPlanTemplate, WorkoutPlanTemplate
+
+NOW = datetime.now(timezone.utc)
+
+
+def make_client(rng: random.Random):
+    registered = rng.random() < 0.7
+    user = SimpleNamespace(
+        id=uuid.uuid4(), email=f"client{rng.randint(0, 10**9)}@example.com", full_name="Client Name",
+        user_role="client", profile_photo_url=None, created_at=NOW,
+    ) if registered else None
+    return SimpleNamespace(
+        id=uuid.uuid4(), client_status=rng.choice(["active", "invited", "paused"]), goal="General Fitness",
+        goal_description=None, trainer_user_id=uuid.uuid4(), created_at=NOW, client_user=user,
+        invited_full_name="Invited Name", invited_email="invited@example.com", invite_code="12345678",
+        subscription_due_date=NOW + timedelta(days=rng.randint(-30, 30)), subscription_paid_status=rng.random() < 0.5,
+        payment_status=None, private_notes="Prefers mornings", health_notes=None,
+    )
+
+
+def make_workout_log(rng: random.Random):
+    sets = [{"reps": rng.randint(5, 12), "weight_kg": round(rng.uniform(20, 140), 1)} for _ in range(4)]
+    return SimpleNamespace(
+        id=rng.randint(1, 10**9), client_id=uuid.uuid4(), assigned_plan_id=uuid.uuid4(),
+        performance_data={"exercise_id": str(uuid.uuid4()), "sets": sets, "notes": "Felt strong"},
+        logged_at=NOW - timedelta(minutes=rng.randint(0, 10**5)),
+    )
+
+
+def make_diet_log(rng: random.Random):
+    return SimpleNamespace(
+        id=rng.randint(1, 10**9), client_id=uuid.uuid4(), assigned_plan_id=uuid.uuid4(),
+        meal_name=rng.choice(["Breakfast", "Lunch", "Dinner"]), status=rng.choice(["Followed", "Skipped"]),
+        logged_at=NOW - timedelta(minutes=rng.randint(0, 10**5)),
+    )
+
+
+def make_checkin(rng: random.Random):
+    return SimpleNamespace(
+        id=rng.randint(1, 10**9), client_id=uuid.uuid4(), weight_kg=Decimal(f"{rng.uniform(50, 110):.2f}"),
+        measurements={"waist_cm": rng.randint(60, 110)}, progress_photo_url=None,
+        subjective_scores={"energy": rng.randint(1, 10)}, notes=None, checked_in_at=NOW,
+    )
+
+
+def make_workout_template(rng: random.Random, items: int):
+    exercise = SimpleNamespace(id=uuid.uuid4(), name="Back Squat", description=None, is_verified=True, owner_trainer_id=None)
+    return SimpleNamespace(
+        id=uuid.uuid4(), name="Strength", description=None, trainer_id=uuid.uuid4(), version=1, created_at=NOW,
+        items=[SimpleNamespace(
+            id=rng.randint(1, 10**9), day_name="Monday", display_order=i, exercise=exercise,
+            target_sets="4", target_reps="8", rest_period_seconds=90, notes=None,
+        ) for i in range(items)],
+    )
+
+
+def make_diet_template(rng: random.Random, items: int):
+    food = SimpleNamespace(
+        id=uuid.uuid4(), name="Oats", base_unit_type="MASS", grams_per_ml=None, calories_per_100g=389,
+        protein_per_100g=Decimal("16.9"), carbs_per_100g=Decimal("66.3"), fat_per_100g=Decimal("6.9"),
+        is_verified=True, owner_trainer_id=None,
+    )
+    return SimpleNamespace(
+        id=uuid.uuid4(), name="Cut", description=None, trainer_id=uuid.uuid4(), version=1, created_at=NOW,
+        items=[SimpleNamespace(
+            id=rng.randint(1, 10**9), meal_name="Breakfast", display_order=i, food_item=food,
+            serving_size=Decimal("50"), serving_unit="g", calories=Decimal("194.5"),
+            protein_g=Decimal("8.45"), carbs_g=Decimal("33.15"), fat_g=Decimal("3.45"),
+        ) for i in range(items)],
+        nutrition_totals=None,
+    )
+
+
+def best_of(repeats: int, fn) -> float:
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000)
+    parser.add_argument("--template-items", type=int, default=8, help="Items per template row")
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    cases = {
+        "clients": (Client, [make_client(rng) for _ in range(args.rows)]),
+        "workout_logs": (WorkoutLog, [make_workout_log(rng) for _ in range(args.rows)]),
+        "diet_logs": (DietLog, [make_diet_log(rng) for _ in range(args.rows)]),
+        "checkins": (Checkin, [make_checkin(rng) for _ in range(args.rows)]),
+        "workout_templates": (WorkoutPlanTemplate, [make_workout_template(rng, args.template_items) for _ in range(args.rows)]),
+        "diet_templates": (DietPlanTemplate, [make_diet_template(rng, args.template_items) for _ in range(args.rows)]),
+    }
+
+    per_thousand = 1000 / args.rows
+    report = {"rows": args.rows, "template_items": args.template_items, "models": {}}
+    for name, (model, rows) in cases.items():
+        adapter = TypeAdapter(List[model])
+        serializer = FastSerializer(model)
+
+        def default_path():
+            return adapter.dump_json(adapter.validate_python(rows, from_attributes=True), by_alias=True)
+
+        def fast_path():
+            return dumps(serializer.dump(rows))
+
+        before = best_of(args.repeats, default_path)
+        after = best_of(args.repeats, fast_path)
+        report["models"][name] = {
+            "default_ms_per_1k": round(before * 1000 * per_thousand, 3),
+            "fast_ms_per_1k": round(after * 1000 * per_thousand, 3),
+            "speedup": round(before / after, 2),
+            "identical": default_path() == fast_path(),
+        }
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Measures diet and workout template create/update cost as templates grow.
+
+For each size (10, 100, 500 items by default) it creates and then updates a
+diet template and a workout template through TemplateService, using the
+library items visible to a seeded trainer. It reports the wall time and the
+number of SQL statements each operation sent. With bulk resolution and
+multi-row inserts, the statement count should stay flat as the size grows.
+The generated templates are deleted at the end.
+
+    python -m tests.benchmarks.bench_template_writes --sizes 10 100 500
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import uuid
+
+# ---------- PROJECT ROOT FIX ----------
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from sqlalchemy import delete, event, or_, select
+
+from app.core.database import SessionLocal, engine
+import app.main  # noqa: F401  (registers every mapper)
+from app.models.user import User
+from app.models.template import DietPlanTemplate, ExerciseLibrary, FoodItemLibrary, WorkoutPlanTemplate
+from app.schemas.template import (
+    DietPlanTemplateCreate,
+    DietPlanTemplateUpdate,
+    DietTemplateItemCreate,
+    Serving,
+    WorkoutPlanTemplateCreate,
+    WorkoutPlanTemplateUpdate,
+    WorkoutTemplateItemCreate,
+)
+from app.services.template_service import template_service
+
+NAME_PREFIX = "bench template"
+MEALS = ["Breakfast", "Lunch", "Dinner", "Snack"]
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+
+class StatementCounter:
+    def __init__(self):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args):
+        self.count += 1
+
+
+def pick_trainer_id(db) -> uuid.UUID:
+    trainer_id = db.query(User.id).filter(User.user_role == "trainer", User.deleted_at.is_(None)).limit(1).scalar()
+    if not trainer_id:
+        raise SystemExit("No trainer found. Seed the database first.")
+    return trainer_id
+
+
+def library_ids(db, model, trainer_id: uuid.UUID, **filters) -> list:
+    ids = db.execute(
+        select(model.id)
+        .where(or_(model.is_verified == True, model.owner_trainer_id == trainer_id), model.deleted_at.is_(None))
+        .filter_by(**filters)
+        .limit(200)
+    ).scalars().all()
+    if not ids:
+        raise SystemExit(f"No usable {model.__tablename__} rows. Seed the database first.")
+    return ids
+
+
+def measure(counter: StatementCounter, fn):
+    before = counter.count
+    started = time.perf_counter()
+    result = fn()
+    return result, {"ms": round((time.perf_counter() - started) * 1000, 2), "statements": counter.count - before}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 500])
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    counter = StatementCounter()
+    trainer_id = pick_trainer_id(db)
+    food_ids = library_ids(db, FoodItemLibrary, trainer_id, base_unit_type="MASS")
+    exercise_ids = library_ids(db, ExerciseLibrary, trainer_id)
+    report = {}
+    try:
+        for size in args.sizes:
+            diet_items = [
+                DietTemplateItemCreate(
+                    food_item_id=food_ids[i % len(food_ids)],
+                    meal_name=MEALS[i % len(MEALS)],
+                    serving=Serving(size=50 + i % 200, unit="g"),
+                    display_order=i,
+                )
+                for i in range(size)
+            ]
+            workout_items = [
+                WorkoutTemplateItemCreate(
+                    exercise_id=exercise_ids[i % len(exercise_ids)],
+                    day_name=DAYS[i % len(DAYS)],
+                    target_sets="3",
+                    target_reps="10",
+                    display_order=i,
+                )
+                for i in range(size)
+            ]
+            name = f"{NAME_PREFIX} {size}"
+
+            diet, diet_create = measure(counter, lambda: template_service.create_diet_template(
+                db, obj_in=DietPlanTemplateCreate(name=name, items=diet_items), trainer_id=trainer_id))
+            _, diet_update = measure(counter, lambda: template_service.update_diet_template(
+                db, template=diet, obj_in=DietPlanTemplateUpdate(name=name, items=diet_items)))
+            workout, workout_create = measure(counter, lambda: template_service.create_workout_template(
+                db, obj_in=WorkoutPlanTemplateCreate(name=name, items=workout_items), trainer_id=trainer_id))
+            _, workout_update = measure(counter, lambda: template_service.update_workout_template(
+                db, template=workout, obj_in=WorkoutPlanTemplateUpdate(name=name, items=workout_items)))
+
+            report[str(size)] = {
+                "diet_create": diet_create,
+                "diet_update": diet_update,
+                "workout_create": workout_create,
+                "workout_update": workout_update,
+            }
+    finally:
+        db.rollback()
+        for model in (DietPlanTemplate, WorkoutPlanTemplate):
+            db.execute(delete(model).where(model.trainer_id == trainer_id, model.name.like(f"{NAME_PREFIX} %")))
+        db.commit()
+        db.close()
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Measures the per-request cost of access token verification with and without the
+verified-token cache.
+
+"before" runs the full python-jose decode (HMAC check plus claim validation) on
+every call, as get_current_user did for each request; "after" runs
+deps.verify_access_token, which decodes a token once per worker and then serves
+its claims from the cache (hash lookup plus the revocation check). --tokens
+distinct tokens are cycled to mimic several chatty clients. Prints a JSON report
+of the best of --repeats runs in microseconds per call. Needs no database.
+
+    python -m tests.benchmarks.bench_token_cache --calls 20000 --tokens 50
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+# ---------- PROJECT ROOT FIX ----------
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from app.api.deps import verify_access_token
+from app.cache import auth_cache
+from app.core import security
+
+
+def best_of(repeats: int, fn) -> float:
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=20_000)
+    parser.add_argument("--tokens", type=int, default=50, help="Distinct tokens cycled through")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    tokens = [security.create_access_token(f"user{i}@example.com") for i in range(args.tokens)]
+    sequence = [tokens[i % len(tokens)] for i in range(args.calls)]
+
+    def before():
+        for token in sequence:
+            security.decode_access_token(token)
+
+    def after():
+        for token in sequence:
+            verify_access_token(token)
+
+    auth_cache.token_cache.clear()
+    after()  # warm: one decode per token
+    before_s = best_of(args.repeats, before)
+    after_s = best_of(args.repeats, after)
+
+    per_call = 1_000_000 / args.calls
+    print(json.dumps({
+        "calls": args.calls,
+        "tokens": args.tokens,
+        "before_us_per_call": round(before_s * per_call, 2),
+        "after_us_per_call": round(after_s * per_call, 2),
+        "speedup": round(before_s / after_s, 1),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
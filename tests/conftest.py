@@ -12,6 +12,10 @@ from sqlalchemy.pool import NullPool
 
 # Disable Redis-backed auth caching during tests (no REDIS_URL required).
 os.environ.setdefault("DISABLE_AUTH_CACHE", "1")
+# No LISTEN thread against the app database; stream tests publish to the broker directly.
+os.environ.setdefault("ACTIVITY_STREAM_ENABLED", "0")
+# Hash inline: each TestClient lifespan would otherwise spawn a fresh bcrypt pool.
+os.environ.setdefault("PASSWORD_HASH_WORKERS", "0")
 
 from app.main import app
 from app.core.database import Base, get_db
@@ -32,6 +32,9 @@ from app.models.template import (
 from app.models.plan import AssignedWorkoutPlan, AssignedDietPlan
 from app.models.log import Checkin, WorkoutLog, DietLog
 from app.models.activity import ActivityFeed
+from app.services.checkin_service import checkin_service
+from app.services.streak_service import streak_service
+from app.services.trainer_service import trainer_service
 
 fake = Faker()
 fake_us = Faker("en_US")
@@ -365,6 +368,13 @@ def seed(scale: int):
 
             db.commit()
 
+        # Logs are bulk-copied above, so derive streak state from them in one pass.
+        streak_service.rebuild(db)
+        # Same for the per-trainer client counts.
+        trainer_service.reconcile_stats(db)
+        # And for the check-in rollups behind /checkins/series.
+        checkin_service.rebuild_rollups(db)
+
         print(f"\nSeeded DB with {scale} trainers")
 
     finally:
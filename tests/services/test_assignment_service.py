@@ -19,7 +19,7 @@ from app.schemas.template import (
 from app.models.user import User
 from app.models.client import Client
 from app.models.template import ExerciseLibrary, FoodItemLibrary
-from app.models.plan import AssignedWorkoutPlan
+from app.models.plan import AssignedWorkoutPlan, PlanSnapshot
 
 
 class TestWorkoutPlanAssignment:
@@ -239,6 +239,68 @@ class TestDietPlanAssignment:
         assert snapshot_item["calculatedNutrition"]["calories"] > 0
 
 
+class TestSnapshotDeduplication:
+    """Tests for content-addressed plan snapshots."""
+
+    def _template(self, test_db: Session, trainer: User, exercise: ExerciseLibrary):
+        return template_service.create_workout_template(
+            db=test_db,
+            obj_in=WorkoutPlanTemplateCreate(
+                name="Shared Program",
+                items=[WorkoutTemplateItemCreate(exercise_id=exercise.id, day_name="Monday", target_sets="3", target_reps="10", display_order=1)],
+            ),
+            trainer_id=trainer.id,
+        )
+
+    def _assign(self, test_db: Session, trainer: User, client: Client, template):
+        return assigned_plan_service.assign_workout_plan(
+            db=test_db,
+            assignment_in=WorkoutPlanAssign(client_id=client.id, source_template_id=template.id),
+            trainer_id=trainer.id,
+        )
+
+    def test_same_template_version_shares_one_snapshot(self, test_db: Session, test_trainer: User, test_client_profile: Client, test_exercise: ExerciseLibrary, monkeypatch):
+        """Repeat assignments of an unchanged template should reuse the stored snapshot without rebuilding it."""
+        template = self._template(test_db, test_trainer, test_exercise)
+        first = self._assign(test_db, test_trainer, test_client_profile, template)
+
+        def fail(**kwargs):
+            raise AssertionError("snapshot rebuilt")
+        monkeypatch.setattr(template_service, "create_workout_plan_snapshot", fail)
+        second = self._assign(test_db, test_trainer, test_client_profile, template)
+
+        assert second.snapshot_hash == first.snapshot_hash
+        assert second.plan_details == first.plan_details
+        assert test_db.query(PlanSnapshot).filter(PlanSnapshot.content_hash == first.snapshot_hash).count() == 1
+
+    def test_template_edit_produces_new_snapshot(self, test_db: Session, test_trainer: User, test_client_profile: Client, test_exercise: ExerciseLibrary):
+        """Editing the template should give later assignments a new snapshot and leave earlier ones alone."""
+        from app.schemas.template import WorkoutPlanTemplatePatch
+
+        template = self._template(test_db, test_trainer, test_exercise)
+        first = self._assign(test_db, test_trainer, test_client_profile, template)
+        template_service.patch_workout_template(db=test_db, template=template, obj_in=WorkoutPlanTemplatePatch(name="Renamed Program"))
+        second = self._assign(test_db, test_trainer, test_client_profile, template)
+
+        assert second.snapshot_hash != first.snapshot_hash
+        assert second.plan_details["name"] == "Renamed Program"
+        test_db.refresh(first)
+        assert first.plan_details["name"] == "Shared Program"
+
+    def test_library_edit_produces_new_snapshot(self, test_db: Session, test_trainer: User, test_client_profile: Client, test_exercise: ExerciseLibrary):
+        """Renaming an embedded exercise should invalidate snapshot reuse for the template."""
+        from app.services.library_service import library_service
+        from app.schemas.library import LibraryExerciseUpdate
+
+        template = self._template(test_db, test_trainer, test_exercise)
+        first = self._assign(test_db, test_trainer, test_client_profile, template)
+        library_service.update_exercise(test_db, exercise=test_exercise, obj_in=LibraryExerciseUpdate(name="Incline Bench Press"))
+        second = self._assign(test_db, test_trainer, test_client_profile, template)
+
+        assert second.snapshot_hash != first.snapshot_hash
+        assert second.plan_details["items"][0]["exercise"]["name"] == "Incline Bench Press"
+
+
 class TestAssignmentOwnership:
     """Tests for ownership enforcement in assignments."""
     
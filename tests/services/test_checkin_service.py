@@ -2,6 +2,8 @@
 # Service layer tests for check-in business logic.
 
 import pytest
+from decimal import Decimal
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 
@@ -10,6 +12,7 @@ from app.schemas.checkin import CheckinCreate
 from app.models.user import User
 from app.models.client import Client
 from app.models.activity import ActivityFeed
+from app.models.checkin_rollup import CheckinRollup
 from app.domain.errors import InvalidClientState
 
 
@@ -76,6 +79,38 @@ class TestCheckinCreation:
         assert "weight" not in activity.event_metadata
 
 
+class TestCheckinRollupRebuild:
+    """Tests for rebuilding the series rollups from stored check-ins."""
+
+    def _rollups(self, test_db: Session, client_id) -> list:
+        return test_db.execute(
+            select(
+                CheckinRollup.granularity, CheckinRollup.metric, CheckinRollup.bucket_start,
+                CheckinRollup.sample_count, CheckinRollup.value_sum, CheckinRollup.value_min,
+                CheckinRollup.value_max, CheckinRollup.last_value,
+            )
+            .where(CheckinRollup.client_id == client_id)
+            .order_by(CheckinRollup.granularity, CheckinRollup.metric, CheckinRollup.bucket_start)
+        ).all()
+
+    def test_rebuild_matches_live_rollups(self, test_db: Session, test_client_user: User, test_client_profile: Client):
+        """Rebuilt rows equal the ones written on submit, including the stored weight rounding."""
+        for weight in ("72.345", "71.5"):
+            checkin_service.create_checkin(
+                db=test_db,
+                obj_in=CheckinCreate(weight_kg=Decimal(weight), measurements={"waist_cm": 80}),
+                current_client=test_client_user,
+            )
+        live = self._rollups(test_db, test_client_profile.id)
+        assert Decimal("72.35") in {row.value_max for row in live if row.metric == "weight_kg"}
+
+        test_db.execute(delete(CheckinRollup))
+        rebuilt = checkin_service.rebuild_rollups(test_db, client_id=test_client_profile.id)
+
+        assert rebuilt == len(live) == 6
+        assert self._rollups(test_db, test_client_profile.id) == live
+
+
 class TestCheckinPermissions:
     """Tests for check-in permission enforcement."""
     
@@ -0,0 +1,105 @@
+# tests/services/test_streak_service.py
+# Service layer tests for the persisted client streak state.
+
+from datetime import date, datetime, timedelta, timezone
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.domain import streaks
+
+from app.services.streak_service import streak_service
+from app.services.log_service import log_service
+from app.schemas.log import DietLogCreate
+from app.models.user import User
+from app.models.client import Client
+from app.models.log import DietLog
+from app.models.plan import AssignedDietPlan
+from app.models.streak import ClientStreak
+
+
+def _assign_diet_plan(test_db: Session, client_profile: Client) -> AssignedDietPlan:
+    plan = AssignedDietPlan(client_id=client_profile.id, plan_details={"name": "Plan", "meals": []})
+    test_db.add(plan)
+    test_db.commit()
+    test_db.refresh(plan)
+    return plan
+
+
+class TestIncrementalStreak:
+    """Tests for streak maintenance on log creation."""
+
+    def test_diet_log_starts_streak(self, test_db: Session, test_client_user: User, test_client_profile: Client):
+        """Creating a log should create the streak row for today."""
+        plan = _assign_diet_plan(test_db, test_client_profile)
+
+        log_service.create_diet_log(
+            db=test_db,
+            obj_in=DietLogCreate(assigned_plan_id=plan.id, meal_name="Breakfast", status="Followed"),
+            current_client=test_client_user,
+        )
+
+        streak = test_db.query(ClientStreak).filter(ClientStreak.client_id == test_client_profile.id).one()
+        assert streak.current_streak_days == 1
+        assert streak.last_active_date == streaks.today()
+        assert streak_service.get_current_streak_days(test_db, client_id=test_client_profile.id, today=streaks.today()) == 1
+
+    def test_multiple_logs_same_day_count_once(self, test_db: Session, test_client_user: User, test_client_profile: Client):
+        """Several logs on one day should not inflate the streak."""
+        plan = _assign_diet_plan(test_db, test_client_profile)
+
+        for meal in ["Breakfast", "Lunch", "Dinner"]:
+            log_service.create_diet_log(
+                db=test_db,
+                obj_in=DietLogCreate(assigned_plan_id=plan.id, meal_name=meal, status="Followed"),
+                current_client=test_client_user,
+            )
+
+        state = streak_service.get_streak(test_db, client_id=test_client_profile.id)
+        assert state.current_streak_days == 1
+        assert state.longest_streak_days == 1
+
+    def test_client_without_logs_has_no_streak(self, test_db: Session, test_client_profile: Client):
+        assert streak_service.get_current_streak_days(test_db, client_id=test_client_profile.id, today=streaks.today()) == 0
+
+
+class TestStreakRebuild:
+    """Tests for recomputing streaks from log history."""
+
+    def test_rebuild_from_history(self, test_db: Session, test_client_profile: Client):
+        """Rebuild should derive current and longest streaks from past logs."""
+        plan = _assign_diet_plan(test_db, test_client_profile)
+        now = datetime.now(timezone.utc)
+        for days_ago in (0, 1, 4, 5, 6):
+            test_db.add(DietLog(
+                client_id=test_client_profile.id,
+                assigned_plan_id=plan.id,
+                meal_name="Lunch",
+                status="Followed",
+                logged_at=now - timedelta(days=days_ago),
+            ))
+        test_db.commit()
+
+        rebuilt = streak_service.rebuild(test_db, client_id=test_client_profile.id)
+
+        assert rebuilt == 1
+        state = streak_service.get_streak(test_db, client_id=test_client_profile.id)
+        assert state.current_streak_days == 2
+        assert state.longest_streak_days == 3
+
+    def test_rebuild_uses_utc_days(self, test_db: Session, test_client_profile: Client):
+        """Days are UTC dates whatever the session time zone, as on the live path."""
+        plan = _assign_diet_plan(test_db, test_client_profile)
+        test_db.execute(text("SET TIME ZONE 'Pacific/Kiritimati'"))  # UTC+14
+        test_db.add(DietLog(
+            client_id=test_client_profile.id,
+            assigned_plan_id=plan.id,
+            meal_name="Dinner",
+            status="Followed",
+            logged_at=datetime(2026, 3, 18, 23, 30, tzinfo=timezone.utc),
+        ))
+        test_db.commit()
+
+        streak_service.rebuild(test_db, client_id=test_client_profile.id)
+
+        state = streak_service.get_streak(test_db, client_id=test_client_profile.id)
+        assert state.last_active_date == date(2026, 3, 18)
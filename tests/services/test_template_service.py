@@ -3,20 +3,24 @@
 
 import pytest
 import uuid
+from datetime import datetime, timezone
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from app.services.template_service import template_service
 from app.schemas.template import (
     WorkoutPlanTemplateCreate,
     WorkoutPlanTemplateUpdate,
+    WorkoutPlanTemplatePatch,
     WorkoutTemplateItemCreate,
     DietPlanTemplateCreate,
+    DietPlanTemplatePatch,
     DietTemplateItemCreate,
     DietTemplateItemGet,
     Serving,
 )
 from app.models.user import User
-from app.models.template import ExerciseLibrary, FoodItemLibrary, WorkoutPlanTemplate
+from app.models.template import DietPlanTemplate, ExerciseLibrary, FoodItemLibrary, WorkoutPlanTemplate
 
 
 class TestWorkoutTemplateCreation:
@@ -128,7 +132,7 @@ class TestWorkoutTemplateVersioning:
         )
         
         assert updated_template.name == "Updated"
-        assert updated_template.version == original_version  # Version field exists but update logic may vary
+        assert updated_template.version == original_version + 1
 
 
 class TestDietTemplateCreation:
@@ -188,6 +192,253 @@ class TestDietTemplateCreation:
         assert schema_item.calculated_nutrition.protein_g == 31.0
 
 
+class TestStoredDietNutrition:
+    """Tests for nutrition persisted at write time."""
+
+    def _create(self, test_db: Session, trainer: User, food_item: FoodItemLibrary):
+        return template_service.create_diet_template(
+            db=test_db,
+            obj_in=DietPlanTemplateCreate(
+                name="Meal Plan",
+                items=[
+                    DietTemplateItemCreate(food_item_id=food_item.id, meal_name="Lunch", serving=Serving(size=200, unit="g")),
+                    DietTemplateItemCreate(food_item_id=food_item.id, meal_name="Dinner", serving=Serving(size=100, unit="g")),
+                    DietTemplateItemCreate(food_item_id=food_item.id, meal_name="Lunch", serving=Serving(size=50, unit="g")),
+                ],
+            ),
+            trainer_id=trainer.id,
+        )
+
+    def test_items_and_totals_are_persisted(self, test_db: Session, test_trainer: User, test_food_item: FoodItemLibrary):
+        """Item nutrition and meal/plan totals should be stored on create."""
+        template = self._create(test_db, test_trainer, test_food_item)
+
+        assert sorted(item.calories for item in template.items) == [82.5, 165.0, 330.0]
+        totals = template.nutrition_totals
+        assert [meal["meal_name"] for meal in totals["meals"]] == ["Lunch", "Dinner"]
+        assert totals["meals"][0]["calories"] == pytest.approx(412.5)
+        assert totals["total"]["calories"] == pytest.approx(577.5)
+        assert totals["total"]["protein_g"] == pytest.approx(108.5)
+
+    def test_food_item_change_refreshes_templates(self, test_db: Session, test_trainer: User, test_food_item: FoodItemLibrary):
+        """Updating a food item's macros should refresh stored item nutrition and totals."""
+        from app.services.library_service import library_service
+        from app.schemas.library import LibraryFoodItemUpdate
+
+        template = self._create(test_db, test_trainer, test_food_item)
+        library_service.update_food_item(
+            test_db,
+            food_item=test_food_item,
+            obj_in=LibraryFoodItemUpdate(name=test_food_item.name, calories_per_100g=200),
+        )
+
+        test_db.refresh(template)
+        assert sorted(item.calories for item in template.items) == [100.0, 200.0, 400.0]
+        assert template.nutrition_totals["total"]["calories"] == pytest.approx(700.0)
+
+    def test_food_item_change_keeps_template_order(self, test_db: Session, test_trainer: User, test_food_item: FoodItemLibrary):
+        """A macro edit refreshes the totals without bumping updated_at, so template lists keep their order."""
+        from app.services.library_service import library_service
+        from app.schemas.library import LibraryFoodItemUpdate
+
+        template = self._create(test_db, test_trainer, test_food_item)
+        # now() is fixed within the test transaction, so start from an earlier timestamp.
+        earlier = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        test_db.execute(update(DietPlanTemplate).where(DietPlanTemplate.id == template.id).values(updated_at=earlier))
+        library_service.update_food_item(
+            test_db,
+            food_item=test_food_item,
+            obj_in=LibraryFoodItemUpdate(name=test_food_item.name, protein_per_100g=30),
+        )
+
+        test_db.refresh(template)
+        assert template.updated_at == earlier
+        assert template.nutrition_totals["total"]["protein_g"] == pytest.approx(105.0)
+
+    def test_invalid_unit_is_rejected_at_write_time(self, test_db: Session, test_trainer: User, test_food_item: FoodItemLibrary):
+        """Unknown serving units should fail when the template is saved."""
+        from fastapi import HTTPException
+
+        with pytest.raises(HTTPException) as exc:
+            template_service.create_diet_template(
+                db=test_db,
+                obj_in=DietPlanTemplateCreate(
+                    name="Bad Plan",
+                    items=[DietTemplateItemCreate(food_item_id=test_food_item.id, meal_name="Lunch", serving=Serving(size=1, unit="bucket"))],
+                ),
+                trainer_id=test_trainer.id,
+            )
+        assert exc.value.status_code == 400
+
+
+class TestLibraryItemResolution:
+    """Tests for resolving referenced library items in bulk."""
+
+    def _private_food(self, test_db: Session, owner: User) -> FoodItemLibrary:
+        food = FoodItemLibrary(name="Secret Sauce", owner_trainer_id=owner.id, is_verified=False, base_unit_type="MASS", calories_per_100g=300)
+        test_db.add(food)
+        test_db.commit()
+        return food
+
+    def _diet(self, *food_ids):
+        return DietPlanTemplateCreate(
+            name="Plan",
+            items=[DietTemplateItemCreate(food_item_id=food_id, meal_name="Lunch", serving=Serving(size=100, unit="g")) for food_id in food_ids],
+        )
+
+    def test_missing_food_items_are_all_reported(self, test_db: Session, test_trainer: User, test_food_item: FoodItemLibrary):
+        """A single 404 should list every unknown food item id."""
+        from fastapi import HTTPException
+
+        missing = [uuid.uuid4(), uuid.uuid4()]
+        with pytest.raises(HTTPException) as exc:
+            template_service.create_diet_template(db=test_db, obj_in=self._diet(test_food_item.id, *missing), trainer_id=test_trainer.id)
+        assert exc.value.status_code == 404
+        assert all(str(food_id) in exc.value.detail for food_id in missing)
+        assert str(test_food_item.id) not in exc.value.detail
+
+    def test_other_trainers_private_food_item_is_rejected(self, test_db: Session, test_trainer: User, trainer_user: User):
+        """Unverified food items owned by another trainer should not be usable."""
+        from fastapi import HTTPException
+
+        food = self._private_food(test_db, trainer_user)
+        with pytest.raises(HTTPException) as exc:
+            template_service.create_diet_template(db=test_db, obj_in=self._diet(food.id), trainer_id=test_trainer.id)
+        assert exc.value.status_code == 404
+
+    def test_own_private_food_item_is_used_for_repeated_items(self, test_db: Session, test_trainer: User):
+        """The trainer's own food items should resolve once and apply to every item using them."""
+        food = self._private_food(test_db, test_trainer)
+        template = template_service.create_diet_template(db=test_db, obj_in=self._diet(food.id, food.id, food.id), trainer_id=test_trainer.id)
+        assert [item.calories for item in template.items] == [300.0, 300.0, 300.0]
+
+    def test_missing_exercise_is_reported(self, test_db: Session, test_trainer: User):
+        """Workout templates should reject unknown exercise ids with a 404."""
+        from fastapi import HTTPException
+
+        missing = uuid.uuid4()
+        with pytest.raises(HTTPException) as exc:
+            template_service.create_workout_template(
+                db=test_db,
+                obj_in=WorkoutPlanTemplateCreate(
+                    name="Plan",
+                    items=[WorkoutTemplateItemCreate(exercise_id=missing, day_name="Monday", display_order=1)],
+                ),
+                trainer_id=test_trainer.id,
+            )
+        assert exc.value.status_code == 404
+        assert str(missing) in exc.value.detail
+
+
+class TestTemplateItemDiff:
+    """Tests for item-level diffs on template updates."""
+
+    def _workout(self, test_db: Session, trainer: User, exercise: ExerciseLibrary):
+        return template_service.create_workout_template(
+            db=test_db,
+            obj_in=WorkoutPlanTemplateCreate(
+                name="Split",
+                items=[
+                    WorkoutTemplateItemCreate(exercise_id=exercise.id, day_name="Monday", target_sets="3", target_reps="10", display_order=1),
+                    WorkoutTemplateItemCreate(exercise_id=exercise.id, day_name="Wednesday", target_sets="3", target_reps="8", display_order=2),
+                ],
+            ),
+            trainer_id=trainer.id,
+        )
+
+    def _echo(self, item, **changes):
+        values = dict(item_id=item.id, exercise_id=item.exercise_id, day_name=item.day_name, target_sets=item.target_sets,
+                      target_reps=item.target_reps, display_order=item.display_order)
+        return WorkoutTemplateItemCreate(**{**values, **changes})
+
+    def test_update_keeps_matched_items_in_place(self, test_db: Session, test_trainer: User, test_exercise: ExerciseLibrary):
+        """Items sent back with their id should be updated, not re-created; missing ones are removed."""
+        template = self._workout(test_db, test_trainer, test_exercise)
+        monday, wednesday = sorted(template.items, key=lambda item: item.display_order)
+
+        updated = template_service.update_workout_template(
+            db=test_db,
+            template=template,
+            obj_in=WorkoutPlanTemplateUpdate(name="Split", items=[self._echo(monday, target_reps="12")]),
+        )
+
+        assert [(item.id, item.target_reps) for item in updated.items] == [(monday.id, "12")]
+        assert updated.version == 2
+
+    def test_unchanged_save_keeps_version(self, test_db: Session, test_trainer: User, test_exercise: ExerciseLibrary):
+        """Saving identical content should not touch the items or the version."""
+        template = self._workout(test_db, test_trainer, test_exercise)
+        ids = sorted(item.id for item in template.items)
+
+        updated = template_service.update_workout_template(
+            db=test_db,
+            template=template,
+            obj_in=WorkoutPlanTemplateUpdate(name="Split", items=[self._echo(item) for item in template.items]),
+        )
+
+        assert sorted(item.id for item in updated.items) == ids
+        assert updated.version == 1
+
+    def test_patch_applies_only_listed_changes(self, test_db: Session, test_trainer: User, test_exercise: ExerciseLibrary):
+        """PATCH should update, insert and delete exactly the items it lists."""
+        template = self._workout(test_db, test_trainer, test_exercise)
+        monday, wednesday = sorted(template.items, key=lambda item: item.display_order)
+
+        patched = template_service.patch_workout_template(
+            db=test_db,
+            template=template,
+            obj_in=WorkoutPlanTemplatePatch(
+                items=[
+                    self._echo(monday, target_sets="5"),
+                    WorkoutTemplateItemCreate(exercise_id=test_exercise.id, day_name="Friday", target_sets="2", target_reps="15", display_order=3),
+                ],
+                deleted_item_ids=[wednesday.id],
+            ),
+        )
+
+        items = sorted(patched.items, key=lambda item: item.display_order)
+        assert [(item.day_name, item.target_sets) for item in items] == [("Monday", "5"), ("Friday", "2")]
+        assert items[0].id == monday.id
+        assert patched.name == "Split"
+        assert patched.version == 2
+
+    def test_unknown_item_id_is_rejected(self, test_db: Session, test_trainer: User, test_exercise: ExerciseLibrary):
+        """Item ids that don't belong to the template should give a 404."""
+        from fastapi import HTTPException
+
+        template = self._workout(test_db, test_trainer, test_exercise)
+        with pytest.raises(HTTPException) as exc:
+            template_service.patch_workout_template(db=test_db, template=template, obj_in=WorkoutPlanTemplatePatch(deleted_item_ids=[-1]))
+        assert exc.value.status_code == 404
+
+    def test_diet_patch_recomputes_totals(self, test_db: Session, test_trainer: User, test_food_item: FoodItemLibrary):
+        """Changing a diet item's serving should refresh its nutrition and the plan totals."""
+        template = template_service.create_diet_template(
+            db=test_db,
+            obj_in=DietPlanTemplateCreate(
+                name="Meals",
+                items=[
+                    DietTemplateItemCreate(food_item_id=test_food_item.id, meal_name="Lunch", serving=Serving(size=100, unit="g")),
+                    DietTemplateItemCreate(food_item_id=test_food_item.id, meal_name="Dinner", serving=Serving(size=100, unit="g")),
+                ],
+            ),
+            trainer_id=test_trainer.id,
+        )
+        lunch = next(item for item in template.items if item.meal_name == "Lunch")
+
+        patched = template_service.patch_diet_template(
+            db=test_db,
+            template=template,
+            obj_in=DietPlanTemplatePatch(items=[
+                DietTemplateItemCreate(item_id=lunch.id, food_item_id=test_food_item.id, meal_name="Lunch", serving=Serving(size=200, unit="g")),
+            ]),
+        )
+
+        assert sorted(item.calories for item in patched.items) == [165.0, 330.0]
+        assert patched.nutrition_totals["total"]["calories"] == pytest.approx(495.0)
+        assert patched.version == 2
+
+
 class TestTemplateRetrieval:
     """Tests for retrieving templates."""
     
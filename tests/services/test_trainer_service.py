@@ -0,0 +1,96 @@
+# tests/services/test_trainer_service.py
+# Service layer tests for the materialized trainer stats.
+
+from datetime import date
+from dateutil.relativedelta import relativedelta
+from sqlalchemy.orm import Session
+
+from app.services.trainer_service import trainer_service
+from app.services.client_service import client_service
+from app.schemas.client import ClientInvite
+from app.models.user import User
+from app.models.client import Client
+from app.models.trainer_stats import TrainerStats
+
+
+def _invite_and_activate(test_db: Session, trainer: User, email: str) -> Client:
+    client = client_service.create_client_invite(
+        db=test_db,
+        obj_in=ClientInvite(email=email, full_name="Client", goal="Weight Loss"),
+        trainer_id=trainer.id,
+    )
+    return client_service.update_client_status(test_db, client, "active")
+
+
+class TestTrainerStatsMaintenance:
+    """Tests for keeping trainer_stats in step with client transitions."""
+
+    def test_no_stats_row_reads_as_zero(self, test_db: Session, test_trainer: User):
+        """A trainer without a stats row should get empty stats."""
+        stats = trainer_service.get_trainer_stats(test_db, trainer_id=test_trainer.id)
+        assert stats == {"active_clients": 0, "growth_percentage": 0.0}
+
+    def test_activation_increments_active_clients(self, test_db: Session, test_trainer: User):
+        """Activating invited clients should be counted without a recount."""
+        _invite_and_activate(test_db, test_trainer, "one@test.com")
+        _invite_and_activate(test_db, test_trainer, "two@test.com")
+
+        stats = trainer_service.get_trainer_stats(test_db, trainer_id=test_trainer.id)
+        assert stats["active_clients"] == 2
+
+    def test_pausing_decrements_active_clients(self, test_db: Session, test_trainer: User):
+        """Leaving the active state should be subtracted."""
+        client = _invite_and_activate(test_db, test_trainer, "one@test.com")
+        client_service.update_client_status(test_db, client, "paused")
+
+        stats = trainer_service.get_trainer_stats(test_db, trainer_id=test_trainer.id)
+        assert stats["active_clients"] == 0
+
+    def test_growth_against_month_start_snapshot(self, test_db: Session, test_trainer: User):
+        """Growth should compare against the count at the start of the month."""
+        _invite_and_activate(test_db, test_trainer, "one@test.com")
+        _invite_and_activate(test_db, test_trainer, "two@test.com")
+        row = test_db.get(TrainerStats, test_trainer.id)
+        row.active_at_month_start = 1
+        test_db.commit()
+
+        stats = trainer_service.get_trainer_stats(test_db, trainer_id=test_trainer.id)
+        assert stats == {"active_clients": 2, "growth_percentage": 100.0}
+
+    def test_first_change_in_a_new_month_rolls_snapshot(self, test_db: Session, test_trainer: User):
+        """A row last touched in an earlier month should snapshot its count before applying the change."""
+        _invite_and_activate(test_db, test_trainer, "one@test.com")
+        row = test_db.get(TrainerStats, test_trainer.id)
+        row.snapshot_month = date.today().replace(day=1) - relativedelta(months=1)
+        row.active_at_month_start = 0
+        test_db.commit()
+
+        _invite_and_activate(test_db, test_trainer, "two@test.com")
+
+        test_db.refresh(row)
+        assert row.active_at_month_start == 1
+        assert row.active_clients == 2
+        assert row.snapshot_month == date.today().replace(day=1)
+
+
+class TestTrainerStatsReconciliation:
+    """Tests for the drift-correcting recount."""
+
+    def test_reconcile_counts_existing_clients(self, test_db: Session, test_trainer: User, test_client_profile: Client):
+        """Clients created outside the transition paths should be picked up."""
+        trainer_service.reconcile_stats(test_db, trainer_id=test_trainer.id)
+
+        stats = trainer_service.get_trainer_stats(test_db, trainer_id=test_trainer.id)
+        assert stats["active_clients"] == 1
+
+    def test_reconcile_corrects_drift(self, test_db: Session, test_trainer: User):
+        """A drifted counter should be reset to the real count."""
+        _invite_and_activate(test_db, test_trainer, "one@test.com")
+        row = test_db.get(TrainerStats, test_trainer.id)
+        row.active_clients = 7
+        test_db.commit()
+
+        trainer_service.reconcile_stats(test_db)
+
+        test_db.refresh(row)
+        assert row.active_clients == 1
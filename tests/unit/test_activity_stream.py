@@ -0,0 +1,119 @@
+# tests/unit/test_activity_stream.py
+# Unit tests for the live activity broker and its NOTIFY payloads.
+
+import asyncio
+import json
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from app.services import activity_stream_service as stream
+from app.services.activity_stream_service import RESYNC, ActivityStreamService, format_sse
+
+NOW = datetime(2026, 5, 1, 8, 0, tzinfo=timezone.utc)
+
+
+class RecordingSession:
+    def __init__(self):
+        self.calls = []
+
+    def execute(self, statement, params):
+        self.calls.append((str(statement), params))
+
+
+def make_event(event_id: int, client_id: uuid.UUID, **overrides):
+    values = dict(id=event_id, client_id=client_id, event_type="WORKOUT_LOGGED", event_timestamp=NOW, event_metadata={"n": event_id})
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def notified_payloads(service: ActivityStreamService, trainer_id: uuid.UUID, events) -> list:
+    db = RecordingSession()
+    service.notify(db, trainer_id=trainer_id, events=events)
+    return db.calls[0][1]["payloads"] if db.calls else []
+
+
+class TestActivityStreamService:
+    """Tests for routing NOTIFY payloads to the right trainer's streams."""
+
+    def test_notify_batches_one_statement(self):
+        """ORM objects and insert dicts alike become one pg_notify call carrying every event."""
+        trainer_id, client_id = uuid.uuid4(), uuid.uuid4()
+        events = [make_event(1, client_id), {**vars(make_event(2, client_id)), "event_type": "DIET_LOGGED"}]
+        payloads = notified_payloads(ActivityStreamService(), trainer_id, events)
+
+        assert [json.loads(p)["id"] for p in payloads] == [1, 2]
+        assert json.loads(payloads[1]) == {
+            "trainer_id": str(trainer_id), "id": 2, "client_id": str(client_id), "event_type": "DIET_LOGGED",
+            "event_timestamp": NOW.isoformat(), "event_metadata": {"n": 2},
+        }
+
+    def test_oversized_metadata_is_dropped(self):
+        """Payloads stay under the NOTIFY size limit by leaving out the metadata."""
+        event = make_event(1, uuid.uuid4(), event_metadata={"notes": "x" * 10_000})
+        (payload,) = notified_payloads(ActivityStreamService(), uuid.uuid4(), [event])
+
+        assert len(payload) < stream.MAX_PAYLOAD_BYTES
+        assert json.loads(payload)["event_metadata"] is None
+
+    def test_publish_reaches_only_the_trainers_subscribers(self):
+        """Each trainer's open streams get their own clients' events and nobody else's."""
+        async def scenario():
+            service = ActivityStreamService()
+            trainer, other = uuid.uuid4(), uuid.uuid4()
+            mine, also_mine, theirs = service.subscribe(trainer), service.subscribe(trainer), service.subscribe(other)
+            for payload in notified_payloads(service, trainer, [make_event(7, uuid.uuid4())]):
+                service.publish(payload)
+            return mine, also_mine, theirs
+
+        mine, also_mine, theirs = asyncio.run(scenario())
+        assert mine.get_nowait().id == also_mine.get_nowait().id == 7
+        assert theirs.empty()
+
+    def test_full_queue_is_replaced_by_resync(self, monkeypatch):
+        """A consumer that falls behind is told to reconnect instead of blocking the listener."""
+        monkeypatch.setattr(stream, "SUBSCRIBER_QUEUE_SIZE", 2)
+
+        async def scenario():
+            service = ActivityStreamService()
+            trainer = uuid.uuid4()
+            queue = service.subscribe(trainer)
+            for payload in notified_payloads(service, trainer, [make_event(i, uuid.uuid4()) for i in range(3)]):
+                service.publish(payload)
+            return queue
+
+        queue = asyncio.run(scenario())
+        assert queue.get_nowait() is RESYNC
+        assert queue.empty()
+
+    def test_unsubscribe_and_malformed_payloads(self):
+        """Closed streams stop receiving, and junk on the channel is ignored."""
+        async def scenario():
+            service = ActivityStreamService()
+            trainer = uuid.uuid4()
+            queue = service.subscribe(trainer)
+            service.unsubscribe(trainer, queue)
+            service.publish("not json")
+            service.publish(json.dumps({"trainer_id": str(trainer)}))
+            for payload in notified_payloads(service, trainer, [make_event(1, uuid.uuid4())]):
+                service.publish(payload)
+            return service, queue
+
+        service, queue = asyncio.run(scenario())
+        assert queue.empty()
+        assert not service._subscribers
+
+    def test_format_sse(self):
+        """Frames carry the activity id so EventSource can resume from it."""
+        async def scenario():
+            service = ActivityStreamService()
+            trainer = uuid.uuid4()
+            queue = service.subscribe(trainer)
+            for payload in notified_payloads(service, trainer, [make_event(42, uuid.uuid4())]):
+                service.publish(payload)
+            return queue.get_nowait()
+
+        frame = format_sse(asyncio.run(scenario()))
+        assert frame.startswith("id: 42\nevent: activity\ndata: {")
+        assert frame.endswith("\n\n")
+        assert json.loads(frame.split("data: ", 1)[1])["eventType"] == "WORKOUT_LOGGED"
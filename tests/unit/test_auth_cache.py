@@ -0,0 +1,137 @@
+# tests/unit/test_auth_cache.py
+# Unit tests for the in-process tier of the auth cache.
+
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from jose import JWTError
+
+from app.cache import auth_cache
+from app.cache.auth_cache import LocalTTLCache, VerifiedTokenCache
+from app.api import deps
+from app.api.deps import _user_from_cache, _user_to_cache, verify_access_token
+from app.core import security
+
+
+class TestLocalTTLCache:
+    """Tests for LRU eviction and TTL expiry."""
+
+    def test_get_returns_stored_value(self):
+        cache = LocalTTLCache(max_entries=4, ttl=30)
+        cache.set("a@example.com", {"id": "1"})
+        assert cache.get("a@example.com") == {"id": "1"}
+
+    def test_missing_key_returns_none(self):
+        assert LocalTTLCache(max_entries=4, ttl=30).get("nobody@example.com") is None
+
+    def test_expired_entry_is_dropped(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(auth_cache.time, "monotonic", lambda: now[0])
+        cache = LocalTTLCache(max_entries=4, ttl=30)
+        cache.set("a@example.com", {"id": "1"})
+        now[0] += 30
+        assert cache.get("a@example.com") is None
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = LocalTTLCache(max_entries=2, ttl=30)
+        cache.set("a", {"id": "a"})
+        cache.set("b", {"id": "b"})
+        cache.get("a")
+        cache.set("c", {"id": "c"})
+        assert cache.get("b") is None
+        assert cache.get("a") == {"id": "a"}
+        assert cache.get("c") == {"id": "c"}
+
+    def test_pop_removes_entry(self):
+        cache = LocalTTLCache(max_entries=4, ttl=30)
+        cache.set("a", {"id": "a"})
+        cache.pop("a")
+        cache.pop("never-set")
+        assert cache.get("a") is None
+
+
+class TestCachedUserSnapshot:
+    """Tests for turning users into cache entries and back."""
+
+    def _user(self, client_profile=None):
+        return SimpleNamespace(
+            id=uuid.uuid4(),
+            email="client@example.com",
+            user_role="client",
+            full_name="Client Name",
+            profile_photo_url=None,
+            created_at=datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            client_profile=client_profile,
+        )
+
+    def test_round_trip_with_client_profile(self):
+        client = SimpleNamespace(id=uuid.uuid4(), client_status="active", trainer_user_id=uuid.uuid4())
+        source = self._user(client)
+        user = _user_from_cache(_user_to_cache(source))
+        assert user.id == source.id
+        assert user.full_name == "Client Name"
+        assert user.created_at == source.created_at
+        assert user.client_profile.id == client.id
+        assert user.client_profile.client_status == "active"
+        assert user.client_profile.trainer_user_id == client.trainer_user_id
+
+    def test_round_trip_without_client_profile(self):
+        user = _user_from_cache(_user_to_cache(self._user()))
+        assert user.client_profile is None
+
+
+class TestVerifiedTokenCache:
+    """Tests for the verified-token cache and revocation."""
+
+    @pytest.fixture(autouse=True)
+    def isolated(self, monkeypatch):
+        monkeypatch.setattr(auth_cache, "token_cache", VerifiedTokenCache(max_entries=4))
+        monkeypatch.setattr(auth_cache, "_revoked_before", {})
+
+    def test_entry_expires_with_the_token(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(auth_cache.time, "time", lambda: now[0])
+        cache = VerifiedTokenCache(max_entries=4)
+        cache.set("token", {"sub": "a@example.com", "exp": 1060})
+        assert cache.get("token") == {"sub": "a@example.com", "exp": 1060}
+        now[0] = 1060.0
+        assert cache.get("token") is None
+
+    def test_size_is_bounded(self):
+        cache = VerifiedTokenCache(max_entries=2)
+        for token in ("a", "b", "c"):
+            cache.set(token, {"exp": 4_000_000_000})
+        assert cache.get("a") is None
+        assert cache.get("c") is not None
+
+    def test_repeat_requests_skip_signature_check(self, monkeypatch):
+        token = security.create_access_token("a@example.com")
+        decode_calls = []
+        decode = security.decode_access_token
+        monkeypatch.setattr(deps.security, "decode_access_token", lambda t: decode_calls.append(t) or decode(t))
+
+        first, second = verify_access_token(token), verify_access_token(token)
+
+        assert first == second
+        assert first["sub"] == "a@example.com"
+        assert len(decode_calls) == 1
+
+    def test_revocation_is_checked_on_hit(self, monkeypatch):
+        token = security.create_access_token("a@example.com")
+        verify_access_token(token)
+
+        issued = auth_cache.time.time()
+        monkeypatch.setattr(auth_cache.time, "time", lambda: issued + 5)
+        auth_cache.revoke_tokens("a@example.com")
+
+        with pytest.raises(JWTError):
+            verify_access_token(token)
+        # Only this user's older tokens are affected.
+        assert verify_access_token(security.create_access_token("b@example.com"))["sub"] == "b@example.com"
+
+    def test_tokens_without_iat_are_revoked(self):
+        auth_cache.revoke_tokens("a@example.com")
+        assert auth_cache.tokens_revoked({"sub": "a@example.com", "exp": 4_000_000_000})
+        assert not auth_cache.tokens_revoked({"sub": "a@example.com", "iat": 4_000_000_000})
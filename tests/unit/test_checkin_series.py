@@ -0,0 +1,57 @@
+# tests/unit/test_checkin_series.py
+# Unit tests for the check-in rollup bucketing rules.
+
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from app.domain.checkin_series import bucket_day, bucket_start, checkin_metrics
+
+
+class TestBucketStart:
+    """Tests for mapping a day to its bucket."""
+
+    def test_day_week_and_month(self):
+        """Weeks start on the ISO Monday and months on the 1st."""
+        thursday = date(2026, 10, 15)
+        assert bucket_start(thursday, "day") == thursday
+        assert bucket_start(thursday, "week") == date(2026, 10, 12)
+        assert bucket_start(thursday, "month") == date(2026, 10, 1)
+
+    def test_week_can_start_in_previous_month(self):
+        """A week bucket keeps its Monday even across a month or year boundary."""
+        assert bucket_start(date(2027, 1, 1), "week") == date(2026, 12, 28)
+
+    def test_unknown_granularity(self):
+        """Only day, week and month buckets exist."""
+        with pytest.raises(ValueError):
+            bucket_start(date(2026, 1, 1), "hour")
+
+    def test_bucket_day_is_utc(self):
+        """Check-ins are bucketed by their UTC calendar day."""
+        ist = timezone(timedelta(hours=5, minutes=30))
+        assert bucket_day(datetime(2026, 3, 2, 1, 0, tzinfo=ist)) == date(2026, 3, 1)
+
+
+class TestCheckinMetrics:
+    """Tests for picking the charted values out of a check-in."""
+
+    def test_weight_and_numeric_measurements(self):
+        """Numeric measurement values become prefixed metrics; other values are skipped."""
+        metrics = checkin_metrics(Decimal("72.50"), {"waist_cm": 80, "hip_cm": 95.5, "notes": "tape", "flexed": True, "arm": {"cm": 30}})
+        assert metrics == {
+            "weight_kg": Decimal("72.50"),
+            "measurements.waist_cm": Decimal("80"),
+            "measurements.hip_cm": Decimal("95.5"),
+        }
+
+    def test_weight_is_rounded_like_the_stored_column(self):
+        """numeric(6,2) keeps two decimals, rounding half away from zero."""
+        assert checkin_metrics(Decimal("72.345"), None) == {"weight_kg": Decimal("72.35")}
+        assert checkin_metrics(Decimal("72.344"), None) == {"weight_kg": Decimal("72.34")}
+
+    def test_nothing_to_chart(self):
+        """Check-ins without weight or a measurements object add no samples."""
+        assert checkin_metrics(None, None) == {}
+        assert checkin_metrics(None, ["not", "an", "object"]) == {}
@@ -0,0 +1,94 @@
+# tests/unit/test_database.py
+# Unit tests for database configuration helpers.
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.pool import NullPool
+
+from app.core import database, metrics
+from app.core.config import settings
+
+
+class TestAsyncDatabaseUrl:
+    """Tests for deriving the asyncpg URL from DATABASE_URL."""
+
+    def test_driver_is_swapped_for_asyncpg(self, monkeypatch):
+        monkeypatch.setattr(settings, "DATABASE_URL", "postgresql://user:secret@db:5432/fitbud")
+        monkeypatch.setattr(settings, "ASYNC_DATABASE_URL", None)
+        assert database.get_async_database_url() == "postgresql+asyncpg://user:secret@db:5432/fitbud"
+
+    def test_explicit_driver_is_replaced(self, monkeypatch):
+        monkeypatch.setattr(settings, "DATABASE_URL", "postgresql+psycopg2://user:secret@db/fitbud")
+        monkeypatch.setattr(settings, "ASYNC_DATABASE_URL", None)
+        assert database.get_async_database_url() == "postgresql+asyncpg://user:secret@db/fitbud"
+
+    def test_explicit_async_url_wins(self, monkeypatch):
+        monkeypatch.setattr(settings, "ASYNC_DATABASE_URL", "postgresql+asyncpg://other/fitbud")
+        assert database.get_async_database_url() == "postgresql+asyncpg://other/fitbud"
+
+
+class TestEngineOptions:
+    """Tests for pool settings and the PgBouncer mode."""
+
+    def test_pool_settings_are_passed_through(self, monkeypatch):
+        """Size, overflow, timeout and recycle come from Settings; idle pre-ping is not SQLAlchemy's."""
+        monkeypatch.setattr(settings, "DB_PGBOUNCER_MODE", False)
+        monkeypatch.setattr(settings, "DB_POOL_SIZE", 7)
+        monkeypatch.setattr(settings, "DB_POOL_PRE_PING", "idle")
+        options = database.engine_options(is_async=False, label="primary")
+        assert options["pool_size"] == 7
+        assert options["pool_pre_ping"] is False
+        assert issubclass(options["poolclass"], database.TimedQueuePool)
+
+    def test_pgbouncer_mode_disables_pooling_and_prepared_statements(self, monkeypatch):
+        """NullPool for both engines, and asyncpg keeps no statement caches."""
+        monkeypatch.setattr(settings, "DB_PGBOUNCER_MODE", True)
+        sync_options = database.engine_options(is_async=False, label="primary")
+        async_options = database.engine_options(is_async=True, label="primary-async")
+        assert set(sync_options) == {"poolclass"}
+        assert issubclass(sync_options["poolclass"], NullPool)
+        assert async_options["connect_args"]["statement_cache_size"] == 0
+        assert async_options["connect_args"]["prepared_statement_cache_size"] == 0
+
+    def test_label_survives_dispose(self):
+        """Pools rebuilt by dispose() keep reporting under the same label."""
+        engine = create_engine("sqlite://", poolclass=database.labelled_pool(database.TimedQueuePool, "replica-test"))
+        engine.dispose()
+        assert engine.pool.metrics_label == "replica-test"
+
+
+class TestPoolInstrumentation:
+    """Tests for pool gauges and the idle pre-ping."""
+
+    def _engine(self, label: str):
+        engine = create_engine("sqlite://", poolclass=database.labelled_pool(database.TimedQueuePool, label), pool_size=1)
+        connects = []
+        event.listen(engine, "connect", lambda dbapi_connection, record: connects.append(dbapi_connection))
+        return engine, connects
+
+    def test_checked_out_gauge(self):
+        """The gauge follows checkouts and checkins."""
+        engine, _ = self._engine("gauge-test")
+        database.instrument_pool(engine, "gauge-test")
+        with engine.connect():
+            assert metrics.registry.get_sample_value("db_pool_checked_out", {"pool": "gauge-test"}) == 1
+        assert metrics.registry.get_sample_value("db_pool_checked_out", {"pool": "gauge-test"}) == 0
+        assert metrics.registry.get_sample_value("db_pool_wait_seconds_count", {"pool": "gauge-test"}) == 1
+
+    def test_idle_connection_failing_ping_is_replaced(self, monkeypatch):
+        """Only connections idle past the threshold are pinged; a dead one is swapped for a new one."""
+        engine, connects = self._engine("ping-test")
+        database.install_idle_pre_ping(engine, idle_seconds=0)
+        pings = []
+
+        def dead(dbapi_connection):
+            pings.append(dbapi_connection)
+            raise RuntimeError("server closed the connection")
+
+        with engine.connect():
+            pass
+        monkeypatch.setattr(engine.dialect, "do_ping", dead)
+        with engine.connect() as conn:
+            assert conn.execute(text("SELECT 1")).scalar() == 1
+
+        assert len(pings) == 1
+        assert len(connects) == 2
@@ -0,0 +1,69 @@
+# tests/unit/test_etag.py
+# Unit tests for ETag computation and the conditional GET dependency.
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.deps import conditional_get
+from app.core.etag import compute_etag, etag_matches
+
+
+class TestEtagHelpers:
+    """Tests for computing and matching ETags."""
+
+    def test_etag_is_quoted_and_stable(self):
+        etag = compute_etag("/things", "", (3, "2026-01-01"))
+        assert etag.startswith('"') and etag.endswith('"')
+        assert etag == compute_etag("/things", "", (3, "2026-01-01"))
+
+    def test_etag_changes_with_fingerprint(self):
+        assert compute_etag("/things", "", (3,)) != compute_etag("/things", "", (4,))
+
+    def test_if_none_match_list_and_weak_prefix(self):
+        etag = compute_etag("/things")
+        assert etag_matches(f'"other", W/{etag}', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches('"other"', etag)
+        assert not etag_matches(None, etag)
+
+
+class TestConditionalGet:
+    """Tests for the reusable If-None-Match dependency."""
+
+    def _app(self, state: dict) -> TestClient:
+        app = FastAPI()
+
+        def version():
+            return state["version"]
+
+        @app.get("/things", dependencies=[conditional_get(version)])
+        def list_things():
+            state["calls"] += 1
+            return [1, 2, 3]
+
+        return TestClient(app)
+
+    def test_matching_etag_returns_304_without_running_endpoint(self):
+        state = {"version": 1, "calls": 0}
+        client = self._app(state)
+
+        first = client.get("/things")
+        second = client.get("/things", headers={"If-None-Match": first.headers["ETag"]})
+
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["ETag"] == first.headers["ETag"]
+        assert state["calls"] == 1
+
+    def test_changed_fingerprint_returns_fresh_body(self):
+        state = {"version": 1, "calls": 0}
+        client = self._app(state)
+
+        etag = client.get("/things").headers["ETag"]
+        state["version"] = 2
+        response = client.get("/things", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.json() == [1, 2, 3]
+        assert response.headers["ETag"] != etag
@@ -0,0 +1,86 @@
+# tests/unit/test_metrics.py
+# Unit tests for the request metrics middleware and SQL collector.
+
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.core import metrics
+from app.core.database import instrument_engine
+from app.core.metrics import MetricsMiddleware, RequestDBStats
+
+
+def _sample(name: str, labels: dict) -> float:
+    return metrics.registry.get_sample_value(name, labels) or 0.0
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    router = APIRouter()
+
+    @router.get("/widgets/{widget_id}")
+    def get_widget(widget_id: int):
+        metrics.record_query(0.25)
+        metrics.record_query(0.5)
+        metrics.record_pool_wait(0.125)
+        return {"id": widget_id}
+
+    app.include_router(router, prefix="/api/test-metrics")
+    app.add_middleware(MetricsMiddleware)
+    return app
+
+
+class TestMetricsMiddleware:
+    """Tests for per-request SQL statistics labelled by route template."""
+
+    def test_queries_are_attributed_to_route_template(self):
+        """SQL stats recorded while handling a request should land under its route template."""
+        route = {"route": "/api/test-metrics/widgets/{widget_id}"}
+        before_count = _sample("http_request_db_queries_count", route)
+        before_queries = _sample("http_request_db_queries_sum", route)
+        before_seconds = _sample("http_request_db_seconds_sum", route)
+
+        client = TestClient(_app())
+        assert client.get("/api/test-metrics/widgets/1").status_code == 200
+        assert client.get("/api/test-metrics/widgets/2").status_code == 200
+
+        assert _sample("http_request_db_queries_count", route) - before_count == 2
+        assert _sample("http_request_db_queries_sum", route) - before_queries == 4
+        assert _sample("http_request_db_seconds_sum", route) - before_seconds == 1.5
+        assert _sample("http_request_db_pool_wait_seconds_sum", route) >= 0.25
+        assert _sample("http_request_duration_seconds_count", {**route, "method": "GET", "status": "200"}) >= 2
+
+    def test_unknown_path_is_unmatched(self):
+        """Requests that match no route should share a single label."""
+        labels = {"route": "unmatched", "method": "GET", "status": "404"}
+        before = _sample("http_request_duration_seconds_count", labels)
+        assert TestClient(_app()).get("/api/test-metrics/nothing-here").status_code == 404
+        assert _sample("http_request_duration_seconds_count", labels) - before == 1
+
+
+
+class TestEngineInstrumentation:
+    """Tests for the cursor execution hooks."""
+
+    def test_statements_are_counted_for_the_current_request(self):
+        """Each executed statement should add to the active request's stats."""
+        engine = create_engine("sqlite://")
+        instrument_engine(engine)
+        stats = RequestDBStats()
+        token = metrics._request_stats.set(stats)
+        try:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                conn.execute(text("SELECT 2"))
+        finally:
+            metrics._request_stats.reset(token)
+        assert stats.queries == 2
+        assert stats.db_seconds > 0
+
+    def test_statements_outside_a_request_are_ignored(self):
+        """Background work without a request context should not fail or be recorded."""
+        engine = create_engine("sqlite://")
+        instrument_engine(engine)
+        with engine.connect() as conn:
+            assert conn.execute(text("SELECT 1")).scalar() == 1
+        assert metrics._request_stats.get() is None
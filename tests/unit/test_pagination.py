@@ -0,0 +1,58 @@
+# tests/unit/test_pagination.py
+# Unit tests for opaque keyset cursors.
+
+import pytest
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+from app.core.pagination import encode_cursor, decode_cursor, build_page, encode_rank_cursor, decode_rank_cursor
+from app.domain.errors import InvalidCursor
+
+
+class TestCursorEncoding:
+    """Tests for cursor round-trips."""
+
+    def test_round_trip(self):
+        ts = datetime(2026, 3, 18, 7, 30, 12, 123456, tzinfo=timezone.utc)
+        assert decode_cursor(encode_cursor(ts, 42)) == (ts, 42)
+
+    def test_cursor_is_url_safe(self):
+        cursor = encode_cursor(datetime(2026, 1, 1, tzinfo=timezone.utc), 10**12)
+        assert all(c.isalnum() or c in "-_" for c in cursor)
+
+    @pytest.mark.parametrize("cursor", ["", "not-a-cursor", "W10", "WyJ4IiwgMV0"])
+    def test_garbage_raises_invalid_cursor(self, cursor):
+        with pytest.raises(InvalidCursor):
+            decode_cursor(cursor)
+
+
+class TestBuildPage:
+    """Tests for trimming the look-ahead row."""
+
+    def _rows(self, n):
+        ts = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        return [SimpleNamespace(id=i, logged_at=ts) for i in range(n, 0, -1)]
+
+    def test_full_page_has_next_cursor(self):
+        page = build_page(self._rows(3), sort_attr="logged_at", limit=2)
+        assert [r.id for r in page["items"]] == [3, 2]
+        assert decode_cursor(page["next_cursor"])[1] == 2
+
+    def test_last_page_has_no_cursor(self):
+        page = build_page(self._rows(2), sort_attr="logged_at", limit=2)
+        assert len(page["items"]) == 2
+        assert page["next_cursor"] is None
+
+
+class TestRankCursorEncoding:
+    """Tests for search-result cursors."""
+
+    def test_round_trip_keeps_exact_rank(self):
+        row_id = uuid.uuid4()
+        assert decode_rank_cursor(encode_rank_cursor(Decimal("0.428571"), "Oats", row_id)) == (Decimal("0.428571"), "Oats", row_id)
+
+    def test_garbage_raises_invalid_cursor(self):
+        with pytest.raises(InvalidCursor):
+            decode_rank_cursor(encode_cursor(datetime(2026, 1, 1, tzinfo=timezone.utc), 1))
@@ -0,0 +1,42 @@
+# tests/unit/test_password_pool.py
+# Unit tests for the bounded bcrypt process pool.
+
+import pytest
+
+from app.core.metrics import PASSWORD_POOL_REJECTED
+from app.core.password_pool import PasswordPool, PasswordPoolFull
+from app.core.security import get_password_hash, verify_password
+
+
+class TestPasswordPool:
+    """Tests for admission control and the process round trip."""
+
+    def test_hash_and_verify_in_worker_process(self):
+        """Hashes made in the pool verify inline and the other way round."""
+        pool = PasswordPool(workers=1, max_queue=0)
+        try:
+            hashed = pool.hash("correct horse")
+            assert verify_password("correct horse", hashed)
+            assert pool.verify("correct horse", get_password_hash("correct horse"))
+            assert not pool.verify("wrong", hashed)
+        finally:
+            pool.shutdown()
+
+    def test_inline_when_disabled(self):
+        """With no workers the pool hashes in the calling thread and never starts processes."""
+        pool = PasswordPool(workers=0, max_queue=0)
+        assert pool.verify("secret", pool.hash("secret"))
+        assert pool._executor is None
+
+    def test_full_pool_rejects_immediately(self):
+        """Beyond workers + max_queue calls in flight, new calls fail fast and are counted."""
+        pool = PasswordPool(workers=1, max_queue=1)
+        pool._in_flight = 2
+        before = PASSWORD_POOL_REJECTED.labels("verify")._value.get()
+
+        with pytest.raises(PasswordPoolFull):
+            pool.verify("secret", "$2b$12$" + "x" * 53)
+
+        assert PASSWORD_POOL_REJECTED.labels("verify")._value.get() == before + 1
+        assert pool._in_flight == 2
+        assert pool._executor is None
@@ -0,0 +1,146 @@
+# tests/unit/test_replicas.py
+# Unit tests for read replica selection and the replica-routing session.
+
+import uuid
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, exc, func, insert, select
+
+from app.api import deps
+from app.core.database import RoutingSession, pin_primary
+from app.core.replicas import Replica, ReplicaSet
+from app.core.security import create_access_token
+from app.models.client import Client
+from app.models.user import User
+
+metadata = MetaData()
+rows = Table("rows", metadata, Column("id", Integer, primary_key=True))
+
+
+def make_engine(*ids: int):
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        for row_id in ids:
+            conn.execute(insert(rows).values(id=row_id))
+    return engine
+
+
+@pytest.fixture
+def engines():
+    """A primary holding row 1 and a replica that has not caught up with it."""
+    return make_engine(1), make_engine()
+
+
+def read_ids(db) -> list:
+    return db.scalars(select(rows.c.id).order_by(rows.c.id)).all()
+
+
+class TestRoutingSession:
+    """Tests for sending reads to the replica until the session writes."""
+
+    def test_reads_go_to_the_replica(self, engines):
+        primary, replica = engines
+        with RoutingSession(bind=primary, replica_bind=replica) as db:
+            assert read_ids(db) == []
+
+    def test_write_pins_to_primary(self, engines):
+        """Reads after a write see it, so the session stays on the primary."""
+        primary, replica = engines
+        with RoutingSession(bind=primary, replica_bind=replica) as db:
+            db.execute(insert(rows).values(id=2))
+            assert read_ids(db) == [1, 2]
+            db.commit()
+            assert read_ids(db) == [1, 2]
+
+    def test_locking_reads_and_explicit_pins_use_primary(self, engines):
+        primary, replica = engines
+        with RoutingSession(bind=primary, replica_bind=replica) as db:
+            assert db.scalars(select(rows.c.id).with_for_update()).all() == [1]
+            assert db.replica_bind is None
+        with RoutingSession(bind=primary, replica_bind=replica) as db:
+            pin_primary(db)
+            assert read_ids(db) == [1]
+
+    def test_read_primary_option_does_not_pin(self, engines):
+        """A single read_primary SELECT leaves the session's other reads on the replica."""
+        primary, replica = engines
+        with RoutingSession(bind=primary, replica_bind=replica) as db:
+            assert db.scalars(select(rows.c.id).execution_options(read_primary=True)).all() == [1]
+            assert read_ids(db) == []
+
+    def test_authenticated_get_keeps_reading_from_replica(self, engines, monkeypatch):
+        """An auth cache miss loads the user from the primary; the handler's queries still use the replica."""
+        primary, replica = engines
+        for engine in engines:
+            User.__table__.create(engine)
+            Client.__table__.create(engine)
+        with primary.begin() as conn:
+            conn.execute(insert(User).values(
+                id=uuid.uuid4(), email="trainer@example.com", hashed_password="x", full_name="Trainer", user_role="trainer",
+            ))
+        monkeypatch.setattr(deps, "get_cached_user", lambda email: None)
+        monkeypatch.setattr(deps, "set_cached_user", lambda email, user: None)
+
+        with RoutingSession(bind=primary, replica_bind=replica) as db:
+            user = deps.get_current_user(db=db, token=create_access_token("trainer@example.com"))
+
+            assert user.email == "trainer@example.com"
+            assert db.replica_bind is replica
+            assert db.scalar(select(func.count()).select_from(User)) == 0
+
+    def test_without_replica_everything_uses_primary(self, engines):
+        primary, _ = engines
+        with RoutingSession(bind=primary) as db:
+            assert read_ids(db) == [1]
+
+
+class TestReplicaSet:
+    """Tests for round-robin selection and health checks."""
+
+    def make_set(self, count: int, max_lag_seconds: float = 5) -> ReplicaSet:
+        return ReplicaSet(
+            [Replica(f"replica-{i}", create_engine("sqlite://")) for i in range(count)],
+            max_lag_seconds=max_lag_seconds,
+        )
+
+    def test_round_robin_over_healthy_replicas(self):
+        replica_set = self.make_set(3)
+        for replica in replica_set.replicas:
+            replica.healthy = True
+        replica_set.replicas[1].healthy = False
+
+        picked = [replica_set.pick().name for _ in range(4)]
+        assert sorted(picked) == ["replica-0", "replica-0", "replica-2", "replica-2"]
+        assert picked[0] != picked[1]
+
+    def test_no_healthy_replica_reads_from_primary(self):
+        """Replicas start out of rotation until their first check passes."""
+        assert self.make_set(2).pick() is None
+
+    def test_check_skips_lagging_and_unreachable_replicas(self, monkeypatch):
+        replica_set = self.make_set(3, max_lag_seconds=5)
+        lags = {"replica-0": 0.5, "replica-1": 30.0}
+
+        def measure_lag(replica):
+            if replica.name not in lags:
+                raise exc.OperationalError("SELECT 1", {}, Exception("connection refused"))
+            return lags[replica.name]
+
+        monkeypatch.setattr(replica_set, "measure_lag", measure_lag)
+        replica_set.check()
+        assert [replica.healthy for replica in replica_set.replicas] == [True, False, False]
+
+        lags["replica-1"] = 1.0
+        replica_set.check()
+        assert [replica.healthy for replica in replica_set.replicas] == [True, True, False]
+
+    def test_connection_failure_takes_replica_out(self, tmp_path):
+        """A request that cannot reach a replica takes it out before the next health check."""
+        replica = Replica("replica-0", create_engine(f"sqlite:///{tmp_path}/missing/db.sqlite"))
+        replica_set = ReplicaSet([replica], max_lag_seconds=5)
+        replica.healthy = True
+
+        with pytest.raises(exc.OperationalError):
+            replica.engine.connect()
+        assert replica_set.pick() is None
@@ -0,0 +1,143 @@
+# tests/unit/test_responses.py
+# Unit tests for the orjson fast path: output must match FastAPI's default serialization.
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+from pydantic import BaseModel, TypeAdapter, field_validator
+
+from app.core.config import settings
+from app.core.responses import FastJSONResponse, FastSerializer, dumps
+from app.schemas.checkin import Checkin
+from app.schemas.client import Client
+from app.schemas.core import CursorPage
+from app.schemas.log import WorkoutLog
+from app.schemas.template import DietPlanTemplate, WorkoutPlanTemplate
+
+NOW = datetime(2026, 3, 4, 5, 6, 7, 890, tzinfo=timezone.utc)
+
+
+def default_json(model, data) -> bytes:
+    """What FastAPI writes for `data` through response_model=`model`."""
+    adapter = TypeAdapter(List[model] if isinstance(data, list) else model)
+    return adapter.dump_json(adapter.validate_python(data, from_attributes=True), by_alias=True)
+
+
+def make_client(client_user=None, **overrides):
+    values = dict(
+        id=uuid.uuid4(), client_status="active", goal="Muscle Gain", goal_description=None,
+        trainer_user_id=uuid.uuid4(), created_at=NOW, client_user=client_user,
+        invited_full_name="Invited Name", invited_email="invited@example.com", invite_code="12345678",
+        subscription_due_date=NOW - timedelta(days=3), subscription_paid_status=False,
+        payment_status=None, private_notes=None, health_notes="Knee injury",
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def make_food_item():
+    return SimpleNamespace(
+        id=uuid.uuid4(), name="Oats", base_unit_type="MASS", grams_per_ml=None, calories_per_100g=389,
+        protein_per_100g=Decimal("16.9"), carbs_per_100g=Decimal("66.3"), fat_per_100g=Decimal("6.9"),
+        is_verified=True, owner_trainer_id=None,
+    )
+
+
+class TestFastSerializer:
+    """Tests for byte-for-byte parity with the response_model path."""
+
+    def test_client_list_with_computed_fields(self):
+        """Computed fields and the nested user come out exactly as through the Client model."""
+        user = SimpleNamespace(
+            id=uuid.uuid4(), email="client@example.com", full_name="Client Name", user_role="client",
+            profile_photo_url="https://cdn.example.com/p.png", created_at=NOW,
+            client_profile=SimpleNamespace(id=uuid.uuid4()),
+        )
+        clients = [make_client(user), make_client(None, subscription_paid_status=True)]
+        assert dumps(FastSerializer(Client).dump(clients)) == default_json(Client, clients)
+
+    def test_computed_fields_only_see_model_fields(self):
+        """Like the pydantic model, User.client_profile_id cannot see the ORM relationship."""
+        user = SimpleNamespace(
+            id=uuid.uuid4(), email="client@example.com", full_name="Client Name", user_role="client",
+            profile_photo_url=None, created_at=NOW, client_profile=SimpleNamespace(id=uuid.uuid4()),
+        )
+        dumped = FastSerializer(Client).dump(make_client(user))
+        assert dumped["clientUser"]["clientProfileId"] is None
+
+    def test_templates_with_nested_items(self):
+        """Excluded fields, validation aliases and model-valued computed fields match."""
+        exercise = SimpleNamespace(id=uuid.uuid4(), name="Squat", description=None, is_verified=True, owner_trainer_id=None)
+        workout = SimpleNamespace(
+            id=uuid.uuid4(), name="Strength", description=None, trainer_id=uuid.uuid4(), version=2, created_at=NOW,
+            items=[SimpleNamespace(
+                id=7, day_name="Monday", display_order=1, exercise=exercise,
+                target_sets="4", target_reps=None, rest_period_seconds=90, notes="Slow eccentric",
+            )],
+        )
+        food = make_food_item()
+        diet = SimpleNamespace(
+            id=uuid.uuid4(), name="Cut", description="Lean", trainer_id=uuid.uuid4(), version=1, created_at=NOW,
+            items=[
+                SimpleNamespace(id=1, meal_name="Breakfast", display_order=1, food_item=food, serving_size=Decimal("50"),
+                                serving_unit="g", calories=None, protein_g=None, carbs_g=None, fat_g=None),
+                SimpleNamespace(id=2, meal_name="Lunch", display_order=None, food_item=food, serving_size=Decimal("1.5"),
+                                serving_unit="cup", calories=Decimal("100.5"), protein_g=1, carbs_g=None, fat_g=Decimal("2")),
+            ],
+            nutrition_totals={
+                "meals": [{"meal_name": "Breakfast", "calories": 194, "protein_g": 8.45, "carbs_g": 33.15, "fat_g": 3.45}],
+                "total": {"calories": 194, "protein_g": 8.45, "carbs_g": 33.15, "fat_g": 3.45},
+            },
+        )
+        assert dumps(FastSerializer(WorkoutPlanTemplate).dump([workout])) == default_json(WorkoutPlanTemplate, [workout])
+        assert dumps(FastSerializer(DietPlanTemplate).dump(diet)) == default_json(DietPlanTemplate, diet)
+
+    def test_logs_checkins_and_pages(self):
+        """JSON payloads, Decimals, non-UTC offsets and service page dicts match."""
+        ist = timezone(timedelta(hours=5, minutes=30))
+        logs = [
+            SimpleNamespace(id=i, client_id=uuid.uuid4(), assigned_plan_id=uuid.uuid4(),
+                            performance_data={"sets": [{"reps": 10, "kg": 52.5}], "notes": "é"}, logged_at=NOW.astimezone(ist))
+            for i in range(3)
+        ]
+        checkins = [SimpleNamespace(
+            id=1, client_id=uuid.uuid4(), weight_kg=Decimal("72.50"), measurements={"waist_cm": 80},
+            progress_photo_url=None, subjective_scores=None, notes=None, checked_in_at=NOW,
+        )]
+        page = {"items": logs, "next_cursor": "abc"}
+        assert dumps(FastSerializer(WorkoutLog).dump(logs)) == default_json(WorkoutLog, logs)
+        assert dumps(FastSerializer(Checkin).dump(checkins)) == default_json(Checkin, checkins)
+        assert dumps(FastSerializer(CursorPage[WorkoutLog]).dump(page)) == default_json(CursorPage[WorkoutLog], page)
+
+    def test_utc_is_written_as_z(self):
+        """Any zero UTC offset serializes as Z, like pydantic."""
+        assert dumps(datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(0)))) == b'"2026-01-02T03:04:05Z"'
+
+    def test_models_with_validators_are_rejected(self):
+        """Models whose validators could change the output cannot use the fast path."""
+        class Normalized(BaseModel):
+            name: str
+
+            @field_validator("name")
+            @classmethod
+            def strip(cls, value):
+                return value.strip()
+
+        with pytest.raises(TypeError):
+            FastSerializer(Normalized)
+
+    def test_response_falls_back_when_disabled(self, monkeypatch):
+        """With the setting off the data is returned for the regular response_model path."""
+        logs = [SimpleNamespace(id=1, client_id=uuid.uuid4(), assigned_plan_id=uuid.uuid4(), performance_data=None, logged_at=NOW)]
+        monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", False)
+        assert FastSerializer(WorkoutLog).response(logs) is logs
+
+        monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", True)
+        response = FastSerializer(WorkoutLog).response(logs, headers={"ETag": '"abc"'})
+        assert isinstance(response, FastJSONResponse)
+        assert response.body == default_json(WorkoutLog, logs)
+        assert response.headers["etag"] == '"abc"'
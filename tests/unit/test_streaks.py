@@ -0,0 +1,75 @@
+# tests/unit/test_streaks.py
+# Unit tests for the pure streak arithmetic.
+
+from datetime import date, datetime, timedelta, timezone
+
+from app.domain.streaks import (
+    EMPTY_STREAK,
+    StreakState,
+    activity_day,
+    advance_streak,
+    compute_streak,
+    streak_as_of,
+)
+
+
+TODAY = date(2026, 3, 18)
+
+
+class TestAdvanceStreak:
+    """Tests for folding a day of activity into a streak."""
+
+    def test_first_activity_starts_streak(self):
+        """The first activity starts a streak of one day."""
+        assert advance_streak(EMPTY_STREAK, TODAY) == StreakState(1, 1, TODAY)
+
+    def test_consecutive_day_extends_streak(self):
+        """Activity on the day after the last active day extends the streak."""
+        state = StreakState(3, 5, TODAY - timedelta(days=1))
+        assert advance_streak(state, TODAY) == StreakState(4, 5, TODAY)
+
+    def test_same_day_is_idempotent(self):
+        """Several logs on the same day count once."""
+        state = StreakState(2, 2, TODAY)
+        assert advance_streak(state, TODAY) == state
+
+    def test_gap_resets_streak_but_keeps_longest(self):
+        """A missed day resets the current streak; the longest streak is kept."""
+        state = StreakState(7, 7, TODAY - timedelta(days=3))
+        assert advance_streak(state, TODAY) == StreakState(1, 7, TODAY)
+
+    def test_older_activity_is_ignored(self):
+        """Activity dated before the last active day does not rewind the state."""
+        state = StreakState(2, 4, TODAY)
+        assert advance_streak(state, TODAY - timedelta(days=10)) == state
+
+
+class TestComputeStreak:
+    """Tests for recomputing a streak from history."""
+
+    def test_no_history(self):
+        assert compute_streak([]) == EMPTY_STREAK
+
+    def test_longest_and_current_runs(self):
+        """Unordered, duplicated dates produce the same result as a sorted fold."""
+        days = [TODAY - timedelta(days=d) for d in (0, 1, 1, 5, 6, 7, 8, 2)]
+        assert compute_streak(days) == StreakState(3, 4, TODAY)
+
+
+class TestStreakAsOf:
+    """Tests for the dashboard view of a streak."""
+
+    def test_active_today(self):
+        assert streak_as_of(StreakState(4, 9, TODAY), TODAY) == 4
+
+    def test_not_active_today(self):
+        """The dashboard streak is zero until the client logs something today."""
+        assert streak_as_of(StreakState(4, 9, TODAY - timedelta(days=1)), TODAY) == 0
+
+
+class TestActivityDay:
+    """Tests for the day a log counts towards."""
+
+    def test_uses_the_utc_date(self):
+        late_evening_in_new_york = datetime(2026, 3, 18, 22, 30, tzinfo=timezone(timedelta(hours=-4)))
+        assert activity_day(late_evening_in_new_york) == date(2026, 3, 19)
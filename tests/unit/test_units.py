@@ -0,0 +1,56 @@
+# tests/unit/test_units.py
+# Unit tests for nutrition arithmetic.
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.units import UNIT_DICTIONARY, calculate_nutrition, calculate_nutrition_many, summarize_nutrition
+
+
+class TestSummarizeNutrition:
+    """Tests for per-meal and per-plan totals."""
+
+    def test_meals_in_first_seen_order_with_totals(self):
+        summary = summarize_nutrition([
+            ("Lunch", {"calories": 100, "protein_g": 10, "carbs_g": 5, "fat_g": 1}),
+            ("Breakfast", {"calories": 50, "protein_g": 2, "carbs_g": 8, "fat_g": 0.5}),
+            ("Lunch", {"calories": 25, "protein_g": 1, "carbs_g": 0, "fat_g": 2}),
+        ])
+
+        assert [meal["meal_name"] for meal in summary["meals"]] == ["Lunch", "Breakfast"]
+        assert summary["meals"][0]["calories"] == 125
+        assert summary["total"] == pytest.approx({"calories": 175, "protein_g": 13, "carbs_g": 13, "fat_g": 3.5})
+
+    def test_empty_plan_has_zero_totals(self):
+        assert summarize_nutrition([]) == {"meals": [], "total": {"calories": 0.0, "protein_g": 0.0, "carbs_g": 0.0, "fat_g": 0.0}}
+
+
+class TestCalculateNutritionMany:
+    """Tests for the vectorized calculator against the scalar one."""
+
+    def _food(self, base_unit_type="MASS", grams_per_ml=None, calories=250, protein=12.5, carbs=None, fat=3.0):
+        return SimpleNamespace(
+            base_unit_type=base_unit_type,
+            grams_per_ml=grams_per_ml,
+            calories_per_100g=calories,
+            protein_per_100g=protein,
+            carbs_per_100g=carbs,
+            fat_per_100g=fat,
+        )
+
+    def test_matches_scalar_for_every_unit(self):
+        foods = [self._food(), self._food("VOLUME", 1.03), self._food("VOLUME", None), self._food(calories=None)]
+        cases = [(food, size, unit) for food in foods for size in (0, 1.5, 250) for unit in [*UNIT_DICTIONARY, "G", None, "bucket"]]
+
+        batch = calculate_nutrition_many(*zip(*cases))
+
+        for (food, size, unit), nutrition in zip(cases, batch):
+            assert nutrition == pytest.approx(calculate_nutrition(food, size, unit))
+
+    def test_volume_unit_for_mass_food_is_zero(self):
+        [nutrition] = calculate_nutrition_many([self._food()], [2], ["cup"])
+        assert nutrition == {"calories": 0.0, "protein_g": 0.0, "carbs_g": 0.0, "fat_g": 0.0}
+
+    def test_empty_input(self):
+        assert calculate_nutrition_many([], [], []) == []